@@ -0,0 +1,55 @@
+# benchmarks/bench_cold_start.py
+"""
+Tracks cold-start import cost. Each module is imported in a fresh
+interpreter under -X importtime, best of N runs; the heaviest top-level
+packages are listed so regressions (e.g. ReportLab creeping back into
+startup) are visible.
+
+    python benchmarks/bench_cold_start.py [--runs 5] [--top 8]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ["main", "notes_widget", "todo_widget", "calculator_widget", "cv_generator_widget"]
+HEAVY = ("reportlab", "PIL")
+
+
+def profile_import(module):
+    """Returns (wall ms, {top-level package: total self-time us}) for one fresh import."""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO, capture_output=True, text=True, check=True
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    packages = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        top = name.strip().split(".")[0]
+        packages[top] = packages.get(top, 0) + int(self_us)
+    return wall_ms, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    for module in MODULES:
+        runs = [profile_import(module) for _ in range(args.runs)]
+        wall_ms, packages = min(runs, key=lambda run: run[0])
+        heavy = [name for name in HEAVY if name in packages]
+        print(f"import {module:<20} {wall_ms:8.1f} ms   heavy deps loaded: {', '.join(heavy) or 'none'}")
+        for name, micros in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"    {name:<24} {micros / 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
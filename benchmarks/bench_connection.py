@@ -0,0 +1,81 @@
+# benchmarks/bench_connection.py
+"""
+Compares the old open/execute/close-per-call pattern against the shared
+pooled connection in database_connection.py.
+
+    python benchmarks/bench_connection.py [--rows 20000] [--calls 2000]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+
+
+def per_call_read(db_path, task_id):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("SELECT * FROM tasks WHERE id=?", (task_id,))
+    row = cursor.fetchone()
+    conn.close()
+    return row
+
+
+def per_call_write(db_path, task_id, done):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("UPDATE tasks SET done=? WHERE id=?", (done, task_id))
+    conn.commit()
+    conn.close()
+
+
+def pooled_read(task_id):
+    return database_connection.get_connection().execute("SELECT * FROM tasks WHERE id=?", (task_id,)).fetchone()
+
+
+def timed(label, func, calls):
+    start = time.perf_counter()
+    for i in range(calls):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms total  {elapsed / calls * 1e6:8.1f} us/call")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        database_connection.DB_NAME = db_path
+        database_init.initialize_all_databases()
+        with database_connection.transaction() as cursor:
+            cursor.executemany(
+                "INSERT INTO tasks (title, description) VALUES (?, ?)",
+                ((f"Task {i}", "x" * 200) for i in range(args.rows))
+            )
+
+        ids = [1 + (i * 7919) % args.rows for i in range(args.calls)]
+        old_read = timed("per-call connect (read)", lambda i: per_call_read(db_path, ids[i]), args.calls)
+        new_read = timed("pooled connection (read)", lambda i: pooled_read(ids[i]), args.calls)
+        old_write = timed("per-call connect (write)", lambda i: per_call_write(db_path, ids[i], i % 2), args.calls)
+        new_write = timed("pooled connection (write)",
+                          lambda i: todo_database_funcs.update_task_status(ids[i], i % 2), args.calls)
+
+        print(f"\nread speedup:  {old_read / new_read:5.1f}x")
+        print(f"write speedup: {old_write / new_write:5.1f}x")
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
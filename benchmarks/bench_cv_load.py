@@ -0,0 +1,84 @@
+# benchmarks/bench_cv_load.py
+"""
+Loads CV profiles the old way (three queries, child tables scanned because
+profile_id had no index) and with cv_database_funcs.load_profile (one
+query, JSON-aggregated entries read through the profile_id indexes).
+
+    python benchmarks/bench_cv_load.py [--profiles 2000] [--entries 20] [--loads 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+from cv_database_funcs import load_profile
+
+
+def old_load(profile_id):
+    cursor = database_connection.get_connection().cursor()
+    cursor.execute("SELECT name, contact_number, email, location, objective, skills, photo_path FROM profile WHERE id=?", (profile_id,))
+    profile = cursor.fetchone()
+    cursor.execute("SELECT title, description, duration FROM work_experience WHERE profile_id=?", (profile_id,))
+    experiences = cursor.fetchall()
+    cursor.execute("SELECT course_name, year_completion, grade, institution_name FROM education WHERE profile_id=?", (profile_id,))
+    educations = cursor.fetchall()
+    cursor.close()
+    return profile, experiences, educations
+
+
+def timed(label, load, ids):
+    start = time.perf_counter()
+    for profile_id in ids:
+        load(profile_id)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed / len(ids) * 1000:8.3f} ms/profile")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", type=int, default=2000)
+    parser.add_argument("--entries", type=int, default=20, help="experience and education entries per profile")
+    parser.add_argument("--loads", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+        database_init.initialize_all_databases()
+        with database_connection.transaction() as cursor:
+            cursor.executemany(
+                "INSERT INTO profile (profile_name, name, skills) VALUES (?, ?, ?)",
+                ((f"Profile {i}", f"Person {i}", "Python, SQL") for i in range(args.profiles))
+            )
+            # Interleaved across profiles, like entries saved over time
+            cursor.executemany(
+                "INSERT INTO work_experience (profile_id, title, description, duration) VALUES (?, ?, ?, ?)",
+                ((1 + i % args.profiles, f"Job {i}", "Did things\n" * 3, "2020 - 2021")
+                 for i in range(args.profiles * args.entries))
+            )
+            cursor.executemany(
+                "INSERT INTO education (profile_id, course_name, year_completion, grade, institution_name) VALUES (?, ?, ?, ?, ?)",
+                ((1 + i % args.profiles, f"Course {i}", "2019", "9.0", "University")
+                 for i in range(args.profiles * args.entries))
+            )
+
+        ids = [1 + (i * 7919) % args.profiles for i in range(args.loads)]
+        print(f"{args.profiles} profiles x {args.entries} entries per section\n")
+        conn = database_connection.get_connection()
+        conn.execute("DROP INDEX idx_work_experience_profile")
+        conn.execute("DROP INDEX idx_education_profile")
+        old = timed("3 queries, no profile_id index", old_load, ids)
+        database_init._add_profile_child_indexes(conn.cursor())
+        indexed = timed("3 queries, indexed", old_load, ids)
+        new = timed("load_profile (1 query, JSON)", load_profile, ids)
+        print(f"\nspeedup vs old: {old / new:6.1f}x   (indexes alone: {old / indexed:.1f}x)")
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
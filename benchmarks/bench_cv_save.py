@@ -0,0 +1,101 @@
+# benchmarks/bench_cv_save.py
+"""
+Saves a CV profile with hundreds of experience/education entries two ways:
+the old delete-everything-and-reinsert-row-by-row save, and the diff-based
+sync_experience/sync_education (executemany of only what changed).
+
+    python benchmarks/bench_cv_save.py [--entries 500] [--changed 1] [--saves 50]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+from cv_database_funcs import load_profile, sync_education, sync_experience
+
+
+def old_save(profile_id, experiences, educations):
+    with database_connection.transaction() as cursor:
+        cursor.execute("DELETE FROM work_experience WHERE profile_id=?", (profile_id,))
+        for _, values in experiences:
+            cursor.execute(
+                'INSERT INTO work_experience (profile_id, title, description, duration) VALUES (?, ?, ?, ?)',
+                (profile_id, *values)
+            )
+        cursor.execute("DELETE FROM education WHERE profile_id=?", (profile_id,))
+        for _, values in educations:
+            cursor.execute(
+                'INSERT INTO education (profile_id, course_name, year_completion, grade, institution_name) VALUES (?, ?, ?, ?, ?)',
+                (profile_id, *values)
+            )
+
+
+def new_save(profile_id, experiences, educations):
+    with database_connection.transaction() as cursor:
+        sync_experience(cursor, profile_id, experiences)
+        sync_education(cursor, profile_id, educations)
+
+
+def form_entries(profile_id):
+    """The (row_id, values) lists the form would pass after loading the profile."""
+    profile = load_profile(profile_id)
+    experiences = [(exp.row_id, (exp.title, exp.description, exp.duration)) for exp in profile.experience]
+    educations = [(edu.row_id, (edu.course, edu.year, edu.grade, edu.institution)) for edu in profile.education]
+    return experiences, educations
+
+
+def edit(entries, changed, revision):
+    """Edits the first field of `changed` entries spread through the list."""
+    step = max(1, len(entries) // max(changed, 1))
+    for i in range(0, min(len(entries), changed * step), step):
+        row_id, values = entries[i]
+        entries[i] = (row_id, (f"{values[0].split(' #')[0]} #{revision}", *values[1:]))
+
+
+def timed(label, save, profile_id, experiences, educations, changed, saves):
+    start = time.perf_counter()
+    for revision in range(saves):
+        edit(experiences, changed, revision)
+        edit(educations, changed, revision)
+        save(profile_id, experiences, educations)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed / saves * 1000:8.2f} ms/save")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=500, help="experience and education entries each")
+    parser.add_argument("--changed", type=int, default=1, help="entries edited per save (per section)")
+    parser.add_argument("--saves", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+        database_init.initialize_all_databases()
+        with database_connection.transaction() as cursor:
+            for name in ("old", "new"):
+                cursor.execute("INSERT INTO profile (profile_name, name) VALUES (?, ?)", (name, name))
+                profile_id = cursor.lastrowid
+                sync_experience(cursor, profile_id, [
+                    (None, (f"Job {i}", "Did things\n" * 5, "2020 - 2021")) for i in range(args.entries)
+                ])
+                sync_education(cursor, profile_id, [
+                    (None, (f"Course {i}", "2019", "9.0", "University")) for i in range(args.entries)
+                ])
+
+        print(f"{args.entries} entries per section, {args.changed} edited per save\n")
+        # The old save re-inserts everything, so its row ids never matter
+        old = timed("delete + re-insert", old_save, 1, *form_entries(1), args.changed, args.saves)
+        new = timed("diff + executemany", new_save, 2, *form_entries(2), args.changed, args.saves)
+        print(f"\nspeedup: {old / new:5.1f}x")
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
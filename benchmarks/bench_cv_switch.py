@@ -0,0 +1,92 @@
+# benchmarks/bench_cv_switch.py
+"""
+Measures CV profile switch latency (load_data plus the resulting layout
+and paint) between profiles with many entries, with the recycled entry
+groups and with the old rebuild-every-group behaviour, using Qt's
+offscreen platform so no display is needed.
+
+    python benchmarks/bench_cv_switch.py [--entries 40 10] [--switches 40]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+from cv_database_funcs import sync_education, sync_experience
+
+
+def rebuild_entries(items, spares, count, add):
+    """The old behaviour: every group is deleted and built again."""
+    for item in items:
+        item['group'].deleteLater()
+    items.clear()
+    while len(items) < count:
+        add()
+
+
+def timed(label, app, widget, profile_ids, switches, visible):
+    samples = []
+    for i in range(switches):
+        started = time.perf_counter()
+        widget.load_data(profile_ids[i % len(profile_ids)])
+        app.processEvents()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    median = samples[len(samples) // 2]
+    print(f"{label:<22} median {median * 1000:7.1f} ms/switch  "
+          f"worst {samples[-1] * 1000:7.1f} ms  ({median / visible * 1e6:6.0f} us/entry)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, nargs='+', default=[40, 10],
+                        help="entries per section for each profile switched between")
+    parser.add_argument("--switches", type=int, default=40)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+        database_init.initialize_all_databases()
+        profile_ids = []
+        with database_connection.transaction() as cursor:
+            for count in args.entries:
+                cursor.execute("INSERT INTO profile (profile_name, name, skills) VALUES (?, ?, ?)",
+                               (f"{count} entries", "Person", "Python, SQL"))
+                profile_id = cursor.lastrowid
+                sync_experience(cursor, profile_id, [
+                    (None, (f"Job {i}", "Did things\n" * 3, "2020 - 2021")) for i in range(count)
+                ])
+                sync_education(cursor, profile_id, [
+                    (None, (f"Course {i}", "2019", "9.0", "University")) for i in range(count)
+                ])
+                profile_ids.append(profile_id)
+
+        from PyQt6.QtWidgets import QApplication
+        from cv_generator_widget import CVGeneratorWidget
+        app = QApplication(sys.argv)
+        # Average groups shown per switch, across both sections
+        visible = 2 * sum(args.entries) / len(args.entries)
+
+        widget = CVGeneratorWidget()
+        widget.resize(1000, 800)
+        widget.show()
+        widget._resize_entries = rebuild_entries
+        timed("rebuild every group", app, widget, profile_ids, args.switches, visible)
+        widget.close()
+
+        widget = CVGeneratorWidget()
+        widget.resize(1000, 800)
+        widget.show()
+        timed("recycled groups", app, widget, profile_ids, args.switches, visible)
+        widget.close()
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
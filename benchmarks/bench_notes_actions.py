@@ -0,0 +1,86 @@
+# benchmarks/bench_notes_actions.py
+"""
+Per-action latency (add, edit, delete) in the notes grid against the
+number of notes loaded into it, with the grid patched from
+notes_database_funcs.changes. Widget work per change should not grow
+with the number of loaded cards. Uses Qt's offscreen platform.
+
+    python benchmarks/bench_notes_actions.py [--sizes 100 10000 50000] [--actions 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import notes_database_funcs
+
+
+def load_everything(model):
+    from PyQt6.QtCore import QModelIndex
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+
+
+def actions(size):
+    """(name, function(i)) pairs; each writes through notes_database_funcs."""
+    added = []
+    return [
+        ("edit", lambda i: notes_database_funcs.update_note(1 + (i * 7919) % size, f"Edited {i}", "Changed")),
+        ("add", lambda i: added.append(notes_database_funcs.add_note(f"New {i}", "Fresh"))),
+        ("delete", lambda i: notes_database_funcs.delete_note(added.pop())),
+    ]
+
+
+def timed(app, action, count):
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        action(i)
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000, 50000])
+    parser.add_argument("--actions", type=int, default=20, help="of each kind, per size")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+    from notes_widget import NotesWidget
+    app = QApplication(sys.argv)
+
+    print(f"{'notes':>8}  {'action':<7} {'ms':>8}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            with database_connection.transaction() as cursor:
+                cursor.executemany(
+                    "INSERT INTO notes (title, content, preview) VALUES (?, ?, ?)",
+                    ((f"Note {i}", "Some text", "Some text") for i in range(size))
+                )
+
+            widget = NotesWidget()
+            widget.resize(900, 700)
+            widget.show()
+            load_everything(widget.notes_model)
+            app.processEvents()
+            for name, action in actions(size):
+                print(f"{size:8,}  {name:<7} {timed(app, action, args.actions):8.3f}")
+            widget.close()
+            widget.deleteLater()
+            app.processEvents()
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_notes_paging.py
+"""
+Compares loading every note (the old get_all_notes grid fill) with fetching
+the first keyset page, in time and Python memory, as the table grows.
+
+    python benchmarks/bench_notes_paging.py [--sizes 1000 10000 50000] [--content 4000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import notes_database_funcs
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = func()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--content", type=int, default=4000, help="characters of content per note")
+    args = parser.parse_args()
+
+    print(f"{'notes':>8}  {'all: ms':>9} {'MB':>7}   {'page: ms':>9} {'MB':>7}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            body = "lorem ipsum " * (args.content // 12)
+            with database_connection.transaction() as cursor:
+                cursor.executemany(
+                    "INSERT INTO notes (title, content, preview) VALUES (?, ?, ?)",
+                    ((f"Note {i}", body, notes_database_funcs.make_preview(body)) for i in range(size))
+                )
+            all_ms, all_mb, _ = measure(notes_database_funcs.get_all_notes)
+            page_ms, page_mb, _ = measure(notes_database_funcs.get_notes_page)
+            print(f"{size:8,}  {all_ms:9.1f} {all_mb:7.1f}   {page_ms:9.2f} {page_mb:7.2f}")
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
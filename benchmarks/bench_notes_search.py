@@ -0,0 +1,77 @@
+# benchmarks/bench_notes_search.py
+"""
+Measures notes search latency for the old LIKE scan against the FTS5 index
+at several table sizes.
+
+    python benchmarks/bench_notes_search.py [--sizes 10000 100000 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import notes_database_funcs
+
+COMMON = ("meeting project budget travel recipe garden invoice python release "
+          "birthday doctor grocery review design backlog sprint music holiday").split()
+# A few thousand filler words so that queries are selective, as in real notes
+FILLER = ["".join(random.Random(i).choices("abcdefghijklmnoprstuvw", k=7)) for i in range(5000)]
+QUERIES = ("bud", "project review", "gard", "holiday music", "zzzz")
+REPEAT = 5
+
+
+def like_search(query):
+    term = f"%{query}%"
+    return database_connection.get_connection().execute(
+        "SELECT id, title, content FROM notes WHERE title LIKE ? OR content LIKE ? ORDER BY id DESC",
+        (term, term)
+    ).fetchall()
+
+
+def fill(count):
+    rng = random.Random(count)
+    with database_connection.transaction() as cursor:
+        cursor.executemany(
+            "INSERT INTO notes (title, content) VALUES (?, ?)",
+            ((" ".join(rng.choices(FILLER, k=2) + rng.choices(COMMON, k=1)),
+              " ".join(rng.choices(FILLER, k=60) + rng.choices(COMMON, k=1))) for _ in range(count))
+        )
+
+
+def best_ms(func, query):
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(query)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            fill(size)
+            print(f"\n{size:,} notes")
+            print(f"  {'query':<16}{'LIKE ms':>10}{'FTS ms':>10}{'FTS top50 ms':>14}")
+            for query in QUERIES:
+                like_ms = best_ms(like_search, query)
+                fts_ms = best_ms(notes_database_funcs.search_notes, query)
+                top_ms = best_ms(notes_database_funcs.search_notes_snippets, query)
+                print(f"  {query:<16}{like_ms:10.2f}{fts_ms:10.2f}{top_ms:14.2f}")
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
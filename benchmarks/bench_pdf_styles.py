@@ -0,0 +1,83 @@
+# benchmarks/bench_pdf_styles.py
+"""
+Per-export style setup cost: the old per-export getSampleStyleSheet() +
+nine ParagraphStyles + a new TableStyle per table, against the shared
+cv_pdf_renderer.pdf_styles() registry. Also times whole exports of the
+same profile back to back (as in a batch), rendered to memory.
+
+    python benchmarks/bench_pdf_styles.py [--rows 20] [--exports 200]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cv_pdf_renderer import (
+    BODY_TEXT_GRAY, HEADING_GRAY, LINE_COLOR, UI_BLUE,
+    CVProfile, EducationEntry, ExperienceEntry, pdf_styles, render_cv_pdf
+)
+
+
+def old_setup(rows):
+    """What every export used to build before laying out anything."""
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_LEFT, TA_RIGHT
+    from reportlab.lib.colors import HexColor
+    from reportlab.platypus import TableStyle
+    heading_gray, body_text_gray = HexColor(HEADING_GRAY), HexColor(BODY_TEXT_GRAY)
+    HexColor(LINE_COLOR)
+    ui_blue = HexColor(UI_BLUE)
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='NameStyle', fontName='Helvetica-Bold', fontSize=28, alignment=TA_LEFT, textColor=ui_blue, leading=34))
+    styles.add(ParagraphStyle(name='ContactStyle', fontName='Helvetica', fontSize=10, alignment=TA_LEFT, textColor=body_text_gray, leading=12))
+    styles.add(ParagraphStyle(name='HeadingStyle', fontName='Helvetica-Bold', fontSize=11, spaceBefore=12, spaceAfter=2, textColor=heading_gray))
+    styles.add(ParagraphStyle(name='BodyStyle', fontName='Helvetica', fontSize=10, leading=14, alignment=TA_LEFT, textColor=body_text_gray))
+    styles.add(ParagraphStyle(name='ItalicBodyStyle', parent=styles['BodyStyle'], fontName='Helvetica-Oblique'))
+    styles.add(ParagraphStyle(name='JobTitleStyle', fontName='Helvetica-Bold', fontSize=10, textColor=body_text_gray))
+    styles.add(ParagraphStyle(name='InstitutionStyle', fontName='Helvetica', fontSize=10, textColor=body_text_gray))
+    styles.add(ParagraphStyle(name='DateStyle', fontName='Helvetica', fontSize=10, textColor=body_text_gray, alignment=TA_RIGHT))
+    styles.add(ParagraphStyle(name='BulletStyle', fontName='Helvetica', fontSize=10, leading=14, alignment=TA_LEFT, textColor=body_text_gray, leftIndent=15))
+    padding = [(cmd, (0, 0), (-1, -1), 0) for cmd in ('LEFTPADDING', 'RIGHTPADDING', 'TOPPADDING', 'BOTTOMPADDING')]
+    TableStyle(padding)
+    TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE')] + padding)
+    for _ in range(rows):
+        TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP'), padding[0], padding[3]])
+        TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')])
+    return styles
+
+
+def timed(label, func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<36} {elapsed * 1e6:10.1f} us/export")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20, help="education and experience entries each")
+    parser.add_argument("--exports", type=int, default=200)
+    args = parser.parse_args()
+
+    pdf_styles() # Imports ReportLab, so neither side pays for that
+    old = timed("old setup (stylesheet + table styles)", lambda: old_setup(args.rows), args.exports)
+    new = timed("pdf_styles() registry", pdf_styles, args.exports)
+    print(f"setup speedup: {old / new:,.0f}x\n")
+
+    profile = CVProfile(
+        "Ann Example", "555-0100", "ann@example.com", "Springfield", "Build useful things.",
+        "Python, SQL, Qt, ReportLab, Testing, Profiling, Packaging", None,
+        tuple(EducationEntry(f"Course {i}", "2019", "9.0", "University") for i in range(args.rows)),
+        tuple(ExperienceEntry(f"Job {i}", "Did things\nShipped them", "2020 - 2021") for i in range(args.rows)),
+    )
+    export = timed("whole export (to memory)", lambda: render_cv_pdf(profile, io.BytesIO()), max(1, args.exports // 10))
+    print(f"old setup was {old / export:.1%} of an export")
+
+
+if __name__ == '__main__':
+    main()
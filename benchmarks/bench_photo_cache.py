@@ -0,0 +1,76 @@
+# benchmarks/bench_photo_cache.py
+"""
+Times the circular CV photo for multi-megapixel JPEGs on a cache miss
+(decode, fit, mask, PNG encode) and on a cache hit: "cold" hashes the
+source file first (a new process), "warm" reuses the in-process digest.
+
+    python benchmarks/bench_photo_cache.py [--megapixels 12 24] [--repeat 5]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import photo_processing
+
+# What the CV renderer asks for: 1.25 inch at 72 points per inch
+PHOTO_SIZE = (90, 90)
+
+
+def make_photo(path, megapixels):
+    """Writes a noisy (so it doesn't compress to nothing) JPEG of roughly `megapixels` MP."""
+    from PIL import Image
+    width = int((megapixels * 1e6 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    noise = Image.effect_noise((width, height), 64).convert("RGB")
+    noise.save(path, format='JPEG', quality=90)
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megapixels", type=float, nargs='+', default=[12, 24])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        photo_processing.PHOTO_CACHE_DIR = os.path.join(tmp, "cache")
+        print(f"{'photo':>10} {'file':>9} {'miss':>10} {'cold hit':>10} {'warm hit':>10} {'speedup':>8}")
+        for megapixels in args.megapixels:
+            path = os.path.join(tmp, f"photo_{megapixels:g}mp.jpg")
+            make_photo(path, megapixels)
+
+            def miss():
+                shutil.rmtree(photo_processing.PHOTO_CACHE_DIR, ignore_errors=True)
+                photo_processing._digest_memo.clear()
+                photo_processing.rounded_photo_png(path, PHOTO_SIZE)
+
+            def cold_hit():
+                photo_processing._digest_memo.clear()
+                photo_processing.rounded_photo_png(path, PHOTO_SIZE)
+
+            def warm_hit():
+                photo_processing.rounded_photo_png(path, PHOTO_SIZE)
+
+            miss_time = timed(miss, args.repeat)
+            cold_time = timed(cold_hit, args.repeat)
+            hit_time = timed(warm_hit, args.repeat)
+            size_mb = os.path.getsize(path) / 1e6
+            print(f"{megapixels:>8g}MP {size_mb:>7.1f}MB {miss_time * 1000:>8.1f}ms "
+                  f"{cold_time * 1000:>8.2f}ms {hit_time * 1000:>8.2f}ms {miss_time / cold_time:>7.0f}x")
+
+
+if __name__ == '__main__':
+    main()
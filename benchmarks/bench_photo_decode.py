@@ -0,0 +1,82 @@
+# benchmarks/bench_photo_decode.py
+"""
+Compares the old full-resolution photo pipeline (decode everything,
+convert to RGBA, ImageOps.fit) with photo_processing.make_rounded_png
+(JPEG draft decoding, EXIF transpose, reduce-then-resample) for large
+camera-sized JPEGs. Each run happens in a fresh process so peak RSS is
+measured per pipeline (Unix only).
+
+    python benchmarks/bench_photo_decode.py [--megapixels 20 50]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PHOTO_SIZE = (90, 90)
+
+
+def old_pipeline(path):
+    from PIL import Image, ImageOps
+    img = Image.open(path).convert("RGBA")
+    return ImageOps.fit(img, PHOTO_SIZE, Image.Resampling.LANCZOS)
+
+
+def new_pipeline(path):
+    import photo_processing
+    return photo_processing.make_rounded_png(path, PHOTO_SIZE)
+
+
+def run_one(variant, path):
+    """Child process: times one pipeline and prints 'seconds peak_kb'."""
+    import PIL.Image # Loaded before the RSS baseline, like in the app
+    func = old_pipeline if variant == 'old' else new_pipeline
+    start = time.perf_counter()
+    func(path)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak_kb //= 1024 # macOS reports bytes
+    print(elapsed, peak_kb)
+
+
+def make_photo(path, megapixels):
+    from PIL import Image
+    width = int((megapixels * 1e6 * 3 / 2) ** 0.5)
+    height = int(width * 2 / 3)
+    Image.effect_noise((width, height), 64).convert("RGB").save(path, format='JPEG', quality=90)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--megapixels", type=float, nargs='+', default=[20, 50])
+    parser.add_argument("--run", nargs=2, metavar=('VARIANT', 'PATH'), help=argparse.SUPPRESS)
+    parser.add_argument("--make", nargs=2, metavar=('MEGAPIXELS', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.run:
+        run_one(*args.run)
+        return
+    if args.make:
+        make_photo(args.make[1], float(args.make[0]))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'photo':>8} {'pipeline':>9} {'time':>10} {'peak RSS':>10}")
+        for megapixels in args.megapixels:
+            path = os.path.join(tmp, f"photo_{megapixels:g}mp.jpg")
+            # Also in a child: Linux carries a parent's peak RSS over into forked children
+            subprocess.run([sys.executable, __file__, '--make', str(megapixels), path], check=True)
+            for variant in ('old', 'new'):
+                out = subprocess.run([sys.executable, __file__, '--run', variant, path],
+                                     capture_output=True, text=True, check=True).stdout.split()
+                elapsed, peak_kb = float(out[0]), int(out[1])
+                print(f"{megapixels:>6g}MP {variant:>9} {elapsed * 1000:>8.0f}ms {peak_kb / 1024:>8.0f}MB")
+
+
+if __name__ == '__main__':
+    main()
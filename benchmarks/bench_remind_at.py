@@ -0,0 +1,91 @@
+# benchmarks/bench_remind_at.py
+"""
+Answers "what is due before T" and "next N upcoming reminders" two ways:
+Python-side filtering over get_all_tasks() with string parsing (the old
+approach), and index range scans on tasks.remind_at.
+
+    python benchmarks/bench_remind_at.py [--tasks 100000] [--next 20]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+from todo_database_funcs import reminder_epoch
+
+
+def python_pending():
+    for task_id, title, _, done, reminder_date, reminder_time in todo_database_funcs.get_all_tasks():
+        if done or not reminder_date or not reminder_time:
+            continue
+        due = reminder_epoch(reminder_date, reminder_time)
+        if due is not None:
+            yield task_id, title, due
+
+
+def python_due_before(before):
+    return sorted((row for row in python_pending() if row[2] <= before), key=lambda row: (row[2], row[0]))
+
+
+def python_next(now, count):
+    return sorted((row for row in python_pending() if row[2] >= now), key=lambda row: (row[2], row[0]))[:count]
+
+
+def best_ms(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--next", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+        database_init.initialize_all_databases()
+        rng = random.Random(1)
+        base = datetime.now() - timedelta(days=180)
+        with database_connection.transaction() as cursor:
+            for i in range(args.tasks):
+                due = base + timedelta(minutes=rng.randrange(60 * 24 * 365))
+                reminder_date, reminder_time = due.strftime("%Y-%m-%d"), due.strftime("%H:%M")
+                cursor.execute(
+                    "INSERT INTO tasks (title, description, done, reminder_date, reminder_time, remind_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (f"Task {i}", "", int(rng.random() < 0.3), reminder_date, reminder_time,
+                     reminder_epoch(reminder_date, reminder_time))
+                )
+
+        now = int(time.time())
+        before = now - 150 * 86400 # A month's worth of overdue reminders
+        assert python_due_before(before) == todo_database_funcs.get_due_tasks(before)
+        assert python_next(now, args.next) == todo_database_funcs.get_upcoming_reminders(after=(now, 0), limit=args.next)
+
+        due_py = best_ms(lambda: python_due_before(before))
+        due_sql = best_ms(lambda: todo_database_funcs.get_due_tasks(before))
+        next_py = best_ms(lambda: python_next(now, args.next))
+        next_sql = best_ms(lambda: todo_database_funcs.get_upcoming_reminders(after=(now, 0), limit=args.next))
+
+        print(f"{args.tasks:,} tasks")
+        print(f"  {'query':<22}{'python ms':>11}{'index ms':>11}{'speedup':>10}")
+        print(f"  {'due before T':<22}{due_py:11.2f}{due_sql:11.2f}{due_py / due_sql:9.0f}x")
+        print(f"  {f'next {args.next} upcoming':<22}{next_py:11.2f}{next_sql:11.3f}{next_py / next_sql:9.0f}x")
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_reminders.py
+"""
+Compares the old 10-second reminder poll (read every task, parse every
+reminder string) with the ReminderQueue used by ReminderScheduler.
+
+    python benchmarks/bench_reminders.py [--tasks 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+from reminder_queue import ReminderQueue
+from todo_database_funcs import reminder_epoch
+
+
+def old_poll_tick(triggered):
+    """What ToDoWidget.check_reminders did on every tick (minus the Qt parsing)."""
+    now = time.time()
+    for task_id, title, _, done, reminder_date, reminder_time in todo_database_funcs.get_all_tasks():
+        if done or not reminder_date or not reminder_time or task_id in triggered:
+            continue
+        due = reminder_epoch(reminder_date, reminder_time)
+        if due is not None and now >= due:
+            triggered.add(task_id)
+
+
+def timed_ms(func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+        database_init.initialize_all_databases()
+        rng = random.Random(1)
+        start = datetime.now() + timedelta(days=1)
+        with database_connection.transaction() as cursor:
+            for i in range(args.tasks):
+                due = start + timedelta(minutes=rng.randrange(60 * 24 * 365))
+                reminder_date, reminder_time = due.strftime("%Y-%m-%d"), due.strftime("%H:%M")
+                cursor.execute(
+                    "INSERT INTO tasks (title, description, done, reminder_date, reminder_time, remind_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (f"Task {i}", "", int(rng.random() < 0.3), reminder_date, reminder_time,
+                     reminder_epoch(reminder_date, reminder_time))
+                )
+
+        triggered = set()
+        poll_ms = timed_ms(lambda: old_poll_tick(triggered), repeat=3)
+        queue = ReminderQueue()
+        build_ms = timed_ms(queue.reload)
+        next_ms = timed_ms(queue.next_due, repeat=1000)
+        ids = [rng.randrange(1, args.tasks + 1) for _ in range(500)]
+        changes = iter(ids)
+        change_ms = timed_ms(lambda: queue.refresh(next(changes)), repeat=len(ids))
+
+        print(f"{args.tasks:,} tasks")
+        print(f"  old poll tick (every 10 s):       {poll_ms:9.2f} ms  -> {poll_ms / 10:.2f} ms CPU per second idle")
+        print(f"  queue build (startup, once):      {build_ms:9.2f} ms")
+        print(f"  next due lookup (per timer arm):  {next_ms * 1000:9.2f} us")
+        print(f"  incremental refresh (per change): {change_ms * 1000:9.2f} us")
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# benchmarks/bench_startup.py
+"""
+Measures time-to-first-window: building AppHubWindow for each start page
+and processing events until it has been shown, using Qt's offscreen
+platform so no display is needed. Runs against a temporary database
+seeded with notes and tasks unless --db is given. The reminder scheduler
+is stopped before any events are processed, so a past-due reminder in the
+database can't open a dialog mid-run.
+
+    python benchmarks/bench_startup.py [--db path/to/app_data.db] [--rows 1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+
+PAGES = ["CV Generator", "Notes", "To-Do List", "Calculator"]
+
+
+def seed(rows):
+    """Adds `rows` notes and `rows` tasks (no reminders) to a fresh database."""
+    with database_connection.transaction() as cursor:
+        cursor.executemany(
+            "INSERT INTO notes (title, content, preview) VALUES (?, ?, ?)",
+            ((f"Note {i}", "Some text", "Some text") for i in range(rows))
+        )
+        cursor.executemany(
+            "INSERT INTO tasks (title, description) VALUES (?, ?)",
+            ((f"Task {i}", "Some details") for i in range(rows))
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=None, help="existing database to start against (default: a seeded temporary one)")
+    parser.add_argument("--rows", type=int, default=1000, help="notes and tasks seeded into the temporary database")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = args.db or os.path.join(tmp, "bench.db")
+        run(args, seed_rows=0 if args.db else args.rows)
+
+
+def run(args, seed_rows):
+    started = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication
+    import database_init
+    import main as app_main
+    import_ms = (time.perf_counter() - started) * 1000
+
+    database_init.initialize_all_databases()
+    if seed_rows:
+        seed(seed_rows)
+    app = QApplication(sys.argv)
+    print(f"imports: {import_ms:.1f} ms")
+    for index, page in enumerate(PAGES):
+        best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            window = app_main.AppHubWindow(index)
+            # Before any events run, so due reminders never open a modal dialog
+            window.reminder_scheduler.stop()
+            window.reminder_scheduler.reminder_due.disconnect()
+            window.show()
+            app.processEvents()
+            best = min(best, time.perf_counter() - started)
+            window.close()
+            window.deleteLater()
+            app.processEvents()
+        print(f"start on {page:<13} first window: {best * 1000:8.1f} ms")
+    database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/bench_task_actions.py
+"""
+Per-action latency (toggle, add, edit, delete) in the to-do list against
+list size, with every task paged into the view: reloading the list after
+each write (and paging back to where the user was) versus the single-row
+updates ToDoWidget applies from todo_database_funcs.changes. Uses Qt's
+offscreen platform.
+
+    python benchmarks/bench_task_actions.py [--sizes 1000 20000 100000] [--actions 20]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+
+
+def load_everything(model):
+    from PyQt6.QtCore import QModelIndex
+    while model.canFetchMore(QModelIndex()):
+        model.fetchMore(QModelIndex())
+
+
+def actions(size):
+    """(name, function(i)) pairs; each writes through todo_database_funcs."""
+    added = []
+    return [
+        ("toggle", lambda i: todo_database_funcs.update_task_status(1 + (i * 7919) % size, i % 2)),
+        ("edit", lambda i: todo_database_funcs.update_task(1 + (i * 104729) % size, f"Edited {i}", "", None, None)),
+        ("add", lambda i: added.append(todo_database_funcs.add_task(f"New {i}", "", None, None))),
+        ("delete", lambda i: todo_database_funcs.delete_task(added.pop())),
+    ]
+
+
+def timed(app, action, count, after=None):
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        action(i)
+        if after is not None:
+            after()
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 20000, 100000])
+    parser.add_argument("--actions", type=int, default=20, help="of each kind, per size")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication
+    from todo_widget import ToDoWidget
+    app = QApplication(sys.argv)
+
+    print(f"{'tasks':>8}  {'action':<7} {'reload: ms':>11} {'single row: ms':>15}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            with database_connection.transaction() as cursor:
+                cursor.executemany(
+                    "INSERT INTO tasks (title, description, reminder_date, reminder_time) VALUES (?, ?, ?, ?)",
+                    ((f"Task {i}", "Some details\nmore", "2026-01-01", "09:30") for i in range(size))
+                )
+
+            widget = ToDoWidget()
+            widget.resize(600, 900)
+            widget.show()
+            model = widget.task_model
+
+            def reload():
+                # The old behaviour, keeping the user's place in the list
+                widget.load_tasks()
+                load_everything(model)
+
+            results = {}
+            todo_database_funcs.changes.unsubscribe(widget.on_task_changed)
+            load_everything(model)
+            for name, action in actions(size):
+                results[name] = [timed(app, action, args.actions, reload)]
+            todo_database_funcs.changes.subscribe(widget.on_task_changed)
+            load_everything(model)
+            for name, action in actions(size):
+                results[name].append(timed(app, action, args.actions))
+
+            for name, (reload_ms, single_ms) in results.items():
+                print(f"{size:8,}  {name:<7} {reload_ms:11.2f} {single_ms:15.3f}")
+            widget.close()
+            widget.deleteLater()
+            app.processEvents()
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_task_import.py
+"""
+Bulk task import and export throughput and Python heap use as the row
+count grows: one add_task() per row (a transaction and change event
+each) against import_tasks() (chunked executemany), and export_tasks()
+to CSV and JSON Lines (fetchmany batches). Peak traced memory should stay
+flat as the row count grows. Each step runs twice, timed and then traced,
+so imports write every row twice.
+
+    python benchmarks/bench_task_import.py [--sizes 10000 100000] [--single 5000]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+
+
+class NullWriter(io.TextIOBase):
+    """Discards output, so the export isn't measured holding its own result."""
+    def write(self, text):
+        return len(text)
+
+
+def generated_tasks(count):
+    for i in range(count):
+        yield {
+            'title': f"Task {i}", 'description': f"Imported from the old tracker\nticket {i}",
+            'done': str(i % 2), 'reminder_date': "2026-11-01" if i % 3 else "", 'reminder_time': "09:30",
+        }
+
+
+def measure(func):
+    """Returns (rows, seconds) from one run and the peak MB of Python allocations from a second."""
+    start = time.perf_counter()
+    rows = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start() # Slows allocation down, so it is kept out of the timed run
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak / 1024 / 1024
+
+
+def single_rows(count):
+    for task in generated_tasks(count):
+        todo_database_funcs.add_task(task['title'], task['description'], task['reminder_date'] or None, task['reminder_time'])
+    return count
+
+
+def report(label, size, rows, elapsed, peak):
+    print(f"{size:9,}  {label:<22} {rows / elapsed:12,.0f} rows/s {peak:8.2f} MB peak")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--single", type=int, default=5000, help="rows added one add_task() at a time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "single.db")
+        database_init.initialize_all_databases()
+        report("add_task() per row", args.single, *measure(lambda: single_rows(args.single)))
+        database_connection.close_all()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            report("import_tasks()", size, *measure(lambda: todo_database_funcs.import_tasks(generated_tasks(size))))
+            for fmt in todo_database_funcs.EXPORT_FORMATS:
+                report(f"export_tasks({fmt})", size, *measure(lambda: todo_database_funcs.export_tasks(NullWriter(), fmt)))
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
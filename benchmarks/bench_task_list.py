@@ -0,0 +1,137 @@
+# benchmarks/bench_task_list.py
+"""
+Fills the to-do list the old way (a QListWidget with a composed QWidget per
+task) and through TaskListModel/TaskItemDelegate, timing load plus first
+paint as the task table grows, using Qt's offscreen platform. Also times
+scrolling the model/view list from top to bottom, which pages in every row.
+
+    python benchmarks/bench_task_list.py [--sizes 1000 5000 100000] [--old-max 5000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+
+
+def old_fill(list_widget, tasks):
+    """The old load_tasks body: one widget tree per task."""
+    from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QCheckBox, QLabel, QListWidgetItem
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QFont
+    list_widget.clear()
+    for task_id, title, description, done, reminder_date, reminder_time in tasks:
+        item_widget = QWidget()
+        item_layout = QVBoxLayout(item_widget)
+        item_layout.setContentsMargins(5, 5, 5, 5)
+        item_layout.setSpacing(3)
+        top_layout = QHBoxLayout()
+        checkbox = QCheckBox()
+        checkbox.setChecked(bool(done))
+        title_label = QLabel(title)
+        title_font = QFont()
+        title_font.setStrikeOut(bool(done))
+        title_font.setBold(True)
+        title_font.setPointSize(14)
+        title_label.setFont(title_font)
+        top_layout.addWidget(checkbox)
+        top_layout.addWidget(title_label)
+        top_layout.addStretch()
+        if reminder_date and reminder_time:
+            reminder_label = QLabel(f"Due: {reminder_date} {reminder_time}")
+            reminder_font = QFont()
+            reminder_font.setStrikeOut(bool(done))
+            reminder_font.setPointSize(10)
+            reminder_label.setFont(reminder_font)
+            reminder_label.setStyleSheet("color: #666666; margin-left: 10px;")
+            top_layout.addWidget(reminder_label)
+        item_layout.addLayout(top_layout)
+        if description:
+            desc_label = QLabel(description.split('\n')[0][:80])
+            desc_font = QFont()
+            desc_font.setItalic(True)
+            desc_font.setStrikeOut(bool(done))
+            desc_label.setFont(desc_font)
+            desc_label.setStyleSheet("color: #555555; padding-left: 28px;")
+            item_layout.addWidget(desc_label)
+        list_item = QListWidgetItem()
+        list_item.setData(Qt.ItemDataRole.UserRole, task_id)
+        list_item.setSizeHint(item_widget.sizeHint())
+        list_widget.addItem(list_item)
+        list_widget.setItemWidget(list_item, item_widget)
+
+
+def painted(app, func):
+    """Runs func, then lets the event loop lay out and paint; returns ms."""
+    start = time.perf_counter()
+    func()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+
+def scroll_to_end(app, view):
+    """Scrolls down until every page has been fetched and painted."""
+    bar = view.verticalScrollBar()
+    while True:
+        bar.setValue(bar.maximum())
+        app.processEvents()
+        if not view.model().canFetchMore(view.rootIndex()) and bar.value() == bar.maximum():
+            return
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 100000])
+    parser.add_argument("--old-max", type=int, default=5000, help="skip the old list above this many tasks")
+    args = parser.parse_args()
+
+    from PyQt6.QtWidgets import QApplication, QListWidget
+    from todo_database_funcs import get_all_tasks
+    from todo_widget import ToDoWidget
+    app = QApplication(sys.argv)
+
+    print(f"{'tasks':>8}  {'widgets: ms':>12}  {'model: ms':>10}  {'scroll to end: ms':>18}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            with database_connection.transaction() as cursor:
+                cursor.executemany(
+                    "INSERT INTO tasks (title, description, done, reminder_date, reminder_time) VALUES (?, ?, ?, ?, ?)",
+                    ((f"Task {i}", "First line of the description\nand more" if i % 2 else "",
+                      int(i % 5 == 0), "2026-01-01" if i % 3 else None, "09:30") for i in range(size))
+                )
+
+            old_ms = None
+            if size <= args.old_max:
+                list_widget = QListWidget()
+                list_widget.resize(600, 700)
+                list_widget.show()
+                old_ms = painted(app, lambda: old_fill(list_widget, get_all_tasks()))
+                list_widget.close()
+                list_widget.deleteLater()
+                app.processEvents()
+
+            widget = ToDoWidget()
+            widget.resize(600, 900)
+            widget.show()
+            app.processEvents()
+            new_ms = painted(app, widget.load_tasks)
+            scroll_ms = painted(app, lambda: scroll_to_end(app, widget.task_list_view))
+            widget.close()
+            widget.deleteLater()
+            app.processEvents()
+
+            old_text = f"{old_ms:12.1f}" if old_ms is not None else f"{'skipped':>12}"
+            print(f"{size:8,}  {old_text}  {new_ms:10.1f}  {scroll_ms:18.1f}")
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
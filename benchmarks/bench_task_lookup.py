@@ -0,0 +1,69 @@
+# benchmarks/bench_task_lookup.py
+"""
+Cost of looking up the clicked task, as the task table grows: the old
+populate_fields (get_all_tasks() plus a linear scan for the id) against
+todo_database_funcs.get_task() on a cache miss (primary-key query) and on
+a cache hit.
+
+    python benchmarks/bench_task_lookup.py [--sizes 1000 20000 100000] [--lookups 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+
+
+def old_lookup(task_id):
+    tasks = todo_database_funcs.get_all_tasks()
+    return next((t for t in tasks if t[0] == task_id), None)
+
+
+def uncached_lookup(task_id):
+    todo_database_funcs._task_cache.clear()
+    return todo_database_funcs.get_task(task_id)
+
+
+def timed(lookup, ids):
+    start = time.perf_counter()
+    for task_id in ids:
+        lookup(task_id)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 20000, 100000])
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8}  {'scan: us':>11}  {'query: us':>10}  {'cached: us':>10}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+            database_init.initialize_all_databases()
+            with database_connection.transaction() as cursor:
+                cursor.executemany(
+                    "INSERT INTO tasks (title, description, reminder_date, reminder_time) VALUES (?, ?, ?, ?)",
+                    ((f"Task {i}", "Some details\nmore", "2026-01-01", "09:30") for i in range(size))
+                )
+            ids = [1 + (i * 7919) % size for i in range(args.lookups)]
+            scan = timed(old_lookup, ids[:max(1, args.lookups // 10)])
+            query = timed(uncached_lookup, ids)
+            todo_database_funcs._task_cache.clear()
+            for task_id in ids:
+                todo_database_funcs.get_task(task_id)
+            cached = timed(todo_database_funcs.get_task, ids)
+            print(f"{size:8,}  {scan:11,.0f}  {query:10.1f}  {cached:10.2f}")
+            todo_database_funcs._task_cache.clear()
+            database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
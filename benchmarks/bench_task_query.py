@@ -0,0 +1,126 @@
+# benchmarks/bench_task_query.py
+"""
+Task list filters and sorts over a large task table. Every view the
+filter bar can show is timed four ways: the way a filter would have had
+to work before (get_all_tasks() plus a Python filter and sort), the first
+page from query_tasks() without and with the list indexes, and a page
+20,000 rows deep, reached by keyset (after=) and by OFFSET.
+
+    python benchmarks/bench_task_query.py [--tasks 100000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database_connection
+import database_init
+import todo_database_funcs
+from todo_database_funcs import TaskQuery, query_tasks, task_sort_key, TASKS_PAGE_SIZE
+
+DEPTH = 20000
+WORDS = ("report", "invoice", "groceries", "dentist", "review", "backup", "meeting", "garden", "taxes", "email")
+
+
+def generated_tasks(count):
+    """A year of tasks around today: a third undated, half done, a fifth timed."""
+    start = datetime.now() - timedelta(days=180)
+    for i in range(count):
+        day = None if i % 3 == 0 else (start + timedelta(days=i * 7 % 365)).strftime("%Y-%m-%d")
+        yield {
+            'title': f"{WORDS[i % 10].capitalize()} {WORDS[i * 7 % 10]} {i}",
+            'description': f"Notes about the {WORDS[i * 3 % 10]} for item {i}",
+            'done': str(i % 2), 'reminder_date': day,
+            'reminder_time': f"{i % 24:02d}:{i % 2 * 30:02d}" if day and i % 5 == 0 else None,
+        }
+
+
+def python_filter(query):
+    """Everything read into Python, then filtered and sorted there."""
+    now = datetime.now()
+    today, hhmm = now.strftime("%Y-%m-%d"), now.strftime("%H:%M")
+    words = query.text.lower().split()
+    rows = []
+    for task in todo_database_funcs.get_all_tasks():
+        task_id, title, description, done, reminder_date, reminder_time = task
+        if query.status != 'all' and done != (query.status == 'done'):
+            continue
+        if query.due_from and not (reminder_date and query.due_from <= reminder_date <= query.due_to):
+            continue
+        if query.overdue and (done or (reminder_date or '9999-12-31', reminder_time or '99:99') >= (today, hhmm)):
+            continue
+        if words and not all(word in f"{title} {description}".lower() for word in words):
+            continue
+        rows.append(task)
+    rows.sort(key=lambda task: task_sort_key(task, query.sort), reverse=query.sort == 'newest')
+    return rows[:TASKS_PAGE_SIZE]
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    views = [
+        ("all, newest", TaskQuery()),
+        ("pending, newest", TaskQuery(status='pending')),
+        ("pending, due date", TaskQuery(status='pending', sort='due')),
+        ("done, title", TaskQuery(status='done', sort='title')),
+        ("due today", TaskQuery(due_from=today, due_to=today)),
+        ("overdue, due date", TaskQuery(overdue=True, sort='due')),
+        ("search 'invoice'", TaskQuery(text="invoice")),
+        ("search 'tax', pending, due", TaskQuery(status='pending', text="tax", sort='due')),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_connection.DB_NAME = os.path.join(tmp, "bench.db")
+        database_init.initialize_all_databases()
+        todo_database_funcs.import_tasks(generated_tasks(args.tasks))
+        conn = database_connection.get_connection()
+
+        results = {}
+        for name, query in views:
+            results[name] = [timed(lambda: python_filter(query), max(1, args.repeat // 2))]
+        for index in ('idx_tasks_status', 'idx_tasks_due', 'idx_tasks_title'):
+            conn.execute(f"DROP INDEX {index}")
+        for name, query in views:
+            results[name].append(timed(lambda: query_tasks(query), args.repeat))
+        with database_connection.transaction() as cursor:
+            database_init._add_tasks_list_indexes(cursor)
+
+        print(f"{args.tasks:,} tasks, ms per page of {TASKS_PAGE_SIZE}\n")
+        print(f"{'view':<28} {'matches':>8} {'python':>8} {'no index':>9} {'indexed':>8} "
+              f"{'keyset @' + str(DEPTH):>15} {'offset @' + str(DEPTH):>15}")
+        for name, query in views:
+            matches = len(query_tasks(query, limit=-1))
+            indexed = timed(lambda: query_tasks(query), args.repeat)
+            deep = query_tasks(query, offset=DEPTH - 1, limit=1)
+            if deep:
+                after = task_sort_key(deep[0], query.sort)
+                keyset = f"{timed(lambda: query_tasks(query, after=after), args.repeat):15.2f}"
+                offset = f"{timed(lambda: query_tasks(query, offset=DEPTH), args.repeat):15.2f}"
+            else:
+                keyset = offset = f"{'-':>15}"
+            python_ms, no_index_ms = results[name]
+            print(f"{name:<28} {matches:8,} {python_ms:8.1f} {no_index_ms:9.2f} {indexed:8.2f} {keyset} {offset}")
+        database_connection.close_all()
+
+
+if __name__ == '__main__':
+    main()
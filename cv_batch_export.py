@@ -0,0 +1,116 @@
+# cv_batch_export.py
+"""
+Exports stored CV profiles to PDF without starting the GUI.
+
+    python cv_batch_export.py --out exports                  # every profile
+    python cv_batch_export.py --out exports -p "My CV" -p Other
+    python cv_batch_export.py --out exports --workers 4 --db app_data.db
+
+Profiles are read from the database in this process and rendered in
+parallel by a process pool (ReportLab layout is CPU-bound, so threads
+would serialize on the GIL). Prints the time for each document and the
+total throughput.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import database_connection
+import database_init
+from cv_database_funcs import get_profiles, load_profile
+from cv_pdf_renderer import render_cv_pdf
+
+
+def output_file_name(profile_name):
+    """
+    Builds "<profile name>_CV.pdf", with each run of characters that are
+    unsafe in file names replaced by "_". Uses the profile name rather than
+    the person's name (as the GUI's save dialog does), so files stay unique
+    per profile.
+    """
+    return re.sub(r'[^\w.-]+', '_', profile_name.strip()) + "_CV.pdf"
+
+
+def _export_one(profile_name, profile, file_path):
+    """Runs in a worker process. Returns (profile_name, file_path, seconds, error)."""
+    started = time.perf_counter()
+    try:
+        render_cv_pdf(profile, file_path)
+    except Exception as e:
+        return profile_name, file_path, time.perf_counter() - started, str(e)
+    return profile_name, file_path, time.perf_counter() - started, None
+
+
+def export_profiles(out_dir, names=None, workers=None):
+    """
+    Renders the selected profiles (all when `names` is None) into out_dir.
+    Returns a list of (profile_name, file_path, seconds, error) in completion order.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = []
+    used_names = set()
+    for profile_id, profile_name in get_profiles(names):
+        profile = load_profile(profile_id)
+        if profile is None:
+            continue
+        file_name = output_file_name(profile_name)
+        if file_name in used_names: # Two names that sanitize to the same file
+            file_name = f"{profile_id}_{file_name}"
+        used_names.add(file_name)
+        jobs.append((profile_name, profile, os.path.join(out_dir, file_name)))
+
+    results = []
+    if not jobs:
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_export_one, *job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            profile_name, file_path, seconds, error = result
+            if error:
+                print(f"  FAILED {profile_name}: {error} ({seconds * 1000:.0f} ms)")
+            else:
+                print(f"  {profile_name} -> {file_path} ({seconds * 1000:.0f} ms)")
+            results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export stored CV profiles to PDF.")
+    parser.add_argument('--out', required=True, help="directory to write the PDFs into")
+    parser.add_argument('-p', '--profile', action='append', dest='profiles', metavar='NAME',
+                        help="profile name to export (repeatable; default: all profiles)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument('--db', default=database_connection.DB_NAME,
+                        help=f"database file (default: {database_connection.DB_NAME})")
+    args = parser.parse_args(argv)
+    # Connecting would silently create (and migrate) an empty database
+    if not os.path.isfile(args.db):
+        parser.error(f"no database file at {args.db}")
+
+    database_connection.DB_NAME = args.db
+    database_init.initialize_all_databases()
+
+    started = time.perf_counter()
+    results = export_profiles(args.out, args.profiles, args.workers)
+    elapsed = time.perf_counter() - started
+    database_connection.close_all()
+
+    if args.profiles:
+        missing = set(args.profiles) - {profile_name for profile_name, _, _, _ in results}
+        for profile_name in sorted(missing):
+            print(f"  No profile named {profile_name!r}")
+
+    failed = sum(1 for result in results if result[3])
+    exported = len(results) - failed
+    rate = exported / elapsed if elapsed > 0 else 0.0
+    print(f"Exported {exported} of {len(results)} profiles in {elapsed:.2f} s ({rate:.1f} docs/s)")
+    return 1 if failed or not results else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
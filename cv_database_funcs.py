@@ -0,0 +1,122 @@
+# cv_database_funcs.py
+import json
+
+from database_connection import get_connection
+from cv_pdf_renderer import CVProfile, EducationEntry, ExperienceEntry
+
+# Stored columns of each child table, in the order entries are passed to the sync_* functions
+EXPERIENCE_COLUMNS = ('title', 'description', 'duration')
+EDUCATION_COLUMNS = ('course_name', 'year_completion', 'grade', 'institution_name')
+
+
+def get_profiles(names=None):
+    """
+    Returns (id, profile_name) for every stored profile, ordered by name.
+    When `names` is given, only those profiles are returned.
+    """
+    conn = get_connection()
+    if names is None:
+        return conn.execute("SELECT id, profile_name FROM profile ORDER BY profile_name").fetchall()
+    names = list(names)
+    placeholders = ", ".join("?" * len(names))
+    return conn.execute(
+        f"SELECT id, profile_name FROM profile WHERE profile_name IN ({placeholders}) ORDER BY profile_name",
+        names
+    ).fetchall()
+
+
+# One round trip per profile: the entries come back as JSON arrays
+# [[id, col, ...], ...], each read through its (profile_id, id) index
+_LOAD_PROFILE_SQL = '''
+    SELECT p.name, p.contact_number, p.email, p.location, p.objective, p.skills,
+           p.photo_path, p.photo_blob, p.photo_thumb,
+           (SELECT json_group_array(json_array(id, title, description, duration))
+              FROM work_experience WHERE profile_id = p.id),
+           (SELECT json_group_array(json_array(id, course_name, year_completion, grade, institution_name))
+              FROM education WHERE profile_id = p.id)
+    FROM profile p WHERE p.id = ?
+'''
+
+
+def _entries(entry_type, json_rows):
+    # Sorted by id here, since SQLite doesn't promise the aggregate's order
+    return tuple(
+        entry_type(*(value or '' for value in row[1:]), row_id=row[0])
+        for row in sorted(json.loads(json_rows))
+    )
+
+
+def load_profile(profile_id):
+    """
+    Reads one profile and its education/experience rows into an immutable
+    CVProfile (what both the form and the PDF renderer consume) with a
+    single query, or returns None if the profile doesn't exist. NULL text
+    columns come back as empty strings; photo_blob/photo_thumb are the
+    stored photo and preview (bytes) or None.
+    """
+    row = get_connection().execute(_LOAD_PROFILE_SQL, (profile_id,)).fetchone()
+    if row is None:
+        return None
+    name, contact, email, location, objective, skills, photo_path = (value or '' for value in row[:7])
+    photo_blob, photo_thumb, experience_json, education_json = row[7:]
+    return CVProfile(
+        name, contact, email, location, objective, skills, photo_path or None,
+        education=_entries(EducationEntry, education_json),
+        experience=_entries(ExperienceEntry, experience_json),
+        photo_blob=photo_blob,
+        photo_thumb=photo_thumb,
+    )
+
+
+def _sync_child_rows(cursor, table, columns, profile_id, entries):
+    """
+    Makes a profile's rows in `table` match `entries`, a list of
+    (row_id, values) in form order (row_id None for entries not saved yet).
+    Only the difference is written: stored rows no entry refers to are
+    deleted, changed ones updated and new ones inserted, each kind with a
+    single executemany. Runs on the caller's cursor, inside its transaction.
+
+    Returns the row id of every entry, in order. New entries are appended,
+    so ORDER BY id keeps the form's order.
+    """
+    column_list = ", ".join(columns)
+    stored = {
+        row[0]: tuple(row[1:]) for row in cursor.execute(
+            f"SELECT id, {column_list} FROM {table} WHERE profile_id=?", (profile_id,)
+        )
+    }
+    kept, updates, inserts = set(), [], []
+    for row_id, values in entries:
+        if row_id in stored:
+            kept.add(row_id)
+            if stored[row_id] != tuple(values):
+                updates.append((*values, row_id))
+        else:
+            inserts.append((profile_id, *values))
+
+    deletes = [(row_id,) for row_id in stored if row_id not in kept]
+    if deletes:
+        cursor.executemany(f"DELETE FROM {table} WHERE id=?", deletes)
+    if updates:
+        assignments = ", ".join(f"{column}=?" for column in columns)
+        cursor.executemany(f"UPDATE {table} SET {assignments} WHERE id=?", updates)
+    new_ids = []
+    if inserts:
+        # Nothing else can insert inside this write transaction, so the new rows are exactly those above the old max
+        last_id = cursor.execute(f"SELECT coalesce(max(id), 0) FROM {table}").fetchone()[0]
+        placeholders = ", ".join("?" * (len(columns) + 1))
+        cursor.executemany(f"INSERT INTO {table} (profile_id, {column_list}) VALUES ({placeholders})", inserts)
+        new_ids = [row[0] for row in cursor.execute(f"SELECT id FROM {table} WHERE id > ? ORDER BY id", (last_id,))]
+
+    new_ids = iter(new_ids)
+    return [row_id if row_id in stored else next(new_ids) for row_id, _ in entries]
+
+
+def sync_experience(cursor, profile_id, entries):
+    """Saves work experience entries [(row_id, (title, description, duration))]. See _sync_child_rows."""
+    return _sync_child_rows(cursor, 'work_experience', EXPERIENCE_COLUMNS, profile_id, entries)
+
+
+def sync_education(cursor, profile_id, entries):
+    """Saves education entries [(row_id, (course, year, grade, institution))]. See _sync_child_rows."""
+    return _sync_child_rows(cursor, 'education', EDUCATION_COLUMNS, profile_id, entries)
@@ -1,40 +1,96 @@
 # cv_generator_widget.py
 import sqlite3
 import os 
-import io 
+import threading
+from itertools import zip_longest
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QPushButton, QScrollArea, QGroupBox, 
     QMessageBox, QFileDialog, QHBoxLayout, QLabel, QComboBox,
-    QInputDialog
+    QInputDialog, QProgressDialog
+)
+from PyQt6.QtCore import Qt, QObject, QRunnable, QSize, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QFont, QImage, QImageIOHandler, QImageReader, QPixmap
+
+# --- PDF Generation (ReportLab) and Image Processing (Pillow) ---
+# Both live in cv_pdf_renderer and are imported there on first use,
+# so opening the app (or any other page) doesn't pay for loading them.
+from cv_pdf_renderer import (
+    CVProfile, EducationEntry, ExperienceEntry, RenderCancelled, render_cv_pdf
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QPixmap
 
-# --- PDF Generation Imports ---
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Image, Table, TableStyle
+# Shared pooled connection (replaces per-call sqlite3.connect)
+from database_connection import get_connection, transaction
+from cv_database_funcs import (
+    get_profiles, load_profile, sync_education, sync_experience
 )
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.lib.colors import HexColor, black, gray
-from reportlab.lib.units import inch
+from photo_processing import normalized_photo_blobs
+
+
+# --- Background PDF Rendering ---
 
-# --- Image Processing Import (Pillow) ---
-try:
-    from PIL import Image as PILImage, ImageDraw, ImageOps
-except ImportError:
-    print("Pillow library not found. Please install it: pip install Pillow")
+class PdfRenderSignals(QObject):
+    progress = pyqtSignal(int)    # percent
+    finished = pyqtSignal(str)    # file path
+    failed = pyqtSignal(str)      # error message
+    cancelled = pyqtSignal()
+
+class PdfRenderTask(QRunnable):
+    """
+    Renders one CVProfile snapshot to a PDF off the GUI thread.
+    Setting the `cancelled` event stops the build at the next progress step.
+    """
+    def __init__(self, profile, file_path):
+        super().__init__()
+        self.profile = profile
+        self.file_path = file_path
+        self.cancelled = threading.Event()
+        self.signals = PdfRenderSignals()
+
+    def run(self):
+        try:
+            render_cv_pdf(self.profile, self.file_path,
+                          progress=self.signals.progress.emit,
+                          is_cancelled=self.cancelled.is_set)
+        except RenderCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.file_path)
 
-# Define the single database name
-DB_NAME = 'app_data.db'
 
-# --- PDF STYLES ---
-HEADING_GRAY = HexColor('#363636')
-BODY_TEXT_GRAY = HexColor('#333333')
-LINE_COLOR = HexColor('#cccccc')
-UI_BLUE = HexColor('#4A90E2') 
+# --- Background Photo Preview ---
+
+class PhotoPreviewSignals(QObject):
+    # generation, image (a null QImage if the file couldn't be read)
+    finished = pyqtSignal(int, QImage)
+
+class PhotoPreviewTask(QRunnable):
+    """
+    Decodes a photo straight to preview size off the GUI thread.
+    QImageReader.setScaledSize lets the JPEG decoder downscale while
+    decoding, so memory stays bounded by the preview size rather than the
+    photo's resolution; setAutoTransform applies the EXIF orientation.
+    """
+    def __init__(self, generation, path, bounds):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.bounds = bounds
+        self.signals = PhotoPreviewSignals()
+
+    def run(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size() # Read from the header only
+        if size.isValid():
+            width, height = size.width(), size.height()
+            if reader.transformation().value & QImageIOHandler.Transformation.TransformationRotate90.value:
+                width, height = height, width # Fit the upright image, not the stored one
+            scale = min(self.bounds.width() / width, self.bounds.height() / height, 1.0)
+            reader.setScaledSize(QSize(max(1, round(size.width() * scale)), max(1, round(size.height() * scale))))
+        self.signals.finished.emit(self.generation, reader.read())
 
 
 class CVGeneratorWidget(QWidget):
@@ -43,8 +99,17 @@ class CVGeneratorWidget(QWidget):
 
         self.work_experience_widgets = []
         self.education_widgets = []
+        self.spare_experience_widgets = [] # Hidden groups kept for reuse
+        self.spare_education_widgets = []
         self.photo_path = None
+        self.photo_blob = None  # Stored normalized photo of the loaded profile (None = must be made from photo_path)
+        self.photo_thumb = None # Its stored preview
         self.current_profile_id = None # Track the loaded profile
+        self.render_task = None # PdfRenderTask currently running, if any
+        self.render_pool = QThreadPool(self)
+        self.render_pool.setMaxThreadCount(1)
+        self.preview_generation = 0 # Bumped per preview request; older results are dropped
+        self.preview_tasks = {}     # generation -> PhotoPreviewTask still running
 
         self.setup_ui()
         
@@ -294,6 +359,16 @@ class CVGeneratorWidget(QWidget):
     # --- NEW: Method to clear all fields ---
     def _clear_all_fields(self):
         """Resets all input fields to a blank 'New CV' state."""
+        self._clear_profile_fields()
+
+        # One blank group per section; the rest are hidden for reuse
+        self._fill_experience(())
+        self._fill_education(())
+        
+        self.current_profile_id = None
+
+    def _clear_profile_fields(self):
+        """Clears the single-value fields and the photo."""
         self.name_input.clear()
         self.contact_input.clear()
         self.email_input.clear()
@@ -302,23 +377,8 @@ class CVGeneratorWidget(QWidget):
         self.skills_input.clear()
         
         self.photo_path = None
+        self.photo_blob = self.photo_thumb = None
         self.load_photo_preview(None)
-        
-        # Clear dynamic work experience fields
-        for item in self.work_experience_widgets:
-            item['group'].deleteLater()
-        self.work_experience_widgets.clear()
-        
-        # Clear dynamic education fields
-        for item in self.education_widgets:
-            item['group'].deleteLater()
-        self.education_widgets.clear()
-        
-        # Add one blank field back
-        self.add_education_fields()
-        self.add_experience_fields()
-        
-        self.current_profile_id = None
 
     # --- NEW: Method to populate the dropdown ---
     def _load_profile_list(self):
@@ -330,11 +390,7 @@ class CVGeneratorWidget(QWidget):
         self.profile_combo.clear()
         self.profile_combo.addItem("--- Create New CV ---", None) # User data is 'None'
         
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, profile_name FROM profile ORDER BY profile_name")
-        profiles = cursor.fetchall()
-        conn.close()
+        profiles = get_profiles()
         
         for profile_id, profile_name in profiles:
             self.profile_combo.addItem(profile_name, profile_id) # Store ID as user data
@@ -398,27 +454,59 @@ class CVGeneratorWidget(QWidget):
         )
         if file_name:
             self.photo_path = file_name
+            self.photo_blob = self.photo_thumb = None # Re-made from the new file on save
             self.load_photo_preview(file_name)
 
     def load_photo_preview(self, path):
-        """Loads the selected photo into the QLabel preview."""
+        """Loads the selected photo into the QLabel preview (decoded off the GUI thread)."""
+        self.preview_generation += 1
         if path and os.path.exists(path):
-            pixmap = QPixmap(path)
-            scaled_pixmap = pixmap.scaled(
-                self.photo_label.width(), 
-                self.photo_label.height(), 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.photo_label.setPixmap(scaled_pixmap)
+            self.photo_label.setText("Loading photo...")
             self.photo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            task = PhotoPreviewTask(self.preview_generation, path, self.photo_label.size())
+            task.signals.finished.connect(self._apply_photo_preview)
+            self.preview_tasks[task.generation] = task
+            QThreadPool.globalInstance().start(task)
         else:
             self.photo_label.setText("Click 'Browse' to select a photo\n(Square preferred)")
             self.photo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.photo_path = None
 
+    def show_photo_thumbnail(self, data):
+        """Shows a stored preview thumbnail (already preview-sized, so decoding is cheap)."""
+        self.preview_generation += 1 # Drops any preview still loading
+        pixmap = QPixmap()
+        pixmap.loadFromData(data)
+        self.photo_label.setPixmap(pixmap)
+        self.photo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def _apply_photo_preview(self, generation, image):
+        self.preview_tasks.pop(generation, None)
+        if generation != self.preview_generation:
+            return # A newer photo was picked meanwhile
+        if image.isNull():
+            self.photo_label.setText("Could not read this photo")
+        else:
+            self.photo_label.setPixmap(QPixmap.fromImage(image))
+        self.photo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    # --- Dynamic entry groups (recycled instead of deleted) ---
+    # Groups past the ones in use are hidden, cleared and kept in a spare
+    # list in layout order, so switching profiles only refills widgets and
+    # shows/hides the difference instead of rebuilding every group.
+
     def add_experience_fields(self):
-        experience_group = QGroupBox(f"Experience #{len(self.work_experience_widgets) + 1}")
+        if self.spare_experience_widgets:
+            item = self.spare_experience_widgets.pop(0)
+        else:
+            item = self._build_experience_group()
+        item['group'].setTitle(f"Experience #{len(self.work_experience_widgets) + 1}")
+        item['group'].show()
+        self.work_experience_widgets.append(item)
+        return item
+
+    def _build_experience_group(self):
+        experience_group = QGroupBox()
         layout = QFormLayout()
         title_input, description_input, duration_input = QLineEdit(), QTextEdit(), QLineEdit()
         duration_input.setPlaceholderText("e.g., Nov 2024 - Dec 2024")
@@ -427,13 +515,24 @@ class CVGeneratorWidget(QWidget):
         layout.addRow("Duration (Optional):", duration_input)
         experience_group.setLayout(layout)
         self.work_experience_section.addWidget(experience_group)
-        self.work_experience_widgets.append({
+        return {
             'group': experience_group, 'title': title_input,
-            'description': description_input, 'duration': duration_input
-        })
+            'description': description_input, 'duration': duration_input,
+            'row_id': None # work_experience.id once saved
+        }
 
     def add_education_fields(self):
-        education_group = QGroupBox(f"Education #{len(self.education_widgets) + 1}")
+        if self.spare_education_widgets:
+            item = self.spare_education_widgets.pop(0)
+        else:
+            item = self._build_education_group()
+        item['group'].setTitle(f"Education #{len(self.education_widgets) + 1}")
+        item['group'].show()
+        self.education_widgets.append(item)
+        return item
+
+    def _build_education_group(self):
+        education_group = QGroupBox()
         layout = QFormLayout()
         course_input, year_input, grade_input, institution_input = QLineEdit(), QLineEdit(), QLineEdit(), QLineEdit()
         year_input.setPlaceholderText("e.g., 2023-2027")
@@ -443,10 +542,55 @@ class CVGeneratorWidget(QWidget):
         layout.addRow("Institution Name:", institution_input)
         education_group.setLayout(layout)
         self.education_section_layout.addWidget(education_group)
-        self.education_widgets.append({
+        return {
             'group': education_group, 'course': course_input, 'year': year_input,
-            'grade': grade_input, 'institution': institution_input
-        })
+            'grade': grade_input, 'institution': institution_input,
+            'row_id': None # education.id once saved
+        }
+
+    @staticmethod
+    def _clear_entry(item):
+        for widget in item.values():
+            if isinstance(widget, (QLineEdit, QTextEdit)):
+                widget.clear()
+        item['row_id'] = None
+
+    def _resize_entries(self, items, spares, count, add):
+        """Shows exactly `count` groups in a section, reusing spares before building new ones."""
+        while len(items) > count:
+            item = items.pop()
+            item['group'].hide()
+            self._clear_entry(item)
+            spares.insert(0, item) # Keeps spares in layout order
+        while len(items) < count:
+            add()
+
+    def _fill_experience(self, experiences):
+        """Shows the given ExperienceEntry list (or one blank group when empty)."""
+        self._resize_entries(self.work_experience_widgets, self.spare_experience_widgets,
+                             max(1, len(experiences)), self.add_experience_fields)
+        for item, exp in zip_longest(self.work_experience_widgets, experiences):
+            if exp is None:
+                self._clear_entry(item)
+                continue
+            item['title'].setText(exp.title)
+            item['description'].setPlainText(exp.description)
+            item['duration'].setText(exp.duration)
+            item['row_id'] = exp.row_id
+
+    def _fill_education(self, educations):
+        """Shows the given EducationEntry list (or one blank group when empty)."""
+        self._resize_entries(self.education_widgets, self.spare_education_widgets,
+                             max(1, len(educations)), self.add_education_fields)
+        for item, edu in zip_longest(self.education_widgets, educations):
+            if edu is None:
+                self._clear_entry(item)
+                continue
+            item['course'].setText(edu.course)
+            item['year'].setText(edu.year)
+            item['grade'].setText(edu.grade)
+            item['institution'].setText(edu.institution)
+            item['row_id'] = edu.row_id
 
     def validate_inputs(self, check_photo=False):
         """Checks if all mandatory fields are filled."""
@@ -462,7 +606,7 @@ class CVGeneratorWidget(QWidget):
         missing = [name for name, value in mandatory_fields.items() if not value.strip()]
         
         # Photo is not mandatory to save, but is for PDF generation
-        if check_photo and not self.photo_path:
+        if check_photo and not (self.photo_path or self.photo_blob):
             missing.append("Photo")
             
         if missing:
@@ -473,6 +617,43 @@ class CVGeneratorWidget(QWidget):
             return False
         return True
 
+    def _prepare_photo_blobs(self):
+        """
+        Makes the stored photo blob and thumbnail from photo_path when the
+        photo was changed since the profile was loaded (once per new photo).
+        """
+        if self.photo_blob is not None or not self.photo_path:
+            return
+        try:
+            self.photo_blob, self.photo_thumb = normalized_photo_blobs(self.photo_path)
+        except Exception as e:
+            print(f"Could not store photo {self.photo_path}: {e}") # Exports fall back to photo_path
+
+    def _save_entries(self, cursor, profile_id):
+        """
+        Writes the experience and education entries worth saving (blank ones
+        are skipped) with the diff-based sync functions.
+        Returns [(widget dict, row id)] to record once the transaction commits.
+        """
+        experiences = [exp for exp in self.work_experience_widgets if exp['title'].text()]
+        experience_ids = sync_experience(cursor, profile_id, [
+            (exp['row_id'], (exp['title'].text(), exp['description'].toPlainText(), exp['duration'].text()))
+            for exp in experiences
+        ])
+        educations = [edu for edu in self.education_widgets if edu['course'].text() or edu['institution'].text()]
+        education_ids = sync_education(cursor, profile_id, [
+            (edu['row_id'], (edu['course'].text(), edu['year'].text(), edu['grade'].text(), edu['institution'].text()))
+            for edu in educations
+        ])
+        return list(zip(experiences, experience_ids)) + list(zip(educations, education_ids))
+
+    def _apply_row_ids(self, saved_row_ids):
+        """Remembers which row each entry was saved to; skipped (blank) entries have none."""
+        for item in self.work_experience_widgets + self.education_widgets:
+            item['row_id'] = None
+        for item, row_id in saved_row_ids:
+            item['row_id'] = row_id
+
     # --- NEW: Method to save data as a new profile ---
     def save_as_new(self):
         """Saves the current form data as a new entry in the database."""
@@ -486,50 +667,33 @@ class CVGeneratorWidget(QWidget):
             
         profile_name = profile_name.strip()
         
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        
         # Check if name already exists
-        cursor.execute("SELECT id FROM profile WHERE profile_name = ?", (profile_name,))
-        if cursor.fetchone():
+        if get_connection().execute("SELECT id FROM profile WHERE profile_name = ?", (profile_name,)).fetchone():
             QMessageBox.warning(self, "Error", "A profile with this name already exists. Please choose a different name.")
-            conn.close()
             return
 
+        self._prepare_photo_blobs()
+        new_profile_id = None
         try:
-            # Insert new profile
-            cursor.execute(
-                'INSERT INTO profile (profile_name, name, contact_number, email, location, objective, skills, photo_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
-                (profile_name, self.name_input.text(), self.contact_input.text(), self.email_input.text(),
-                 self.location_input.text(), self.objective_input.toPlainText(), 
-                 self.skills_input.toPlainText(), self.photo_path)
-            )
-            new_profile_id = cursor.lastrowid
+            with transaction() as cursor:
+                # Insert new profile
+                cursor.execute(
+                    'INSERT INTO profile (profile_name, name, contact_number, email, location, objective, skills, photo_path, photo_blob, photo_thumb) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (profile_name, self.name_input.text(), self.contact_input.text(), self.email_input.text(),
+                     self.location_input.text(), self.objective_input.toPlainText(), 
+                     self.skills_input.toPlainText(), self.photo_path, self.photo_blob, self.photo_thumb)
+                )
+                new_profile_id = cursor.lastrowid
+                
+                # Save work experience and education (all inserts for a new profile)
+                saved_row_ids = self._save_entries(cursor, new_profile_id)
             
-            # Save work experience
-            for exp in self.work_experience_widgets:
-                if exp['title'].text():
-                    cursor.execute(
-                        'INSERT INTO work_experience (profile_id, title, description, duration) VALUES (?, ?, ?, ?)',
-                        (new_profile_id, exp['title'].text(), exp['description'].toPlainText(), exp['duration'].text())
-                    )
-            # Save education
-            for edu in self.education_widgets:
-                if edu['course'].text() or edu['institution'].text():
-                    cursor.execute(
-                        'INSERT INTO education (profile_id, course_name, year_completion, grade, institution_name) VALUES (?, ?, ?, ?, ?)',
-                        (new_profile_id, edu['course'].text(), edu['year'].text(), edu['grade'].text(), edu['institution'].text())
-                    )
-            
-            conn.commit()
+            self._apply_row_ids(saved_row_ids)
             self.current_profile_id = new_profile_id
             QMessageBox.information(self, "Success", f"Profile '{profile_name}' saved successfully!")
             
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to save profile: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
             
         self._load_profile_list() # Refresh dropdown
         # Find and select the newly saved item
@@ -550,95 +714,57 @@ class CVGeneratorWidget(QWidget):
             return
             
         # If we have a current_profile_id, UPDATE it
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
+        self._prepare_photo_blobs()
         try:
-            cursor.execute(
-                'UPDATE profile SET name=?, contact_number=?, email=?, location=?, objective=?, skills=?, photo_path=? WHERE id=?',
-                (self.name_input.text(), self.contact_input.text(), self.email_input.text(),
-                 self.location_input.text(), self.objective_input.toPlainText(), 
-                 self.skills_input.toPlainText(), self.photo_path, self.current_profile_id)
-            )
-            
-            # Nuke and pave: Delete old entries and insert current ones
-            cursor.execute("DELETE FROM work_experience WHERE profile_id=?", (self.current_profile_id,))
-            for exp in self.work_experience_widgets:
-                if exp['title'].text():
-                    cursor.execute(
-                        'INSERT INTO work_experience (profile_id, title, description, duration) VALUES (?, ?, ?, ?)',
-                        (self.current_profile_id, exp['title'].text(), exp['description'].toPlainText(), exp['duration'].text())
-                    )
-                    
-            cursor.execute("DELETE FROM education WHERE profile_id=?", (self.current_profile_id,))
-            for edu in self.education_widgets:
-                if edu['course'].text() or edu['institution'].text():
-                    cursor.execute(
-                        'INSERT INTO education (profile_id, course_name, year_completion, grade, institution_name) VALUES (?, ?, ?, ?, ?)',
-                        (self.current_profile_id, edu['course'].text(), edu['year'].text(), edu['grade'].text(), edu['institution'].text())
-                    )
+            with transaction() as cursor:
+                cursor.execute(
+                    'UPDATE profile SET name=?, contact_number=?, email=?, location=?, objective=?, skills=?, photo_path=?, photo_blob=?, photo_thumb=? WHERE id=?',
+                    (self.name_input.text(), self.contact_input.text(), self.email_input.text(),
+                     self.location_input.text(), self.objective_input.toPlainText(), 
+                     self.skills_input.toPlainText(), self.photo_path, self.photo_blob, self.photo_thumb,
+                     self.current_profile_id)
+                )
+                
+                # Only the entries that changed are written
+                saved_row_ids = self._save_entries(cursor, self.current_profile_id)
             
-            conn.commit()
+            self._apply_row_ids(saved_row_ids)
             QMessageBox.information(self, "Success", "Your changes have been saved successfully!")
             
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to update profile: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
 
     # --- MODIFIED: load_data now loads a specific profile ID ---
     def load_data(self, profile_id):
         """Loads all data for a specific profile_id into the form."""
-        
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        
-        # Clear all fields first
-        self._clear_all_fields()
-
-        # Load profile
-        cursor.execute("SELECT name, contact_number, email, location, objective, skills, photo_path FROM profile WHERE id=?", (profile_id,))
-        profile = cursor.fetchone()
-        if profile:
-            self.name_input.setText(profile[0])
-            self.contact_input.setText(profile[1])
-            self.email_input.setText(profile[2])
-            self.location_input.setText(profile[3])
-            self.objective_input.setPlainText(profile[4])
-            self.skills_input.setPlainText(profile[5])
-            self.photo_path = profile[6]
-            self.load_photo_preview(self.photo_path) 
-
-        # Load work experience
-        cursor.execute("SELECT title, description, duration FROM work_experience WHERE profile_id=?", (profile_id,))
-        experiences = cursor.fetchall()
-        for item in self.work_experience_widgets: item['group'].deleteLater()
-        self.work_experience_widgets.clear()
-        if not experiences: self.add_experience_fields()
-        else:
-            for exp in experiences:
-                self.add_experience_fields()
-                last_exp_widget = self.work_experience_widgets[-1]
-                last_exp_widget['title'].setText(exp[0])
-                last_exp_widget['description'].setPlainText(exp[1])
-                last_exp_widget['duration'].setText(exp[2])
-
-        # Load education
-        cursor.execute("SELECT course_name, year_completion, grade, institution_name FROM education WHERE profile_id=?", (profile_id,))
-        educations = cursor.fetchall()
-        for item in self.education_widgets: item['group'].deleteLater()
-        self.education_widgets.clear()
-        if not educations: self.add_education_fields()
-        else:
-            for edu in educations:
-                self.add_education_fields()
-                last_edu_widget = self.education_widgets[-1]
-                last_edu_widget['course'].setText(edu[0])
-                last_edu_widget['year'].setText(edu[1])
-                last_edu_widget['grade'].setText(edu[2])
-                last_edu_widget['institution'].setText(edu[3])
-        
-        conn.close()
+        profile = load_profile(profile_id)
+
+        # Repaint once at the end, not once per refilled widget
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            # Clear all fields first
+            self._clear_profile_fields()
+            if profile:
+                self.name_input.setText(profile.name)
+                self.contact_input.setText(profile.contact)
+                self.email_input.setText(profile.email)
+                self.location_input.setText(profile.location)
+                self.objective_input.setPlainText(profile.objective)
+                self.skills_input.setPlainText(profile.skills)
+                self.photo_path = profile.photo_path
+                self.photo_blob = profile.photo_blob
+                self.photo_thumb = profile.photo_thumb
+                if self.photo_thumb:
+                    self.show_photo_thumbnail(self.photo_thumb)
+                else:
+                    self.load_photo_preview(self.photo_path)
+
+            # Load work experience and education into recycled groups
+            self._fill_experience(profile.experience if profile else ())
+            self._fill_education(profile.education if profile else ())
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
         self.current_profile_id = profile_id
         # QMessageBox.information(self, "Success", "Profile loaded successfully!")
 
@@ -659,15 +785,12 @@ class CVGeneratorWidget(QWidget):
             return
             
         try:
-            conn = sqlite3.connect(DB_NAME)
-            cursor = conn.cursor()
-            # The "ON DELETE CASCADE" in the database schema should handle
-            # deleting work_experience and education, but we can also be explicit
-            cursor.execute("DELETE FROM work_experience WHERE profile_id=?", (self.current_profile_id,))
-            cursor.execute("DELETE FROM education WHERE profile_id=?", (self.current_profile_id,))
-            cursor.execute("DELETE FROM profile WHERE id=?", (self.current_profile_id,))
-            conn.commit()
-            conn.close()
+            with transaction() as cursor:
+                # The "ON DELETE CASCADE" in the database schema should handle
+                # deleting work_experience and education, but we can also be explicit
+                cursor.execute("DELETE FROM work_experience WHERE profile_id=?", (self.current_profile_id,))
+                cursor.execute("DELETE FROM education WHERE profile_id=?", (self.current_profile_id,))
+                cursor.execute("DELETE FROM profile WHERE id=?", (self.current_profile_id,))
             
             QMessageBox.information(self, "Success", f"Profile '{profile_name}' has been deleted.")
             
@@ -677,24 +800,28 @@ class CVGeneratorWidget(QWidget):
         except sqlite3.Error as e:
             QMessageBox.critical(self, "Database Error", f"Failed to delete profile: {e}")
 
-    # --- (Unchanged) Method for creating circular image ---
-    def _create_rounded_image(self, image_path, size):
-        """Helper to create a circular image using Pillow."""
-        try:
-            img = PILImage.open(image_path).convert("RGBA")
-            img = ImageOps.fit(img, size, PILImage.Resampling.LANCZOS)
-            mask = PILImage.new('L', size, 0)
-            draw = ImageDraw.Draw(mask)
-            draw.ellipse((0, 0) + size, fill=255)
-            img.putalpha(mask)
-            temp_file = io.BytesIO()
-            img.save(temp_file, format='PNG')
-            temp_file.seek(0)
-            return temp_file
-        except Exception:
-            return image_path 
-
-    # --- (Unchanged) Method for PDF Generation ---
+    def _snapshot(self):
+        """Copies the form into an immutable CVProfile the render worker can own."""
+        return CVProfile(
+            name=self.name_input.text(),
+            contact=self.contact_input.text(),
+            email=self.email_input.text(),
+            location=self.location_input.text(),
+            objective=self.objective_input.toPlainText(),
+            skills=self.skills_input.toPlainText(),
+            photo_path=self.photo_path,
+            photo_blob=self.photo_blob,
+            education=tuple(
+                EducationEntry(edu['course'].text(), edu['year'].text(), edu['grade'].text(), edu['institution'].text())
+                for edu in self.education_widgets
+            ),
+            experience=tuple(
+                ExperienceEntry(exp['title'].text(), exp['description'].toPlainText(), exp['duration'].text())
+                for exp in self.work_experience_widgets
+            ),
+        )
+
+    # --- Method for PDF Generation (rendered on a worker thread) ---
     def generate_pdf(self):
         # 1. VALIDATION
         if not self.validate_inputs(check_photo=True):
@@ -703,150 +830,37 @@ class CVGeneratorWidget(QWidget):
         file_path, _ = QFileDialog.getSaveFileName(self, "Save CV", f"{self.name_input.text().replace(' ', '_')}_CV.pdf", "PDF Files (*.pdf)")
         if not file_path:
             return
-            
-        doc = SimpleDocTemplate(file_path, pagesize=letter, leftMargin=0.5*inch, rightMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
-        styles = getSampleStyleSheet()
-        story = []
-
-        # 2. DEFINE STYLES
-        styles.add(ParagraphStyle(name='NameStyle', fontName='Helvetica-Bold', fontSize=28, alignment=TA_LEFT, textColor=UI_BLUE, leading=34))
-        styles.add(ParagraphStyle(name='ContactStyle', fontName='Helvetica', fontSize=10, alignment=TA_LEFT, textColor=BODY_TEXT_GRAY, leading=12))
-        styles.add(ParagraphStyle(name='HeadingStyle', fontName='Helvetica-Bold', fontSize=11, spaceBefore=12, spaceAfter=2, textColor=HEADING_GRAY))
-        styles.add(ParagraphStyle(name='BodyStyle', fontName='Helvetica', fontSize=10, leading=14, alignment=TA_LEFT, textColor=BODY_TEXT_GRAY))
-        styles.add(ParagraphStyle(name='ItalicBodyStyle', parent=styles['BodyStyle'], fontName='Helvetica-Oblique'))
-        styles.add(ParagraphStyle(name='JobTitleStyle', fontName='Helvetica-Bold', fontSize=10, textColor=BODY_TEXT_GRAY))
-        styles.add(ParagraphStyle(name='InstitutionStyle', fontName='Helvetica', fontSize=10, textColor=BODY_TEXT_GRAY))
-        styles.add(ParagraphStyle(name='DateStyle', fontName='Helvetica', fontSize=10, textColor=BODY_TEXT_GRAY, alignment=TA_RIGHT))
-        styles.add(ParagraphStyle(name='BulletStyle', fontName='Helvetica', fontSize=10, leading=14, alignment=TA_LEFT, textColor=BODY_TEXT_GRAY, leftIndent=15))
-
-        # 3. PREPARE TOP SECTION
-        rounded_image_file = self._create_rounded_image(
-            self.photo_path, 
-            size=(int(1.25*inch), int(1.25*inch))
-        )
-        img_flowable = Image(rounded_image_file, width=1.25*inch, height=1.25*inch)
-        img_flowable.hAlign = 'LEFT'
-        
-        name_para = Paragraph(self.name_input.text(), styles['NameStyle'])
-        contact_info = " • ".join(filter(None, [self.email_input.text(), self.contact_input.text(), self.location_input.text()]))
-        contact_para = Paragraph(contact_info, styles['ContactStyle'])
-        
-        # Nested Table with 3 Rows
-        details_table_data = [
-            [name_para],           # Row 1: Name
-            [Spacer(1, 4)],        # Row 2: A 4-point vertical spacer
-            [contact_para]         # Row 3: Contact
-        ]
-        details_table = Table(details_table_data, colWidths=[6*inch])
-        details_table.setStyle(TableStyle([
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ]))
-
-        # Main Top Table
-        top_table_data = [
-            [img_flowable, details_table] 
-        ]
-        top_table = Table(top_table_data, colWidths=[1.5*inch, 6*inch])
-        top_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'), 
-            ('LEFTPADDING', (0, 0), (-1, -1), 0),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-            ('TOPPADDING', (0, 0), (-1, -1), 0),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ]))
-        
-        story.append(top_table)
-        story.append(Spacer(1, 0.25*inch))
-        
-        # 4. CAREER OBJECTIVE
-        objective = self.objective_input.toPlainText()
-        if objective:
-            story.append(Paragraph("CAREER OBJECTIVE", styles['HeadingStyle']))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=LINE_COLOR, spaceAfter=6))
-            story.append(Paragraph(objective, styles['ItalicBodyStyle']))
-
-        # 5. SKILLS
-        skills = self.skills_input.toPlainText()
-        if skills:
-            story.append(Paragraph("SKILLS", styles['HeadingStyle']))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=LINE_COLOR, spaceAfter=6))
-            skill_items = [f"• {s.strip()}" for s in skills.replace(',', '\n').split('\n') if s.strip()]
-            if not skill_items:
-                pass 
-            elif len(skill_items) > 6:
-                num_cols = 3 if len(skill_items) > 14 else 2
-                num_rows = -(-len(skill_items) // num_cols) 
-                table_data = [[] for _ in range(num_rows)]
-                for i, item in enumerate(skill_items):
-                    row_index = i % num_rows
-                    table_data[row_index].append(Paragraph(item, styles['BodyStyle']))
-                for row in table_data:
-                    while len(row) < num_cols:
-                        row.append("")
-                skill_table = Table(table_data, colWidths=[(doc.width / num_cols)] * num_cols)
-                skill_table.setStyle(TableStyle([
-                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 5),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                ]))
-                story.append(skill_table)
-            else:
-                skill_list = "<br/>".join(skill_items)
-                story.append(Paragraph(skill_list, styles['BodyStyle']))
-
-        # 6. EDUCATION
-        if any(edu['course'].text() or edu['institution'].text() for edu in self.education_widgets):
-            story.append(Paragraph("EDUCATION", styles['HeadingStyle']))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=LINE_COLOR, spaceAfter=6))
-            for edu in self.education_widgets:
-                if edu['course'].text() or edu['institution'].text():
-                    left_cell_content = []
-                    p_course = Paragraph(f"<b>{edu['course'].text()}</b>", styles['BodyStyle'])
-                    left_cell_content.append(p_course)
-                    if edu['institution'].text():
-                        p_institution = Paragraph(edu['institution'].text(), styles['InstitutionStyle'])
-                        left_cell_content.append(p_institution)
-                    if edu['grade'].text():
-                        p_grade = Paragraph(edu['grade'].text(), styles['InstitutionStyle'])
-                        left_cell_content.append(p_grade)
-                    p_year = Paragraph(edu['year'].text(), styles['DateStyle'])
-                    edu_table_data = [[left_cell_content, p_year]]
-                    edu_table = Table(edu_table_data, colWidths=['*', 2*inch])
-                    edu_table.setStyle(TableStyle([
-                        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                    ]))
-                    story.append(edu_table)
-                    story.append(Spacer(1, 10))
-
-        # 7. WORK EXPERIENCE
-        if any(exp['title'].text() for exp in self.work_experience_widgets):
-            story.append(Paragraph("WORK EXPERIENCE", styles['HeadingStyle']))
-            story.append(HRFlowable(width="100%", thickness=0.5, color=LINE_COLOR, spaceAfter=6))
-            for exp in self.work_experience_widgets:
-                if exp['title'].text():
-                    p_title = Paragraph(exp['title'].text(), styles['JobTitleStyle'])
-                    p_duration = Paragraph(exp['duration'].text(), styles['DateStyle'])
-                    row1 = Table([[p_title, p_duration]], colWidths=['*', 2*inch])
-                    row1.setStyle(TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')]))
-                    story.append(row1)
-                    desc_text = exp['description'].toPlainText().replace('\n', '<br/>• ')
-                    if not desc_text.startswith('• ') and desc_text:
-                        desc_text = '• ' + desc_text
-                    story.append(Paragraph(desc_text, styles['BulletStyle']))
-                    story.append(Spacer(1, 12))
-        
-        # 9. BUILD THE PDF
-        try:
-            doc.build(story)
-            QMessageBox.information(self, "Success", f"CV successfully generated at:\n{file_path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred while generating the PDF: {e}")
-        finally:
-            if isinstance(rounded_image_file, io.BytesIO):
-                rounded_image_file.close()
\ No newline at end of file
+
+        task = PdfRenderTask(self._snapshot(), file_path)
+
+        progress_dialog = QProgressDialog("Generating PDF...", "Cancel", 0, 100, self)
+        progress_dialog.setWindowTitle("Generate PDF")
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(300) # Quick renders never flash a dialog
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setAutoReset(False)
+        progress_dialog.canceled.connect(task.cancelled.set)
+
+        def done():
+            progress_dialog.canceled.disconnect(task.cancelled.set)
+            progress_dialog.close()
+            progress_dialog.deleteLater()
+            self.render_task = None
+            self.generate_pdf_btn.setEnabled(True)
+
+        def on_finished(path):
+            done()
+            QMessageBox.information(self, "Success", f"CV successfully generated at:\n{path}")
+
+        def on_failed(message):
+            done()
+            QMessageBox.critical(self, "Error", f"An error occurred while generating the PDF: {message}")
+
+        task.signals.progress.connect(progress_dialog.setValue)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(on_failed)
+        task.signals.cancelled.connect(done)
+
+        self.generate_pdf_btn.setEnabled(False)
+        self.render_task = task # Keeps the signals object alive until delivery
+        self.render_pool.start(task)
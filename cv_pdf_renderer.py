@@ -0,0 +1,259 @@
+# cv_pdf_renderer.py
+import io
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+from photo_processing import rounded_photo_png
+
+# ReportLab and Pillow are imported inside the functions that use them,
+# so importing this module (e.g. from the GUI) stays cheap.
+
+# --- PDF STYLES --- (hex strings; converted with HexColor when pdf_styles() builds the registry)
+HEADING_GRAY = '#363636'
+BODY_TEXT_GRAY = '#333333'
+LINE_COLOR = '#cccccc'
+UI_BLUE = '#4A90E2'
+
+# --- Immutable CV snapshot ---
+# Everything the renderer needs, detached from the form widgets, so it can
+# be handed to another thread safely.
+# row_id is the entry's database id when it was loaded from one (None otherwise)
+ExperienceEntry = namedtuple('ExperienceEntry', ['title', 'description', 'duration', 'row_id'], defaults=(None,))
+EducationEntry = namedtuple('EducationEntry', ['course', 'year', 'grade', 'institution', 'row_id'], defaults=(None,))
+CVProfile = namedtuple('CVProfile', [
+    'name', 'contact', 'email', 'location', 'objective', 'skills', 'photo_path',
+    'education',   # tuple of EducationEntry
+    'experience',  # tuple of ExperienceEntry
+    'photo_blob',  # stored normalized photo (bytes), preferred over photo_path
+    'photo_thumb', # stored preview of it (bytes), used by the form only
+], defaults=(None, None))
+
+
+# Every style a CV uses. Built once per process by pdf_styles(); the
+# ParagraphStyle/TableStyle objects are only ever read, so exports share them.
+PdfStyles = namedtuple('PdfStyles', [
+    'paragraph',       # read-only mapping of style name -> ParagraphStyle
+    'line_color',      # section rule color
+    'details_table', 'top_table', 'skill_table', 'education_row', 'experience_row',
+])
+
+
+@lru_cache(maxsize=None)
+def pdf_styles():
+    """Builds the shared PdfStyles on first use (this is where ReportLab is imported)."""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.enums import TA_LEFT, TA_RIGHT
+    from reportlab.lib.colors import HexColor
+    heading_gray, body_text_gray = HexColor(HEADING_GRAY), HexColor(BODY_TEXT_GRAY)
+    line_color, ui_blue = HexColor(LINE_COLOR), HexColor(UI_BLUE)
+
+    body_style = ParagraphStyle(name='BodyStyle', fontName='Helvetica', fontSize=10, leading=14, alignment=TA_LEFT, textColor=body_text_gray)
+    paragraph_styles = [
+        ParagraphStyle(name='NameStyle', fontName='Helvetica-Bold', fontSize=28, alignment=TA_LEFT, textColor=ui_blue, leading=34),
+        ParagraphStyle(name='ContactStyle', fontName='Helvetica', fontSize=10, alignment=TA_LEFT, textColor=body_text_gray, leading=12),
+        ParagraphStyle(name='HeadingStyle', fontName='Helvetica-Bold', fontSize=11, spaceBefore=12, spaceAfter=2, textColor=heading_gray),
+        body_style,
+        ParagraphStyle(name='ItalicBodyStyle', parent=body_style, fontName='Helvetica-Oblique'),
+        ParagraphStyle(name='JobTitleStyle', fontName='Helvetica-Bold', fontSize=10, textColor=body_text_gray),
+        ParagraphStyle(name='InstitutionStyle', fontName='Helvetica', fontSize=10, textColor=body_text_gray),
+        ParagraphStyle(name='DateStyle', fontName='Helvetica', fontSize=10, textColor=body_text_gray, alignment=TA_RIGHT),
+        ParagraphStyle(name='BulletStyle', fontName='Helvetica', fontSize=10, leading=14, alignment=TA_LEFT, textColor=body_text_gray, leftIndent=15),
+    ]
+    no_padding = [
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ]
+    return PdfStyles(
+        paragraph=MappingProxyType({style.name: style for style in paragraph_styles}),
+        line_color=line_color,
+        details_table=TableStyle(no_padding),
+        top_table=TableStyle([('VALIGN', (0, 0), (-1, -1), 'MIDDLE')] + no_padding),
+        skill_table=TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 5),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ]),
+        education_row=TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+        ]),
+        experience_row=TableStyle([('VALIGN', (0, 0), (-1, -1), 'TOP')]),
+    )
+
+
+class RenderCancelled(Exception):
+    """Raised inside render_cv_pdf when is_cancelled() turns true."""
+
+
+def create_rounded_image(source, size):
+    """Helper to create a circular image (cached by photo content and size)."""
+    # On failure the photo is embedded as-is (not circular)
+    unprocessed = source if isinstance(source, str) else io.BytesIO(source)
+    try:
+        return io.BytesIO(rounded_photo_png(source, size))
+    except ImportError:
+        print("Pillow library not found. Please install it: pip install Pillow")
+        return unprocessed
+    except Exception:
+        return unprocessed
+
+
+def render_cv_pdf(profile, file_path, progress=None, is_cancelled=None):
+    """
+    Renders a CVProfile to a PDF at file_path. Touches no Qt objects.
+
+    progress(percent) is called as the document is laid out, and
+    is_cancelled() is polled at the same points; when it returns True the
+    build stops with RenderCancelled.
+    """
+    def report(percent):
+        if is_cancelled is not None and is_cancelled():
+            raise RenderCancelled()
+        if progress is not None:
+            progress(percent)
+
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import (
+        SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Image, Table
+    )
+    from reportlab.lib.units import inch
+
+    report(0)
+    doc = SimpleDocTemplate(file_path, pagesize=letter, leftMargin=0.5*inch, rightMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    # 2. STYLES (built once per process, see pdf_styles)
+    registry = pdf_styles()
+    styles = registry.paragraph
+    line_color = registry.line_color
+    story = []
+
+    # 3. PREPARE TOP SECTION
+    # Stored profiles may have no photo (only the GUI insists on one)
+    rounded_image_file = None
+    photo_source = profile.photo_blob or profile.photo_path
+    if photo_source:
+        rounded_image_file = create_rounded_image(
+            photo_source,
+            size=(int(1.25*inch), int(1.25*inch))
+        )
+    try:
+        report(10)
+        img_flowable = ""
+        if rounded_image_file is not None:
+            img_flowable = Image(rounded_image_file, width=1.25*inch, height=1.25*inch)
+            img_flowable.hAlign = 'LEFT'
+
+        name_para = Paragraph(profile.name, styles['NameStyle'])
+        contact_info = " • ".join(filter(None, [profile.email, profile.contact, profile.location]))
+        contact_para = Paragraph(contact_info, styles['ContactStyle'])
+
+        # Nested Table with 3 Rows
+        details_table_data = [
+            [name_para],           # Row 1: Name
+            [Spacer(1, 4)],        # Row 2: A 4-point vertical spacer
+            [contact_para]         # Row 3: Contact
+        ]
+        details_table = Table(details_table_data, colWidths=[6*inch])
+        details_table.setStyle(registry.details_table)
+
+        # Main Top Table
+        top_table_data = [
+            [img_flowable, details_table]
+        ]
+        top_table = Table(top_table_data, colWidths=[1.5*inch, 6*inch])
+        top_table.setStyle(registry.top_table)
+
+        story.append(top_table)
+        story.append(Spacer(1, 0.25*inch))
+
+        # 4. CAREER OBJECTIVE
+        objective = profile.objective
+        if objective:
+            story.append(Paragraph("CAREER OBJECTIVE", styles['HeadingStyle']))
+            story.append(HRFlowable(width="100%", thickness=0.5, color=line_color, spaceAfter=6))
+            story.append(Paragraph(objective, styles['ItalicBodyStyle']))
+
+        # 5. SKILLS
+        skills = profile.skills
+        if skills:
+            story.append(Paragraph("SKILLS", styles['HeadingStyle']))
+            story.append(HRFlowable(width="100%", thickness=0.5, color=line_color, spaceAfter=6))
+            skill_items = [f"• {s.strip()}" for s in skills.replace(',', '\n').split('\n') if s.strip()]
+            if not skill_items:
+                pass
+            elif len(skill_items) > 6:
+                num_cols = 3 if len(skill_items) > 14 else 2
+                num_rows = -(-len(skill_items) // num_cols)
+                table_data = [[] for _ in range(num_rows)]
+                for i, item in enumerate(skill_items):
+                    row_index = i % num_rows
+                    table_data[row_index].append(Paragraph(item, styles['BodyStyle']))
+                for row in table_data:
+                    while len(row) < num_cols:
+                        row.append("")
+                skill_table = Table(table_data, colWidths=[(doc.width / num_cols)] * num_cols)
+                skill_table.setStyle(registry.skill_table)
+                story.append(skill_table)
+            else:
+                skill_list = "<br/>".join(skill_items)
+                story.append(Paragraph(skill_list, styles['BodyStyle']))
+
+        # 6. EDUCATION
+        if any(edu.course or edu.institution for edu in profile.education):
+            story.append(Paragraph("EDUCATION", styles['HeadingStyle']))
+            story.append(HRFlowable(width="100%", thickness=0.5, color=line_color, spaceAfter=6))
+            for edu in profile.education:
+                if edu.course or edu.institution:
+                    left_cell_content = []
+                    p_course = Paragraph(f"<b>{edu.course}</b>", styles['BodyStyle'])
+                    left_cell_content.append(p_course)
+                    if edu.institution:
+                        p_institution = Paragraph(edu.institution, styles['InstitutionStyle'])
+                        left_cell_content.append(p_institution)
+                    if edu.grade:
+                        p_grade = Paragraph(edu.grade, styles['InstitutionStyle'])
+                        left_cell_content.append(p_grade)
+                    p_year = Paragraph(edu.year, styles['DateStyle'])
+                    edu_table_data = [[left_cell_content, p_year]]
+                    edu_table = Table(edu_table_data, colWidths=['*', 2*inch])
+                    edu_table.setStyle(registry.education_row)
+                    story.append(edu_table)
+                    story.append(Spacer(1, 10))
+
+        # 7. WORK EXPERIENCE
+        if any(exp.title for exp in profile.experience):
+            story.append(Paragraph("WORK EXPERIENCE", styles['HeadingStyle']))
+            story.append(HRFlowable(width="100%", thickness=0.5, color=line_color, spaceAfter=6))
+            for exp in profile.experience:
+                if exp.title:
+                    p_title = Paragraph(exp.title, styles['JobTitleStyle'])
+                    p_duration = Paragraph(exp.duration, styles['DateStyle'])
+                    row1 = Table([[p_title, p_duration]], colWidths=['*', 2*inch])
+                    row1.setStyle(registry.experience_row)
+                    story.append(row1)
+                    desc_text = exp.description.replace('\n', '<br/>• ')
+                    if not desc_text.startswith('• ') and desc_text:
+                        desc_text = '• ' + desc_text
+                    story.append(Paragraph(desc_text, styles['BulletStyle']))
+                    story.append(Spacer(1, 12))
+
+        # 9. BUILD THE PDF
+        # ReportLab reports SIZE_EST (flowable count) then PROGRESS (flowables done)
+        total = [max(len(story), 1)]
+        def on_progress(kind, value):
+            if kind == 'SIZE_EST':
+                total[0] = max(value, 1)
+            elif kind == 'PROGRESS':
+                report(10 + min(89, int(89 * value / total[0])))
+        doc.setProgressCallBack(on_progress)
+        doc.build(story)
+        if progress is not None:
+            progress(100) # Already written; too late to cancel
+    finally:
+        if isinstance(rounded_image_file, io.BytesIO):
+            rounded_image_file.close()
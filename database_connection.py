@@ -0,0 +1,132 @@
+# database_connection.py
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Define the single database name
+DB_NAME = 'app_data.db'
+
+# How many prepared statements each connection keeps compiled.
+# The default (128) is shared by every query in the app, so raise it.
+STATEMENT_CACHE_SIZE = 256
+
+# Pragmas applied once per connection.
+# WAL lets readers keep going while a write is committing, and
+# synchronous=NORMAL is the recommended (and much cheaper) pairing for it.
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",     # ~16 MB page cache
+    "PRAGMA mmap_size=134217728",   # 128 MB memory-mapped reads
+    "PRAGMA busy_timeout=5000",
+)
+
+# Change events announced by the data modules
+ROW_ADDED = 'added'
+ROW_UPDATED = 'updated'
+ROW_DELETED = 'deleted'
+# Sent with row_id None after a bulk change; listeners should reload everything
+ROWS_RESET = 'reset'
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_local = threading.local()
+_all_connections = []
+_lock = threading.Lock()
+
+
+def _open_connection():
+    conn = sqlite3.connect(DB_NAME, cached_statements=STATEMENT_CACHE_SIZE)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    with _lock:
+        _all_connections.append(conn)
+    return conn
+
+
+def get_connection():
+    """
+    Returns the long-lived connection for the calling thread.
+
+    sqlite3 connections can't be shared across threads, so every thread
+    gets its own, opened on first use and reused for every later call.
+    Statements run through it stay in the connection's statement cache,
+    so repeated queries skip re-parsing.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _open_connection()
+        _local.conn = conn
+    return conn
+
+
+@contextmanager
+def transaction():
+    """
+    Yields a cursor inside an explicit transaction.
+    Commits on success, rolls back if the block raises.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("BEGIN")
+    try:
+        yield cursor
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def fts_query(text):
+    """
+    Turns free text typed by the user into an FTS5 MATCH expression.
+    Every word becomes a quoted prefix term ("wor"*), so partial words
+    match while typing and FTS5 operators in the input are neutralised.
+    Returns None if the text contains no searchable words.
+    """
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def close_all():
+    """Closes every pooled connection (call on application exit)."""
+    with _lock:
+        connections = list(_all_connections)
+        _all_connections.clear()
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.ProgrammingError:
+            pass  # Owned by another thread that is already gone
+    _local.__dict__.pop('conn', None)
+
+
+class ChangeNotifier:
+    """
+    A minimal observer list. Data modules call notify(event, row_id) after
+    a write commits, so views can patch the one affected row instead of
+    re-querying everything.
+    """
+    def __init__(self):
+        self._listeners = []
+
+    def subscribe(self, listener):
+        """Registers listener(event, row_id)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def notify(self, event, row_id):
+        for listener in list(self._listeners):
+            listener(event, row_id)
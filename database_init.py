@@ -1,36 +1,66 @@
 # database_init.py
-import sqlite3
+import time
+from collections import namedtuple
+from database_connection import get_connection, transaction
+from photo_processing import normalized_photo_blobs
 
-# Define the single database name
-DB_NAME = 'app_data.db'
+# Rows touched per transaction by a backfill, so no single write holds the DB lock for long
+BACKFILL_CHUNK_SIZE = 5000
 
-def initialize_all_databases():
+# version:  stored in PRAGMA user_version once the migration has fully run
+# schema:   function(cursor) run in one transaction; must be safe to re-run
+# backfill: optional function(conn) -> iterator of (rows_done, rows_total),
+#           committing one chunk per step; must also be safe to re-run
+Migration = namedtuple('Migration', ['version', 'description', 'schema', 'backfill'])
+
+
+def _column_names(cursor, table):
+    return [row[1] for row in cursor.execute(f"PRAGMA table_info({table})")]
+
+
+def _backfill_in_chunks(conn, table, statement):
     """
-    Initializes the one master database (app_data.db)
-    and creates all necessary tables.
+    Runs `statement` over `table` in id ranges of BACKFILL_CHUNK_SIZE,
+    committing after each range. The statement gets :lo and :hi bounds
+    (lo <= id < hi). Yields (rows_done, rows_total) after every range that
+    has rows, counting rows rather than ids, so gaps left by deletes don't
+    inflate the numbers.
     """
-    print("Initializing master database...")
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
+    low, high, total = conn.execute(f"SELECT min(id), max(id), count(*) FROM {table}").fetchone()
+    if low is None:
+        return
+    done = 0
+    for start in range(low, high + 1, BACKFILL_CHUNK_SIZE):
+        bounds = {'lo': start, 'hi': start + BACKFILL_CHUNK_SIZE}
+        with transaction() as cursor:
+            cursor.execute(statement, bounds)
+            rows = cursor.execute(f"SELECT count(*) FROM {table} WHERE id >= :lo AND id < :hi", bounds).fetchone()[0]
+        if rows:
+            done += rows
+            yield done, total
 
+
+# --- Migration 1: Base tables ---
+
+def _create_base_tables(cursor):
     # --- CV Generator Tables (SCHEMA CHANGED) ---
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS profile (
-            id INTEGER PRIMARY KEY AUTOINCREMENT, 
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
             profile_name TEXT NOT NULL UNIQUE,
-            name TEXT, 
-            contact_number TEXT, 
+            name TEXT,
+            contact_number TEXT,
             email TEXT,
-            location TEXT, 
-            objective TEXT, 
+            location TEXT,
+            objective TEXT,
             skills TEXT,
-            photo_path TEXT 
+            photo_path TEXT
         )
     ''')
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS work_experience (
             id INTEGER PRIMARY KEY AUTOINCREMENT, profile_id INTEGER, title TEXT,
-            description TEXT, duration TEXT, 
+            description TEXT, duration TEXT,
             FOREIGN KEY (profile_id) REFERENCES profile (id) ON DELETE CASCADE
         )
     ''')
@@ -63,7 +93,224 @@ def initialize_all_databases():
             content TEXT NOT NULL
         )
     ''')
-    
-    conn.commit()
-    conn.close()
-    print("Master database initialized.")
\ No newline at end of file
+
+
+# --- Migration 2: Notes full-text index (FTS5, kept in sync by triggers) ---
+
+def _create_notes_fts(cursor):
+    # Dropped first so a half-built index from an interrupted run is rebuilt cleanly
+    for trigger in ('notes_fts_ai', 'notes_fts_ad', 'notes_fts_au'):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    cursor.execute("DROP TABLE IF EXISTS notes_fts")
+    cursor.execute('''
+        CREATE VIRTUAL TABLE notes_fts USING fts5(
+            title, content,
+            content='notes', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER notes_fts_ai AFTER INSERT ON notes BEGIN
+            INSERT INTO notes_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER notes_fts_ad AFTER DELETE ON notes BEGIN
+            INSERT INTO notes_fts(notes_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        END
+    ''')
+    # Only title/content changes touch the index (not e.g. the stored preview)
+    cursor.execute('''
+        CREATE TRIGGER notes_fts_au AFTER UPDATE OF title, content ON notes BEGIN
+            INSERT INTO notes_fts(notes_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+            INSERT INTO notes_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END
+    ''')
+
+def _backfill_notes_fts(conn):
+    return _backfill_in_chunks(conn, 'notes', '''
+        INSERT INTO notes_fts(rowid, title, content)
+        SELECT id, title, content FROM notes WHERE id >= :lo AND id < :hi
+    ''')
+
+
+# --- Migration 3: Stored note previews for keyset paging ---
+
+def _add_notes_preview(cursor):
+    # Stored card preview, so the grid never has to read full note content
+    if 'preview' not in _column_names(cursor, 'notes'):
+        cursor.execute("ALTER TABLE notes ADD COLUMN preview TEXT")
+    # Covering index for keyset paging: id < ? ORDER BY id DESC never touches content
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_notes_page ON notes(id, title, preview)")
+
+def _backfill_notes_preview(conn):
+    # Must match notes_database_funcs.make_preview()
+    return _backfill_in_chunks(conn, 'notes', '''
+        UPDATE notes SET preview = CASE WHEN length(content) > 150
+            THEN substr(content, 1, 150) || '...' ELSE content END
+        WHERE id >= :lo AND id < :hi
+    ''')
+
+
+# --- Migration 4: Task reminders as epoch seconds ---
+
+def _add_tasks_remind_at(cursor):
+    # Reminder as epoch seconds, so due checks are integer range scans
+    if 'remind_at' not in _column_names(cursor, 'tasks'):
+        cursor.execute("ALTER TABLE tasks ADD COLUMN remind_at INTEGER")
+    cursor.execute("DROP INDEX IF EXISTS idx_tasks_pending_reminder")
+    # Pending reminders in due order: "due before T" and "next N" are index range scans
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_tasks_remind_at ON tasks(done, remind_at)
+        WHERE done = 0 AND remind_at IS NOT NULL
+    ''')
+
+def _backfill_tasks_remind_at(conn):
+    # reminder_date/time are local time; the 'utc' modifier converts them
+    return _backfill_in_chunks(conn, 'tasks', '''
+        UPDATE tasks SET remind_at = CAST(strftime('%s', reminder_date || ' ' || reminder_time, 'utc') AS INTEGER)
+        WHERE reminder_date IS NOT NULL AND reminder_time IS NOT NULL AND id >= :lo AND id < :hi
+    ''')
+
+
+# --- Migration 5: Stored profile photos ---
+
+def _add_profile_photo_blobs(cursor):
+    # The normalized photo and its preview live with the profile, so exports
+    # don't reprocess the original and survive it being moved or deleted
+    columns = _column_names(cursor, 'profile')
+    if 'photo_blob' not in columns:
+        cursor.execute("ALTER TABLE profile ADD COLUMN photo_blob BLOB")
+    if 'photo_thumb' not in columns:
+        cursor.execute("ALTER TABLE profile ADD COLUMN photo_thumb BLOB")
+
+def _backfill_profile_photo_blobs(conn):
+    # Done in Python (needs Pillow), one profile per transaction; photos
+    # that are missing or unreadable stay NULL and fall back to photo_path.
+    # Only converted photos count as backfilled; skips are logged instead
+    rows = conn.execute('''
+        SELECT id, photo_path FROM profile
+        WHERE photo_blob IS NULL AND photo_path IS NOT NULL AND photo_path != ''
+    ''').fetchall()
+    converted = 0
+    for profile_id, photo_path in rows:
+        try:
+            photo_blob, photo_thumb = normalized_photo_blobs(photo_path)
+        except Exception as e:
+            print(f"      skipped photo for profile {profile_id}: {e}")
+        else:
+            with transaction() as cursor:
+                cursor.execute("UPDATE profile SET photo_blob=?, photo_thumb=? WHERE id=?",
+                               (photo_blob, photo_thumb, profile_id))
+            converted += 1
+            yield converted, len(rows)
+    if converted < len(rows):
+        print(f"      skipped {len(rows) - converted} of {len(rows)} photos")
+
+
+# --- Migration 6: Profile child-row indexes ---
+
+def _add_profile_child_indexes(cursor):
+    # A profile's entries in saved order are an index range scan, not a table scan
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_work_experience_profile ON work_experience(profile_id, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_education_profile ON education(profile_id, id)")
+
+
+# --- Migration 7: Tasks full-text index (FTS5, kept in sync by triggers) ---
+
+def _create_tasks_fts(cursor):
+    # Dropped first so a half-built index from an interrupted run is rebuilt cleanly
+    for trigger in ('tasks_fts_ai', 'tasks_fts_ad', 'tasks_fts_au'):
+        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    cursor.execute("DROP TABLE IF EXISTS tasks_fts")
+    cursor.execute('''
+        CREATE VIRTUAL TABLE tasks_fts USING fts5(
+            title, description,
+            content='tasks', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER tasks_fts_ai AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER tasks_fts_ad AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+        END
+    ''')
+    # Toggling done or moving a reminder doesn't touch the index
+    cursor.execute('''
+        CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+        END
+    ''')
+
+def _backfill_tasks_fts(conn):
+    return _backfill_in_chunks(conn, 'tasks', '''
+        INSERT INTO tasks_fts(rowid, title, description)
+        SELECT id, title, description FROM tasks WHERE id >= :lo AND id < :hi
+    ''')
+
+
+# --- Migration 8: Task list indexes ---
+
+def _add_tasks_list_indexes(cursor):
+    # One index per list order (see todo_database_funcs.TASK_SORTS), so a filtered
+    # page is an index range scan; done is carried along for the status filter
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(done, id)")
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(
+            coalesce(reminder_date, '9999-12-31'), coalesce(reminder_time, '99:99'), id, done
+        )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_title ON tasks(title COLLATE NOCASE, id, done)")
+
+
+# Ordered list of every schema change. Append new migrations; never edit shipped ones.
+MIGRATIONS = [
+    Migration(1, "Base tables", _create_base_tables, None),
+    Migration(2, "Notes full-text index", _create_notes_fts, _backfill_notes_fts),
+    Migration(3, "Stored note previews", _add_notes_preview, _backfill_notes_preview),
+    Migration(4, "Task reminder timestamps", _add_tasks_remind_at, _backfill_tasks_remind_at),
+    Migration(5, "Stored profile photos", _add_profile_photo_blobs, _backfill_profile_photo_blobs),
+    Migration(6, "Profile entry indexes", _add_profile_child_indexes, None),
+    Migration(7, "Tasks full-text index", _create_tasks_fts, _backfill_tasks_fts),
+    Migration(8, "Task list indexes", _add_tasks_list_indexes, None),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def initialize_all_databases():
+    """
+    Brings the one master database (app_data.db) up to SCHEMA_VERSION.
+
+    Each pending migration's schema step runs in its own transaction, its
+    backfill (if any) runs in chunks, and PRAGMA user_version is bumped
+    only once both have finished, so an interrupted upgrade resumes on the
+    next launch. When the schema is already current no DDL runs at all.
+    """
+    conn = get_connection()
+    current_version = conn.execute("PRAGMA user_version").fetchone()[0]
+    pending = [m for m in MIGRATIONS if m.version > current_version]
+    if not pending:
+        return
+
+    print(f"Initializing master database (schema v{current_version} -> v{SCHEMA_VERSION})...")
+    for migration in pending:
+        started = time.perf_counter()
+        print(f"  [{migration.version}] {migration.description}...")
+        with transaction() as cursor:
+            migration.schema(cursor)
+        if migration.backfill is not None:
+            for rows_done, rows_total in migration.backfill(conn):
+                print(f"      backfilled {rows_done}/{rows_total} rows")
+        with transaction() as cursor:
+            cursor.execute(f"PRAGMA user_version = {migration.version}")
+        print(f"      done in {time.perf_counter() - started:.2f} s")
+    print("Master database initialized.")
@@ -1,21 +1,28 @@
 # run_app.py
 import sys
+import time
+STARTED_AT = time.perf_counter() # Reference point for time-to-first-window
+
+import perf_log
+if __name__ == '__main__':
+    perf_log.restart_with_import_profiling() # No-op unless APP_IMPORT_PROFILE=1
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QStackedWidget, QDialog,
-    QPushButton, QLabel, QSplitter
+    QPushButton, QLabel, QSplitter, QMessageBox
 )
 from PyQt6.QtGui import QFont, QIcon
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 
-# Import the refactored widgets from their files
-from cv_generator_widget import CVGeneratorWidget
-from calculator_widget import CalculatorWidget
-from todo_widget import ToDoWidget
-from notes_widget import NotesWidget
+# The page widgets are imported by the page factories in AppHubWindow,
+# so a page's dependencies (e.g. ReportLab for the CV Generator) are only
+# loaded when that page is first opened
+from reminder_scheduler import ReminderScheduler
 
 # Import the master database initializer
 import database_init
+import database_connection
 
 class StartupDialog(QDialog):
     """
@@ -97,29 +104,77 @@ class AppHubWindow(QMainWindow):
         """)
         main_layout.addWidget(self.nav_list)
 
+        # --- Background Services ---
+        # Reminders run whether or not the To-Do page has been opened
+        self.reminder_scheduler = ReminderScheduler(self)
+        self.reminder_scheduler.reminder_due.connect(self.show_reminder)
+        self.reminder_scheduler.start()
+
         # --- Main Content Area (Stacked) ---
         self.stack = QStackedWidget()
         
-        # Instantiate and add each application "page"
-        self.cv_gen_widget = CVGeneratorWidget()
-        self.notes_widget = NotesWidget()
-        self.todo_widget = ToDoWidget()
-        self.calc_widget = CalculatorWidget()
-
-        self.stack.addWidget(self.cv_gen_widget) # Index 0
-        self.stack.addWidget(self.notes_widget)  # Index 1
-        self.stack.addWidget(self.todo_widget)   # Index 2
-        self.stack.addWidget(self.calc_widget)   # Index 3
+        # Each application "page" is built the first time it is selected;
+        # until then the stack holds an empty placeholder
+        self.page_factories = [
+            self._create_cv_page,     # Index 0
+            self._create_notes_page,  # Index 1
+            self._create_todo_page,   # Index 2
+            self._create_calc_page,   # Index 3
+        ]
+        self.cv_gen_widget = None
+        self.notes_widget = None
+        self.todo_widget = None
+        self.calc_widget = None
+        for _ in self.page_factories:
+            self.stack.addWidget(QWidget())
 
         main_layout.addWidget(self.stack)
 
         # --- Connections ---
         # Connect the sidebar list to the stacked widget
-        self.nav_list.currentRowChanged.connect(self.stack.setCurrentIndex)
+        self.nav_list.currentRowChanged.connect(self.show_page)
         
         # Set the initial app
         self.nav_list.setCurrentRow(initial_index)
-        self.stack.setCurrentIndex(initial_index)
+        self.show_page(initial_index)
+
+    def _create_cv_page(self):
+        from cv_generator_widget import CVGeneratorWidget
+        self.cv_gen_widget = CVGeneratorWidget()
+        return self.cv_gen_widget
+
+    def _create_notes_page(self):
+        from notes_widget import NotesWidget
+        self.notes_widget = NotesWidget()
+        return self.notes_widget
+
+    def _create_todo_page(self):
+        from todo_widget import ToDoWidget
+        self.todo_widget = ToDoWidget()
+        return self.todo_widget
+
+    def _create_calc_page(self):
+        from calculator_widget import CalculatorWidget
+        self.calc_widget = CalculatorWidget()
+        return self.calc_widget
+
+    def show_page(self, index):
+        """Switches to a page, building it first if this is its first visit."""
+        if index < 0:
+            return
+        factory = self.page_factories[index]
+        if factory is not None:
+            started = time.perf_counter()
+            self.page_factories[index] = None
+            placeholder = self.stack.widget(index)
+            self.stack.insertWidget(index, factory())
+            self.stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            perf_log.report(f"create page {index}", (time.perf_counter() - started) * 1000)
+        self.stack.setCurrentIndex(index)
+
+    def show_reminder(self, task_id, title):
+        QMessageBox.information(self, "🔔 Task Reminder", f"Your task is due!\n\nTask: {title}")
 
 
 if __name__ == '__main__':
@@ -130,11 +185,18 @@ if __name__ == '__main__':
     
     # Show the startup dialog first
     startup_dialog = StartupDialog()
+    perf_log.report("startup (imports + database) before dialog", (time.perf_counter() - STARTED_AT) * 1000)
     
     # Only show the main window if the user made a selection
     if startup_dialog.exec():
         initial_app_index = startup_dialog.selection
         
+        window_started = time.perf_counter()
         main_window = AppHubWindow(initial_app_index)
         main_window.show()
-        sys.exit(app.exec())
\ No newline at end of file
+        # Runs once the event loop has painted the window for the first time
+        QTimer.singleShot(0, lambda: perf_log.report(
+            "time-to-first-window (after startup dialog)", (time.perf_counter() - window_started) * 1000))
+        exit_code = app.exec()
+        database_connection.close_all()
+        sys.exit(exit_code)
\ No newline at end of file
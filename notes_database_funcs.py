@@ -0,0 +1,115 @@
+# notes_database_funcs.py
+from database_connection import (
+    get_connection, transaction, ChangeNotifier, ROW_ADDED, ROW_UPDATED, ROW_DELETED, fts_query
+)
+
+# Notes are fetched for the grid this many at a time
+NOTES_PAGE_SIZE = 100
+# Length of the stored card preview (must match the backfill in database_init)
+PREVIEW_LENGTH = 150
+
+# Title matches count ten times as much as content matches when ranking
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+# Subscribe to be told about every note added, updated or deleted
+changes = ChangeNotifier()
+
+def make_preview(content):
+    """The short excerpt stored in notes.preview and shown on each card."""
+    return (content[:PREVIEW_LENGTH] + '...') if len(content) > PREVIEW_LENGTH else content
+
+def get_notes_page(before_id=None, limit=NOTES_PAGE_SIZE):
+    """
+    Returns up to `limit` (id, title, preview) rows, newest first, starting
+    after before_id (keyset pagination). Served from idx_notes_page, so the
+    full content column is never read.
+    """
+    if before_id is None:
+        return get_connection().execute(
+            "SELECT id, title, preview FROM notes ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+    return get_connection().execute(
+        "SELECT id, title, preview FROM notes WHERE id < ? ORDER BY id DESC LIMIT ?", (before_id, limit)
+    ).fetchall()
+
+def search_notes_page(query, offset=0, limit=NOTES_PAGE_SIZE):
+    """
+    Returns up to `limit` (id, title, snippet) rows for query, best match first.
+    An empty query pages through every note instead (ignoring offset).
+    """
+    if fts_query(query) is None:
+        return get_notes_page(limit=limit)
+    return search_notes_snippets(query, limit=limit, offset=offset, start='', end='')
+
+def get_all_notes():
+    """Retrieves all notes, newest first."""
+    return get_connection().execute("SELECT id, title, content FROM notes ORDER BY id DESC").fetchall()
+
+def get_note(note_id):
+    """Returns (id, title, content) for one note, or None."""
+    return get_connection().execute("SELECT id, title, content FROM notes WHERE id = ?", (note_id,)).fetchone()
+
+def get_note_summary(note_id):
+    """Returns (id, title, preview) for one note, or None."""
+    return get_connection().execute("SELECT id, title, preview FROM notes WHERE id = ?", (note_id,)).fetchone()
+
+def note_matches(note_id, query):
+    """Checks whether a single note would appear in the results for query."""
+    match = fts_query(query)
+    if match is None:
+        return True
+    return get_connection().execute(
+        "SELECT 1 FROM notes_fts WHERE rowid = ? AND notes_fts MATCH ?", (note_id, match)
+    ).fetchone() is not None
+
+def search_notes(query, limit=None, offset=0):
+    """
+    Returns (id, title, content) for notes matching the query,
+    best match first (bm25). An empty query returns every note.
+    """
+    match = fts_query(query)
+    if match is None:
+        return get_all_notes()
+    return get_connection().execute(
+        "SELECT rowid, title, content FROM notes_fts WHERE notes_fts MATCH ? "
+        "ORDER BY bm25(notes_fts, ?, ?) LIMIT ? OFFSET ?",
+        (match, TITLE_WEIGHT, CONTENT_WEIGHT, -1 if limit is None else limit, offset)
+    ).fetchall()
+
+def search_notes_snippets(query, limit=50, offset=0, start='[', end=']', tokens=24):
+    """
+    Returns (id, title, snippet) for notes matching the query, best match first.
+    The snippet is a short excerpt of the content with matched terms wrapped
+    in start/end markers, for highlighting in the UI.
+    """
+    match = fts_query(query)
+    if match is None:
+        return []
+    return get_connection().execute(
+        "SELECT rowid, title, snippet(notes_fts, 1, ?, ?, '…', ?) FROM notes_fts "
+        "WHERE notes_fts MATCH ? ORDER BY bm25(notes_fts, ?, ?) LIMIT ? OFFSET ?",
+        (start, end, tokens, match, TITLE_WEIGHT, CONTENT_WEIGHT, -1 if limit is None else limit, offset)
+    ).fetchall()
+
+def add_note(title, content):
+    """Adds a new note and returns its id."""
+    with transaction() as cursor:
+        cursor.execute("INSERT INTO notes (title, content, preview) VALUES (?, ?, ?)",
+                       (title, content, make_preview(content)))
+        note_id = cursor.lastrowid
+    changes.notify(ROW_ADDED, note_id)
+    return note_id
+
+def update_note(note_id, title, content):
+    """Updates an existing note."""
+    with transaction() as cursor:
+        cursor.execute("UPDATE notes SET title = ?, content = ?, preview = ? WHERE id = ?",
+                       (title, content, make_preview(content), note_id))
+    changes.notify(ROW_UPDATED, note_id)
+
+def delete_note(note_id):
+    """Deletes a note from the database."""
+    with transaction() as cursor:
+        cursor.execute("DELETE FROM notes WHERE id = ?", (note_id,))
+    changes.notify(ROW_DELETED, note_id)
@@ -1,38 +1,65 @@
 # notes_widget.py
 import sys
+import time
 import sqlite3
+import threading
+from bisect import bisect_left
 from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QScrollArea, QGridLayout, QPushButton, QLabel,
-    QDialog, QTextEdit, QMessageBox, QFrame
+    QLineEdit, QPushButton, QTableView, QHeaderView, QAbstractItemView,
+    QStyledItemDelegate, QStyle, QDialog, QTextEdit, QMessageBox
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QFont
-
-# Define the single database name
-DB_NAME = 'app_data.db'
+from PyQt6.QtCore import (
+    Qt, QSize, QRectF, QPointF, QObject, QRunnable, QThreadPool, QTimer,
+    QAbstractTableModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen
 
 # --- Database Management ---
-# init_db removed (now in database_init.py)
-
-def get_all_notes():
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, title, content FROM notes ORDER BY id DESC")
-    notes = cursor.fetchall()
-    conn.close()
-    return notes
-
-def search_notes(query):
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    search_term = f"%{query}%"
-    cursor.execute("SELECT id, title, content FROM notes WHERE title LIKE ? OR content LIKE ? ORDER BY id DESC",
-                   (search_term, search_term))
-    notes = cursor.fetchall()
-    conn.close()
-    return notes
+# Helpers now live in notes_database_funcs.py (shared pooled connection)
+from notes_database_funcs import get_notes_page, search_notes_page, NOTES_PAGE_SIZE
+import notes_database_funcs
+from database_connection import get_connection, fts_query, ROW_DELETED
+import perf_log
+
+# Wait this long after the last keystroke before searching
+SEARCH_DEBOUNCE_MS = 200
+
+# --- Background Search ---
+
+class NoteSearchSignals(QObject):
+    # generation, query, results
+    finished = pyqtSignal(int, str, object)
+
+class NoteSearchTask(QRunnable):
+    """
+    Runs one search off the GUI thread.
+    Setting the `cancelled` event aborts the query mid-scan (through an
+    SQLite progress handler) or skips it entirely if it hasn't started.
+    """
+    def __init__(self, generation, query):
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.cancelled = threading.Event()
+        self.signals = NoteSearchSignals()
+
+    def run(self):
+        if self.cancelled.is_set():
+            return
+        conn = get_connection()
+        conn.set_progress_handler(self.cancelled.is_set, 1000)
+        try:
+            results = search_notes_page(self.query)
+        except sqlite3.OperationalError:
+            if self.cancelled.is_set():
+                return # Interrupted by a newer query
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+        if not self.cancelled.is_set():
+            self.signals.finished.emit(self.generation, self.query, results)
 
 # --- Note Editor Dialog (Unchanged, as it's self-contained) ---
 
@@ -78,27 +105,292 @@ class NoteEditorDialog(QDialog):
         if not title:
             QMessageBox.warning(self, "Validation Error", "Title cannot be empty.")
             return
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
         if self.is_new_note:
-            cursor.execute("INSERT INTO notes (title, content) VALUES (?, ?)", (title, content))
+            notes_database_funcs.add_note(title, content)
         else:
-            cursor.execute("UPDATE notes SET title = ?, content = ? WHERE id = ?", (title, content, self.note_id))
-        conn.commit()
-        conn.close()
+            notes_database_funcs.update_note(self.note_id, title, content)
         self.accept()
 
     def delete_note(self):
         confirm = QMessageBox.question(self, "Confirm Delete", "Are you sure you want to delete this note?",
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirm == QMessageBox.StandardButton.Yes:
-            conn = sqlite3.connect(DB_NAME)
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM notes WHERE id = ?", (self.note_id,))
-            conn.commit()
-            conn.close()
+            notes_database_funcs.delete_note(self.note_id)
             self.accept()
 
+# --- Notes Grid Model/View ---
+
+CARD_WIDTH, CARD_HEIGHT = 200, 180
+CARD_SPACING = 15
+CARD_PADDING = 15
+
+# Custom data roles exposed by NotesListModel
+NoteIdRole = Qt.ItemDataRole.UserRole + 1
+NoteTitleRole = Qt.ItemDataRole.UserRole + 2
+NotePreviewRole = Qt.ItemDataRole.UserRole + 3
+AddCardRole = Qt.ItemDataRole.UserRole + 4
+
+class NotesListModel(QAbstractTableModel):
+    """
+    Holds the (id, title, preview) rows shown in the notes grid, laid out
+    row by row in `columns` cells per row (set by NotesGridView to fit its
+    width). Cell 0 is always the "+" card. Rows arrive one page at a time:
+    the view calls fetchMore() as it scrolls near the end of what is loaded.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._notes = []
+        self._query = ""
+        self._sorted_by_id = True
+        self._has_more = False
+        self._columns = 1
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def set_columns(self, columns):
+        """Reflows the cards into `columns` cells per row."""
+        columns = max(1, columns)
+        if columns != self._columns:
+            self.beginResetModel()
+            self._columns = columns
+            self.endResetModel()
+
+    def cell_index(self, pos):
+        """Returns the model index of the card at list position pos (-1 is the "+" card)."""
+        row, column = divmod(pos + 1, self._columns)
+        return self.index(row, column)
+
+    def _rows_for(self, count):
+        return -(-(count + 1) // self._columns) # The "+" card takes the first cell
+
+    def _cells_shifted(self, pos):
+        """Repaints every card from list position pos to the end, after a shift."""
+        first = self.cell_index(pos)
+        last = self.rowCount() - 1
+        if first.isValid() and last >= first.row():
+            self.dataChanged.emit(self.index(first.row(), 0), self.index(last, self._columns - 1))
+
+    def _insert_notes(self, pos, notes):
+        """
+        Inserts notes at list position pos. Only whole grid rows are
+        inserted; the cards that move along within existing rows are
+        repainted, so the view never lays out the rows it already has.
+        """
+        old_rows, new_rows = self._rows_for(len(self._notes)), self._rows_for(len(self._notes) + len(notes))
+        if new_rows > old_rows:
+            self.beginInsertRows(QModelIndex(), old_rows, new_rows - 1)
+        self._notes[pos:pos] = notes
+        if new_rows > old_rows:
+            self.endInsertRows()
+        self._cells_shifted(pos)
+
+    def _remove_note_at(self, pos):
+        old_rows, new_rows = self._rows_for(len(self._notes)), self._rows_for(len(self._notes) - 1)
+        if new_rows < old_rows:
+            self.beginRemoveRows(QModelIndex(), new_rows, old_rows - 1)
+        del self._notes[pos]
+        if new_rows < old_rows:
+            self.endRemoveRows()
+        self._cells_shifted(pos)
+
+    def set_notes(self, first_page, query=""):
+        """Replaces every row with the first page of results for query."""
+        self.beginResetModel()
+        self._notes = list(first_page)
+        self._query = query
+        # Browsing is id DESC; search is ranked. A query with no searchable words
+        # browses, exactly as search_notes_page() decides
+        self._sorted_by_id = fts_query(query) is None
+        self._has_more = len(self._notes) >= NOTES_PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent):
+        if parent.isValid() or not self._has_more:
+            return
+        if self._sorted_by_id:
+            page = get_notes_page(before_id=self._notes[-1][0] if self._notes else None)
+        else:
+            page = search_notes_page(self._query, offset=len(self._notes))
+            loaded = {note[0] for note in self._notes}
+            page = [note for note in page if note[0] not in loaded] # Rows shifted by live inserts
+        self._has_more = len(page) >= NOTES_PAGE_SIZE
+        if page:
+            self._insert_notes(len(self._notes), page)
+
+    def find_note(self, note_id):
+        """Returns the list position of note_id, or -1."""
+        if self._sorted_by_id:
+            pos = bisect_left(self._notes, -note_id, key=lambda note: -note[0])
+            if pos < len(self._notes) and self._notes[pos][0] == note_id:
+                return pos
+            return -1
+        for pos, note in enumerate(self._notes):
+            if note[0] == note_id:
+                return pos
+        return -1
+
+    def upsert_note(self, note):
+        """Updates the row for note in place, or inserts it where it belongs."""
+        pos = self.find_note(note[0])
+        if pos != -1:
+            self._notes[pos] = note
+            index = self.cell_index(pos)
+            self.dataChanged.emit(index, index)
+            return
+        if self._sorted_by_id:
+            pos = bisect_left(self._notes, -note[0], key=lambda row: -row[0])
+            if pos == len(self._notes) and self._has_more:
+                return # Older than anything loaded; a later page will bring it
+        else:
+            pos = 0 # Unranked newcomer goes first in search results
+        self._insert_notes(pos, [note])
+
+    def remove_note(self, note_id):
+        pos = self.find_note(note_id)
+        if pos != -1:
+            self._remove_note_at(pos)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._rows_for(len(self._notes))
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._columns
+
+    def flags(self, index):
+        pos = index.row() * self._columns + index.column() - 1
+        if not index.isValid() or pos >= len(self._notes):
+            return Qt.ItemFlag.NoItemFlags # Empty cells after the last card
+        return super().flags(index)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        pos = index.row() * self._columns + index.column() - 1
+        if pos == -1:
+            return True if role == AddCardRole else None
+        if pos >= len(self._notes):
+            return None
+        note_id, title, preview = self._notes[pos]
+        if role in (NoteTitleRole, Qt.ItemDataRole.DisplayRole):
+            return title
+        if role == NotePreviewRole:
+            return preview or ""
+        if role == NoteIdRole:
+            return note_id
+        if role == AddCardRole:
+            return False
+        return None
+
+class NotesGridView(QTableView):
+    """
+    The notes grid: a table of fixed-size cells with no headers or grid
+    lines, reflowed to as many columns as fit its width. A wrapping
+    QListView lays out every loaded card again whenever one is inserted or
+    removed; here an insert or remove only repaints the cards that moved,
+    so single-note changes stay cheap with 50k notes loaded.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        for header, size in ((self.horizontalHeader(), CARD_WIDTH), (self.verticalHeader(), CARD_HEIGHT)):
+            header.hide()
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            header.setMinimumSectionSize(1)
+            header.setDefaultSectionSize(size + CARD_SPACING)
+        self.setShowGrid(False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.fit_columns()
+
+    def fit_columns(self):
+        """Reflows the model to as many columns as fit, keeping the top card in view."""
+        model = self.model()
+        if model is None:
+            return
+        columns = max(1, self.viewport().width() // self.horizontalHeader().defaultSectionSize())
+        if columns == model.columns:
+            return
+        top = self.indexAt(self.viewport().rect().topLeft())
+        pos = top.row() * model.columns + top.column() - 1 if top.isValid() else -1
+        model.set_columns(columns)
+        if pos > 0:
+            self.scrollTo(model.cell_index(pos), QAbstractItemView.ScrollHint.PositionAtTop)
+
+class NoteCardDelegate(QStyledItemDelegate):
+    """Paints a note card (or the "+" card) directly, with no per-note widgets."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.title_font = QFont("Arial")
+        self.title_font.setPixelSize(16)
+        self.title_font.setBold(True)
+        self.content_font = QFont("Arial")
+        self.content_font.setPixelSize(13)
+        self.add_font = QFont("Arial")
+        self.add_font.setPixelSize(50)
+        self.add_font.setWeight(QFont.Weight.Light)
+
+    def sizeHint(self, option, index):
+        return QSize(CARD_WIDTH, CARD_HEIGHT)
+
+    def paint(self, painter, option, index):
+        add_card = index.data(AddCardRole)
+        if add_card is None:
+            return # An empty cell after the last card
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        # Cells include the spacing between cards; the card sits centred in its cell
+        card = QRectF(0, 0, CARD_WIDTH - 2, CARD_HEIGHT - 2)
+        card.moveCenter(QRectF(option.rect).center())
+        if add_card:
+            self._paint_add_card(painter, card, hovered)
+        else:
+            self._paint_note_card(painter, card, hovered, index)
+        painter.restore()
+
+    def _paint_add_card(self, painter, card, hovered):
+        pen = QPen(QColor("#b0e0e6"), 2, Qt.PenStyle.DashLine)
+        painter.setPen(pen)
+        painter.setBrush(QColor("#e6f7ff" if hovered else "#f0f8ff"))
+        painter.drawRoundedRect(card, 8, 8)
+        painter.setFont(self.add_font)
+        painter.setPen(QColor("#66c2e8" if hovered else "#87ceeb"))
+        painter.drawText(card, Qt.AlignmentFlag.AlignCenter.value, "+")
+
+    def _paint_note_card(self, painter, card, hovered, index):
+        painter.setPen(QPen(QColor("#87ceeb" if hovered else "#e0e5ec"), 1))
+        painter.setBrush(QColor("#fdfdfd" if hovered else "#ffffff"))
+        painter.drawRoundedRect(card, 8, 8)
+
+        inner = card.adjusted(CARD_PADDING, CARD_PADDING, -CARD_PADDING, -CARD_PADDING)
+        painter.setClipRect(inner)
+        wrap = Qt.TextFlag.TextWordWrap.value | Qt.AlignmentFlag.AlignLeft.value | Qt.AlignmentFlag.AlignTop.value
+
+        painter.setFont(self.title_font)
+        painter.setPen(QColor("#2c3e50"))
+        title_rect = painter.boundingRect(inner, wrap, index.data(NoteTitleRole))
+        title_rect.setHeight(min(title_rect.height(), inner.height() / 2))
+        painter.drawText(title_rect, wrap, index.data(NoteTitleRole))
+
+        line_y = title_rect.bottom() + 6
+        painter.setPen(QPen(QColor("#dcdcdc"), 1))
+        painter.drawLine(QPointF(inner.left(), line_y), QPointF(inner.right(), line_y))
+
+        painter.setFont(self.content_font)
+        painter.setPen(QColor("#34495e"))
+        content_rect = QRectF(inner.left(), line_y + 6, inner.width(), inner.bottom() - line_y - 6)
+        painter.drawText(content_rect, wrap, index.data(NotePreviewRole))
+
 # --- Main Application Window (Refactored to QWidget) ---
 
 class NotesWidget(QWidget): # Changed from QMainWindow
@@ -113,22 +405,38 @@ class NotesWidget(QWidget): # Changed from QMainWindow
 
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("🔍 Search for a note...")
-        self.search_bar.textChanged.connect(self.filter_notes)
+        self.search_bar.textChanged.connect(self.on_search_text_changed)
         main_layout.addWidget(self.search_bar)
 
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setObjectName("ScrollArea")
-        main_layout.addWidget(self.scroll_area)
+        # Searches run on a single worker thread; only the newest result is applied
+        self.search_pool = QThreadPool(self)
+        self.search_pool.setMaxThreadCount(1)
+        self.search_pool.setExpiryTimeout(-1) # Keep the thread (and its DB connection) alive
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.filter_notes)
+        self._search_generation = 0
+        self._search_cancel = None
+        self._last_keystroke = None
 
-        self.notes_container = QWidget()
-        self.notes_container.setObjectName("notes_container")
-        self.notes_grid = QGridLayout(self.notes_container)
-        self.notes_grid.setSpacing(15)
-        self.notes_grid.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
-        self.scroll_area.setWidget(self.notes_container)
+        # Virtualized grid: only the visible cards are painted
+        self.notes_model = NotesListModel(self)
+        self.notes_view = NotesGridView()
+        self.notes_view.setObjectName("NotesView")
+        self.notes_view.setModel(self.notes_model)
+        self.notes_view.setItemDelegate(NoteCardDelegate(self.notes_view))
+        self.notes_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.notes_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.notes_view.setMouseTracking(True)
+        self.notes_view.clicked.connect(self.on_card_clicked)
+        main_layout.addWidget(self.notes_view)
 
         self.load_notes()
+
+        # Patch single cards when notes change instead of rebuilding the grid
+        notes_database_funcs.changes.subscribe(self.on_note_changed)
+        self.destroyed.connect(partial(notes_database_funcs.changes.unsubscribe, self.on_note_changed))
         
         # Apply the stylesheet directly to this widget
         self.setStyleSheet("""
@@ -136,7 +444,7 @@ class NotesWidget(QWidget): # Changed from QMainWindow
                 font-family: Arial, sans-serif;
             }
             /* Target this widget specifically */
-            QWidget#CentralWidget, QWidget#notes_container {
+            QWidget#CentralWidget, QTableView#NotesView {
                 background-color: #f7f9fc; 
             }
             QTextEdit, QLineEdit {
@@ -150,38 +458,7 @@ class NotesWidget(QWidget): # Changed from QMainWindow
             QDialog {
                 background-color: #ffffff;
             }
-            QScrollArea#ScrollArea { border: none; }
-            QPushButton#NoteCard {
-                background-color: #ffffff;
-                border: 1px solid #e0e5ec;
-                border-radius: 8px;
-                text-align: left;
-            }
-            QPushButton#NoteCard:hover {
-                border-color: #87ceeb;
-                background-color: #fdfdfd;
-            }
-            QLabel#NoteTitle {
-                font-size: 16px;
-                font-weight: bold;
-                color: #2c3e50;
-            }
-            QLabel#NoteContent {
-                font-size: 13px;
-                color: #34495e;
-            }
-            QPushButton#AddButton {
-                font-size: 50px;
-                font-weight: 300;
-                color: #87ceeb;
-                background-color: #f0f8ff;
-                border: 2px dashed #b0e0e6;
-                border-radius: 8px;
-            }
-            QPushButton#AddButton:hover {
-                background-color: #e6f7ff;
-                color: #66c2e8;
-            }
+            QTableView#NotesView { border: none; }
             QPushButton#SaveButton {
                 background-color: #0275d8;
                 color: white;
@@ -212,75 +489,69 @@ class NotesWidget(QWidget): # Changed from QMainWindow
             }
         """)
 
-    def create_note_card(self, note_id, title, content):
-        card = QPushButton()
-        card.setFixedSize(200, 180)
-        card.setObjectName("NoteCard")
-        
-        card_layout = QVBoxLayout(card)
-        card_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        card_layout.setContentsMargins(15, 15, 15, 15)
-
-        title_label = QLabel(title)
-        title_label.setObjectName("NoteTitle")
-        title_label.setWordWrap(True)
-        card_layout.addWidget(title_label)
-        
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-        card_layout.addWidget(line)
-
-        preview_text = (content[:150] + '...') if len(content) > 150 else content
-        content_label = QLabel(preview_text)
-        content_label.setObjectName("NoteContent")
-        content_label.setWordWrap(True)
-        content_label.setAlignment(Qt.AlignmentFlag.AlignTop)
-        card_layout.addWidget(content_label)
-        
-        card_layout.addStretch()
-        card.clicked.connect(partial(self.open_note_editor, note_id, title, content))
-        return card
-
-    def clear_grid(self):
-        while self.notes_grid.count():
-            child = self.notes_grid.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-    def load_notes(self, notes_data=None):
-        self.clear_grid()
-        
-        add_note_button = QPushButton("+")
-        add_note_button.setObjectName("AddButton")
-        add_note_button.setFixedSize(200, 180)
-        add_note_button.clicked.connect(self.open_new_note_editor)
-        self.notes_grid.addWidget(add_note_button, 0, 0)
-
-        if notes_data is None: notes_data = get_all_notes() # Calls helper func
-
-        row, col = 0, 1
-        items_per_row = 4
-        for note_id, title, content in notes_data:
-            if col >= items_per_row:
-                col = 0
-                row += 1
-            note_card = self.create_note_card(note_id, title, content)
-            self.notes_grid.addWidget(note_card, row, col)
-            col += 1
+    def load_notes(self, notes_data=None, query=""):
+        """Shows the first page of notes; later pages load as the user scrolls."""
+        if notes_data is None: notes_data = get_notes_page() # Calls helper func
+        self.notes_model.set_notes(notes_data, query)
 
-    def filter_notes(self):
+    def on_note_changed(self, event, note_id):
+        """Applies one add/update/delete from the data layer to the grid."""
+        if event == ROW_DELETED:
+            self.notes_model.remove_note(note_id)
+            return
+        note = notes_database_funcs.get_note_summary(note_id)
         query = self.search_bar.text()
-        self.load_notes(notes_data=search_notes(query)) # Calls helper func
+        if note is None or (query.strip() and not notes_database_funcs.note_matches(note_id, query)):
+            self.notes_model.remove_note(note_id)
+        else:
+            self.notes_model.upsert_note(note)
+
+    def on_card_clicked(self, index):
+        if index.data(AddCardRole):
+            self.open_new_note_editor()
+        elif index.data(NoteIdRole) is not None:
+            self.open_note_editor(index.data(NoteIdRole))
+
+    def on_search_text_changed(self):
+        self._last_keystroke = time.perf_counter()
+        self.search_timer.start() # Restarts the debounce window
 
-    def open_note_editor(self, note_id, title, content):
-        dialog = NoteEditorDialog(note_id, title, content, self)
-        if dialog.exec(): self.filter_notes()
+    def filter_notes(self):
+        """Starts a background search for the current text, superseding any in flight."""
+        self.search_timer.stop()
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+        self._search_generation += 1
+        task = NoteSearchTask(self._search_generation, self.search_bar.text())
+        task.signals.finished.connect(self._apply_search_results)
+        self._search_cancel = task.cancelled
+        self.search_pool.start(task)
+
+    def _apply_search_results(self, generation, query, notes):
+        if generation != self._search_generation:
+            return # A newer search has started since; drop this result
+        self._search_cancel = None
+        self.load_notes(notes_data=notes, query=query)
+        if self._last_keystroke is not None:
+            keystroke = self._last_keystroke
+            self._last_keystroke = None
+            # Report once the event loop has painted the new grid
+            QTimer.singleShot(0, lambda: perf_log.report(
+                f"notes search '{query}' keystroke-to-paint",
+                (time.perf_counter() - keystroke) * 1000))
+
+    def open_note_editor(self, note_id):
+        # Full content is only read from the database when a note is opened
+        note = notes_database_funcs.get_note(note_id)
+        if note is None:
+            return
+        # The grid is updated through on_note_changed when the dialog saves
+        dialog = NoteEditorDialog(note_id, note[1], note[2], self)
+        dialog.exec()
 
     def open_new_note_editor(self):
         dialog = NoteEditorDialog(parent=self)
         if dialog.exec():
-            self.search_bar.clear()
-            self.load_notes()
+            self.search_bar.clear() # Show the new note; a no-op if no search is active
 
 # --- Application Entry Point Removed ---
\ No newline at end of file
@@ -0,0 +1,23 @@
+# perf_log.py
+import os
+import sys
+
+# Set APP_PERF_LOG=1 to print timing measurements to the console
+ENABLED = bool(os.environ.get('APP_PERF_LOG'))
+
+# Set APP_IMPORT_PROFILE=1 to print per-module import costs (python -X importtime) at startup
+IMPORT_PROFILE = bool(os.environ.get('APP_IMPORT_PROFILE'))
+
+def restart_with_import_profiling():
+    """
+    Re-runs the current program under `python -X importtime` when
+    APP_IMPORT_PROFILE is set. Must be called before any heavy import;
+    the per-module timings are written to stderr.
+    """
+    if IMPORT_PROFILE and 'importtime' not in sys._xoptions:
+        os.execv(sys.executable, [sys.executable, '-X', 'importtime'] + sys.argv)
+
+def report(label, milliseconds):
+    """Prints a timing measurement when performance logging is enabled."""
+    if ENABLED:
+        print(f"[perf] {label}: {milliseconds:.1f} ms")
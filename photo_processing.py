@@ -0,0 +1,184 @@
+# photo_processing.py
+import hashlib
+import io
+import os
+
+# Pillow is imported inside the functions that use it, on first use.
+
+# Processed photos are cached here, keyed by the source file's content
+# hash and the target size, so unchanged photos are never reprocessed.
+PHOTO_CACHE_DIR = '.photo_cache'
+
+# Total size the cache may grow to; least recently used entries go first
+PHOTO_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Bumped whenever make_rounded_png's output changes, so old cache entries miss
+PHOTO_PIPELINE_VERSION = 2
+
+# Reduced decoding keeps at least this many times the target size
+DRAFT_OVERSAMPLE = 2
+
+# Stored with each profile: a square, upright crop no larger than this
+# (the source for every PDF export) and a preview for the form
+PHOTO_BLOB_SIZE = (512, 512)
+PHOTO_THUMB_SIZE = (150, 150)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# (path, size, mtime_ns) -> sha256 hex digest, so a photo that hasn't
+# changed on disk isn't re-read just to hash it
+_digest_memo = {}
+
+
+def file_digest(path):
+    """Returns the sha256 hex digest of a file's contents."""
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = _digest_memo.get(memo_key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        _digest_memo[memo_key] = digest
+    return digest
+
+
+def open_reduced(source, size):
+    """
+    Opens a photo already shrunk towards `size` (width, height) and turned
+    upright according to its EXIF orientation.
+
+    JPEGs are decoded in draft mode, where libjpeg scales by 1/2, 1/4 or
+    1/8 while decoding, so a 50 MP photo never exists in memory at full
+    resolution. DRAFT_OVERSAMPLE keeps enough pixels for a clean final
+    LANCZOS resample. Formats without reduced decoding (e.g. PNG) are
+    decoded in full.
+    """
+    from PIL import Image as PILImage, ImageOps
+    img = PILImage.open(source)
+    img.draft('RGB', (size[0] * DRAFT_OVERSAMPLE, size[1] * DRAFT_OVERSAMPLE))
+    img = ImageOps.exif_transpose(img)
+    if img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        img = img.convert('RGBA') # Palette/bilevel images can't be resampled smoothly
+    return img
+
+
+def fit_box(image_size, size):
+    """The centered crop of image_size with the aspect ratio of size, as (left, top, right, bottom)."""
+    width, height = image_size
+    target_ratio = size[0] / size[1]
+    if width / height > target_ratio:
+        crop_width = height * target_ratio
+        left = (width - crop_width) / 2
+        return (left, 0, left + crop_width, height)
+    crop_height = width / target_ratio
+    top = (height - crop_height) / 2
+    return (0, top, width, top + crop_height)
+
+
+def make_rounded_png(source, size):
+    """Crops a photo to `size` (width, height), masks it to a circle and returns PNG bytes."""
+    from PIL import Image as PILImage, ImageDraw
+    img = open_reduced(source, size)
+    # Crop and resample in one pass; reducing_gap does a cheap integer
+    # reduce first, so LANCZOS only ever runs on a small image
+    img = img.resize(size, PILImage.Resampling.LANCZOS, box=fit_box(img.size, size), reducing_gap=3.0)
+    img = img.convert("RGBA") # Only the small image is expanded to RGBA
+    mask = PILImage.new('L', size, 0)
+    draw = ImageDraw.Draw(mask)
+    draw.ellipse((0, 0) + size, fill=255)
+    img.putalpha(mask)
+    out = io.BytesIO()
+    img.save(out, format='PNG')
+    return out.getvalue()
+
+
+def _encode_jpeg(img, quality):
+    out = io.BytesIO()
+    img.save(out, format='JPEG', quality=quality, optimize=True)
+    return out.getvalue()
+
+
+def normalized_photo_blobs(source):
+    """
+    Returns (photo_blob, photo_thumb) JPEG bytes for storing with a profile:
+    the photo cropped to a centered square, turned upright and scaled down
+    to at most PHOTO_BLOB_SIZE, plus a PHOTO_THUMB_SIZE preview of it.
+    """
+    from PIL import Image as PILImage
+    img = open_reduced(source, PHOTO_BLOB_SIZE)
+    box = fit_box(img.size, PHOTO_BLOB_SIZE)
+    side = min(PHOTO_BLOB_SIZE[0], int(box[2] - box[0]))
+    img = img.resize((side, side), PILImage.Resampling.LANCZOS, box=box, reducing_gap=3.0)
+    if img.mode in ('RGBA', 'LA'):
+        # JPEG has no alpha; flatten transparent areas onto white like the page
+        background = PILImage.new('RGB', img.size, 'white')
+        background.paste(img, mask=img.getchannel('A'))
+        img = background
+    img = img.convert('RGB')
+    photo_blob = _encode_jpeg(img, 90)
+    img.thumbnail(PHOTO_THUMB_SIZE, PILImage.Resampling.LANCZOS)
+    return photo_blob, _encode_jpeg(img, 85)
+
+
+def _cache_path(digest, size):
+    return os.path.join(PHOTO_CACHE_DIR, f"{digest}_{size[0]}x{size[1]}_v{PHOTO_PIPELINE_VERSION}.png")
+
+
+def _evict(max_bytes):
+    """Deletes least recently used cache entries until the cache fits in max_bytes."""
+    entries = []
+    total = 0
+    with os.scandir(PHOTO_CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and entry.name.endswith('.png'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+    entries.sort()
+    for _, file_size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue # Already gone, or in use by another export
+        total -= file_size
+
+
+def rounded_photo_png(source, size):
+    """
+    Returns the circular PNG for a photo at `size`, from the cache when the
+    same photo content was processed at that size before. A hit bumps the
+    entry's mtime, which is what eviction orders by.
+
+    `source` is a file path or the encoded photo itself (e.g. a stored
+    photo_blob, hashed and decoded in place without copying).
+    """
+    if isinstance(source, str):
+        cache_path = _cache_path(file_digest(source), size)
+    else:
+        cache_path = _cache_path(hashlib.sha256(source).hexdigest(), size)
+        source = io.BytesIO(source)
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        os.utime(cache_path)
+        return data
+    except OSError:
+        pass # Miss
+
+    data = make_rounded_png(source, size)
+    try:
+        os.makedirs(PHOTO_CACHE_DIR, exist_ok=True)
+        # Written under a unique name then renamed, so parallel exports never see half a file
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+        _evict(PHOTO_CACHE_MAX_BYTES)
+    except OSError as e:
+        print(f"Could not write photo cache: {e}")
+    return data
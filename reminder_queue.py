@@ -0,0 +1,101 @@
+# reminder_queue.py
+import heapq
+
+import todo_database_funcs
+
+# How many upcoming reminders are held in memory at once
+REMINDER_WINDOW = 500
+
+
+class ReminderQueue:
+    """
+    A min-heap of upcoming task reminders, kept in step with the database.
+
+    Only the next REMINDER_WINDOW reminders (in due order, read through
+    idx_tasks_remind_at) are loaded; the next window is read when
+    those run out. Changed tasks are re-read by id, and superseded heap
+    entries are skipped lazily when they reach the top.
+    """
+    def __init__(self, window=REMINDER_WINDOW):
+        self.window = window
+        self._heap = []        # (due, task_id, title)
+        self._entries = {}     # task_id -> (due, title) of its live heap entry
+        self._fired = set()    # Reminders already shown this session
+        self._horizon = None   # Sort key of the last row loaded; None once everything is loaded
+        self._exhausted = True
+
+    def reload(self):
+        """Drops everything and loads the first window from the database."""
+        self._heap.clear()
+        self._entries.clear()
+        self._horizon = None
+        self._exhausted = False
+        self._load_window()
+
+    def _load_window(self):
+        rows = todo_database_funcs.get_upcoming_reminders(after=self._horizon, limit=self.window)
+        for task_id, title, due in rows:
+            if task_id not in self._fired:
+                self._push(task_id, title, due)
+        self._exhausted = len(rows) < self.window
+        if rows:
+            last_id, _, last_due = rows[-1]
+            self._horizon = (last_due, last_id)
+
+    def _push(self, task_id, title, due):
+        self._entries[task_id] = (due, title)
+        heapq.heappush(self._heap, (due, task_id, title))
+
+    def _beyond_horizon(self, key):
+        return not self._exhausted and self._horizon is not None and key > self._horizon
+
+    def discard(self, task_id):
+        """Forgets a task's reminder (its heap entry is dropped lazily)."""
+        self._entries.pop(task_id, None)
+
+    def forget_fired(self, task_id):
+        """Allows a reminder that already fired to fire again (e.g. after an edit)."""
+        self._fired.discard(task_id)
+
+    def refresh(self, task_id):
+        """Re-reads one task after it changed and reschedules its reminder."""
+        self.discard(task_id)
+        if task_id in self._fired:
+            return
+        row = todo_database_funcs.get_pending_reminder(task_id)
+        if row is None:
+            return
+        _, title, due = row
+        if self._beyond_horizon((due, task_id)):
+            return # Will be picked up when the next window is loaded
+        self._push(task_id, title, due)
+
+    def _prune(self):
+        """Pops superseded entries off the top, loading the next window if empty."""
+        while True:
+            while self._heap:
+                due, task_id, title = self._heap[0]
+                if self._entries.get(task_id) == (due, title):
+                    return
+                heapq.heappop(self._heap)
+            if self._exhausted:
+                return
+            self._load_window()
+
+    def next_due(self):
+        """Epoch seconds of the earliest pending reminder, or None."""
+        self._prune()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now):
+        """Removes and returns (task_id, title) for every reminder due at or before now."""
+        due_now = []
+        while self.next_due() is not None and self._heap[0][0] <= now:
+            _, task_id, title = heapq.heappop(self._heap)
+            del self._entries[task_id]
+            self._fired.add(task_id)
+            due_now.append((task_id, title))
+        return due_now
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,73 @@
+# reminder_scheduler.py
+import math
+import time
+from functools import partial
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+
+import todo_database_funcs
+from database_connection import ROW_DELETED, ROWS_RESET
+from reminder_queue import ReminderQueue
+
+# Never sleep longer than this, so clock changes and suspend/resume are caught
+MAX_SLEEP_MS = 60 * 60 * 1000
+
+
+class ReminderScheduler(QObject):
+    """
+    Fires reminder_due(task_id, title) when a task's reminder time arrives.
+
+    Instead of polling every task on a fixed interval, a single-shot timer
+    is armed for the next due reminder in a ReminderQueue, and the queue is
+    updated from todo_database_funcs change events. Idle cost is one timer.
+    """
+    reminder_due = pyqtSignal(int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.queue = ReminderQueue()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._on_timeout)
+        self._running = False
+
+    def start(self):
+        self.queue.reload()
+        if not self._running:
+            todo_database_funcs.changes.subscribe(self.on_task_changed)
+            self.destroyed.connect(partial(todo_database_funcs.changes.unsubscribe, self.on_task_changed))
+            self._running = True
+        self._arm()
+
+    def stop(self):
+        self.timer.stop()
+        if self._running:
+            todo_database_funcs.changes.unsubscribe(self.on_task_changed)
+            self._running = False
+
+    def on_task_changed(self, event, task_id):
+        if event == ROWS_RESET:
+            self.queue.reload()
+        elif event == ROW_DELETED:
+            self.queue.discard(task_id)
+            self.queue.forget_fired(task_id)
+        else:
+            if event != todo_database_funcs.TASK_STATUS_CHANGED:
+                self.queue.forget_fired(task_id) # An edited task may remind again
+            self.queue.refresh(task_id)
+        self._arm()
+
+    def _arm(self):
+        due = self.queue.next_due()
+        if due is None:
+            self.timer.stop()
+            return
+        delay_ms = max(0, math.ceil((due - time.time()) * 1000))
+        self.timer.start(min(delay_ms, MAX_SLEEP_MS))
+
+    def _on_timeout(self):
+        due_now = self.queue.pop_due(time.time())
+        # Re-arm before emitting: slots may open modal dialogs
+        self._arm()
+        for task_id, title in due_now:
+            self.reminder_due.emit(task_id, title)
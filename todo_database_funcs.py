@@ -1,55 +1,362 @@
 # todo_database_funcs.py
-import sqlite3
+import csv
+import json
+import string
+from collections import namedtuple
+from collections.abc import Mapping
+from datetime import datetime
+from itertools import islice
+from database_connection import (
+    get_connection, transaction, ChangeNotifier, ROW_ADDED, ROW_UPDATED, ROW_DELETED, ROWS_RESET, fts_query
+)
 
-# Define the single database name
-DB_NAME = 'app_data.db'
+# Sent instead of ROW_UPDATED when only the 'done' flag changed
+TASK_STATUS_CHANGED = 'status'
+
+# Subscribe to be told about every task added, updated, toggled or deleted
+changes = ChangeNotifier()
+
+# Tasks are fetched for the list this many at a time
+TASKS_PAGE_SIZE = 200
+
+# get_task() rows by id, shared by every caller; a write to a task drops its entry
+TASK_CACHE_SIZE = 4096
+_task_cache = {}
+
+# Bulk import/export: rows written per transaction, rows read per fetchmany()
+IMPORT_CHUNK_SIZE = 5000
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FORMATS = ('csv', 'jsonl')
+EXPORT_COLUMNS = ('id', 'title', 'description', 'done', 'reminder_date', 'reminder_time')
+
+# What the task list shows. status: 'all', 'pending' or 'done'; due_from/due_to:
+# inclusive 'yyyy-MM-dd' bounds on the reminder date; overdue: pending and due
+# before now; text: words matched (as prefixes) in the title or description
+TaskQuery = namedtuple('TaskQuery', ['status', 'due_from', 'due_to', 'overdue', 'text', 'sort'],
+                       defaults=('all', None, None, False, '', 'newest'))
+TASK_STATUSES = ('all', 'pending', 'done')
+
+# Due order puts date-only tasks after timed ones on the same day, and undated tasks last
+_DUE_DATE = "coalesce(reminder_date, '9999-12-31')"
+_DUE_TIME = "coalesce(reminder_time, '99:99')"
+
+# sort -> (ORDER BY key, descending). Each key ends in id, so it is unique and
+# keyset paging can continue after a row; each has a matching index in database_init
+TASK_SORTS = {
+    'newest': (("id",), True),
+    'oldest': (("id",), False),
+    'due': ((_DUE_DATE, _DUE_TIME, "id"), False),
+    'title': (("title COLLATE NOCASE", "id"), False),
+}
+
+# NOCASE only folds ASCII letters
+_ASCII_FOLD = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Pending tasks with a reminder (matches the partial index idx_tasks_remind_at)
+_PENDING_REMINDER = "done = 0 AND remind_at IS NOT NULL"
+
+def reminder_epoch(reminder_date, reminder_time):
+    """Converts local 'yyyy-MM-dd' / 'HH:mm' strings to epoch seconds (None if incomplete)."""
+    try:
+        return int(datetime.strptime(f"{reminder_date} {reminder_time}", "%Y-%m-%d %H:%M").timestamp())
+    except (TypeError, ValueError):
+        return None
 
 # --- init_db() function removed ---
 # It is now handled by database_init.py
 
 def add_task(title, description, reminder_date, reminder_time):
-    """Adds a new task to the database."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO tasks (title, description, reminder_date, reminder_time) VALUES (?, ?, ?, ?)",
-        (title, description, reminder_date, reminder_time)
-    )
-    conn.commit()
-    conn.close()
+    """Adds a new task to the database and returns its id."""
+    with transaction() as cursor:
+        cursor.execute(
+            "INSERT INTO tasks (title, description, reminder_date, reminder_time, remind_at) VALUES (?, ?, ?, ?, ?)",
+            (title, description, reminder_date, reminder_time, reminder_epoch(reminder_date, reminder_time))
+        )
+        task_id = cursor.lastrowid
+    changes.notify(ROW_ADDED, task_id)
+    return task_id
 
 def get_all_tasks():
     """Retrieves all tasks from the database."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM tasks ORDER BY id DESC")
-    tasks = cursor.fetchall()
-    conn.close()
-    return tasks
+    return get_connection().execute(
+        "SELECT id, title, description, done, reminder_date, reminder_time FROM tasks ORDER BY id DESC"
+    ).fetchall()
+
+def get_task(task_id):
+    """
+    Returns the (id, title, description, done, reminder_date, reminder_time)
+    row for one task, or None. Served from the task cache when possible,
+    otherwise by a primary-key lookup.
+    """
+    task = _task_cache.get(task_id)
+    if task is not None:
+        return task
+    task = get_connection().execute(
+        "SELECT id, title, description, done, reminder_date, reminder_time FROM tasks WHERE id = ?", (task_id,)
+    ).fetchone()
+    if task is not None:
+        if len(_task_cache) >= TASK_CACHE_SIZE:
+            del _task_cache[next(iter(_task_cache))] # Oldest entry first
+        _task_cache[task_id] = task
+    return task
+
+def get_upcoming_reminders(after=None, limit=500):
+    """
+    Returns up to `limit` (id, title, remind_at) rows for pending tasks,
+    earliest first. `after` is the (remind_at, id) of the last row already
+    seen; pass (now, 0) for "the next N reminders from now".
+    """
+    if after is None:
+        return get_connection().execute(
+            f"SELECT id, title, remind_at FROM tasks WHERE {_PENDING_REMINDER} "
+            "ORDER BY remind_at, id LIMIT ?", (limit,)
+        ).fetchall()
+    return get_connection().execute(
+        f"SELECT id, title, remind_at FROM tasks WHERE {_PENDING_REMINDER} "
+        "AND (remind_at, id) > (?, ?) ORDER BY remind_at, id LIMIT ?", (*after, limit)
+    ).fetchall()
+
+def get_due_tasks(before):
+    """Returns (id, title, remind_at) for pending tasks due at or before `before` (epoch seconds)."""
+    return get_connection().execute(
+        f"SELECT id, title, remind_at FROM tasks WHERE {_PENDING_REMINDER} AND remind_at <= ? ORDER BY remind_at, id",
+        (before,)
+    ).fetchall()
+
+def get_pending_reminder(task_id):
+    """Returns (id, title, remind_at) if the task has a pending reminder, else None."""
+    return get_connection().execute(
+        f"SELECT id, title, remind_at FROM tasks WHERE id=? AND {_PENDING_REMINDER}", (task_id,)
+    ).fetchone()
 
 def update_task(task_id, title, description, reminder_date, reminder_time):
     """Updates an existing task."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE tasks SET title=?, description=?, reminder_date=?, reminder_time=? WHERE id=?",
-        (title, description, reminder_date, reminder_time, task_id)
-    )
-    conn.commit()
-    conn.close()
+    with transaction() as cursor:
+        cursor.execute(
+            "UPDATE tasks SET title=?, description=?, reminder_date=?, reminder_time=?, remind_at=? WHERE id=?",
+            (title, description, reminder_date, reminder_time, reminder_epoch(reminder_date, reminder_time), task_id)
+        )
+    _task_cache.pop(task_id, None)
+    changes.notify(ROW_UPDATED, task_id)
 
 def update_task_status(task_id, done):
     """Updates the 'done' status of a task."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("UPDATE tasks SET done=? WHERE id=?", (done, task_id))
-    conn.commit()
-    conn.close()
+    with transaction() as cursor:
+        cursor.execute("UPDATE tasks SET done=? WHERE id=?", (done, task_id))
+    _task_cache.pop(task_id, None)
+    changes.notify(TASK_STATUS_CHANGED, task_id)
 
 def delete_task(task_id):
     """Deletes a task from the database."""
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    with transaction() as cursor:
+        cursor.execute("DELETE FROM tasks WHERE id=?", (task_id,))
+    _task_cache.pop(task_id, None)
+    changes.notify(ROW_DELETED, task_id)
+
+# --- Filtering and sorting ---
+
+def _task_filter(query):
+    """Returns the WHERE clause (or None for every task) and its parameters for query."""
+    clauses, params = [], []
+    if query.status not in TASK_STATUSES:
+        raise ValueError(f"unknown task status {query.status!r}")
+    # Orders other than by id read their own index, which carries done; the
+    # unary + keeps the planner from using idx_tasks_status and sorting every match
+    done = "done" if query.sort in ('newest', 'oldest') else "+done"
+    if query.status != 'all':
+        clauses.append(f"{done} = ?")
+        params.append(1 if query.status == 'done' else 0)
+    if query.due_from is not None or query.due_to is not None:
+        clauses.append("reminder_date IS NOT NULL")
+        if query.due_from is not None:
+            clauses.append(f"{_DUE_DATE} >= ?")
+            params.append(query.due_from)
+        if query.due_to is not None:
+            clauses.append(f"{_DUE_DATE} <= ?")
+            params.append(query.due_to)
+    if query.overdue:
+        # Same local 'yyyy-MM-dd'/'HH:mm' form as the stored reminder
+        now = datetime.now()
+        # The plain date bound gives the planner an idx_tasks_due range to scan
+        today = now.strftime("%Y-%m-%d")
+        clauses.append(f"{done} = 0 AND {_DUE_DATE} <= ? AND ({_DUE_DATE}, {_DUE_TIME}) < (?, ?)")
+        params += [today, today, now.strftime("%H:%M")]
+    match = fts_query(query.text or '')
+    if match is not None:
+        clauses.append("id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)")
+        params.append(match)
+    return (" AND ".join(clauses) if clauses else None), params
+
+def task_sort_key(task, sort):
+    """
+    The sort key of a task row under `sort`, in ascending list order except
+    for 'newest'. Pass the key of the last row shown as query_tasks(after=...)
+    to get the next page.
+    """
+    task_id, title, _, _, reminder_date, reminder_time = task
+    if sort == 'due':
+        return (reminder_date or '9999-12-31', reminder_time or '99:99', task_id)
+    if sort == 'title':
+        return (title.translate(_ASCII_FOLD), task_id)
+    return (task_id,)
+
+def query_tasks(query=TaskQuery(), after=None, offset=0, limit=TASKS_PAGE_SIZE):
+    """
+    Returns up to `limit` task rows (same columns as get_all_tasks) that
+    match query, in query.sort order. Pages either by keyset, with `after`
+    as the task_sort_key() of the last row already shown, or by `offset`.
+    Keyset pages cost the same however deep they are.
+    """
+    if query.sort not in TASK_SORTS:
+        raise ValueError(f"unknown task sort {query.sort!r}")
+    columns, descending = TASK_SORTS[query.sort]
+    where, params = _task_filter(query)
+    clauses = [where] if where else []
+    if after is not None:
+        # SQLite won't range-scan an index on a row value over expressions or
+        # collated columns, so the leading column is also bounded on its own
+        clauses.append(f"{columns[0]} {'<=' if descending else '>='} ? AND "
+                       f"({', '.join(columns)}) {'<' if descending else '>'} ({', '.join('?' * len(columns))})")
+        params += [after[0], *after]
+    direction = " DESC" if descending else ""
+    sql = "SELECT id, title, description, done, reminder_date, reminder_time FROM tasks"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += f" ORDER BY {', '.join(column + direction for column in columns)} LIMIT ? OFFSET ?"
+    return get_connection().execute(sql, (*params, limit, offset)).fetchall()
+
+def task_matches(task_id, query):
+    """Checks whether a single task would appear in the results for query."""
+    where, params = _task_filter(query)
+    if where is None:
+        return True
+    return get_connection().execute(
+        f"SELECT 1 FROM tasks WHERE id = ? AND {where}", (task_id, *params)
+    ).fetchone() is not None
+
+# --- Bulk import/export ---
+
+def _import_field(number, task, field, fmt, label):
+    """Returns task[field] normalized to fmt, None if empty; ValueError if it doesn't parse."""
+    value = task.get(field) or None
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(str(value).strip(), fmt).strftime(fmt)
+    except ValueError:
+        raise ValueError(f"task {number}: {field} {value!r} is not a valid {label}") from None
+
+def _import_values(number, task, reminders):
+    """Turns one imported task mapping into add_task's INSERT values."""
+    if not isinstance(task, Mapping):
+        raise ValueError(f"task {number}: expected an object with task fields, got {type(task).__name__}")
+    title = str(task.get('title') or '').strip()
+    if not title:
+        raise ValueError(f"task {number}: title cannot be empty")
+    done = 1 if str(task.get('done') or '').strip().lower() in ('1', 'true', 'yes', 'done') else 0
+    # Parsing dominates an import, and backlogs repeat the same dates and times
+    key = (str(task.get('reminder_date') or ''), str(task.get('reminder_time') or ''))
+    if key not in reminders:
+        reminder_date = _import_field(number, task, 'reminder_date', "%Y-%m-%d", "date (yyyy-MM-dd)")
+        reminder_time = _import_field(number, task, 'reminder_time', "%H:%M", "time (HH:mm)")
+        if len(reminders) >= IMPORT_CHUNK_SIZE:
+            reminders.clear() # Keeps memory flat when every task has its own time
+        reminders[key] = (reminder_date, reminder_time, reminder_epoch(reminder_date, reminder_time))
+    return (title, task.get('description') or '', done, *reminders[key])
+
+def import_tasks(tasks, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """
+    Adds every task from `tasks`, an iterable of mappings with the keys
+    title, description, done, reminder_date and reminder_time (others,
+    like an exported id, are ignored). The iterable is consumed lazily and
+    written with executemany in transactions of chunk_size rows, so memory
+    stays flat however many tasks there are. progress(rows_done) is called
+    after each chunk commits.
+
+    Dates and times are normalized to yyyy-MM-dd and HH:mm. Raises
+    ValueError for an item that isn't a mapping, a task without a title or
+    a date or time that doesn't parse; chunks already committed stay.
+    Listeners get one ROWS_RESET instead of an event per task.
+    Returns the number of tasks added.
+    """
+    reminders = {}
+    values = (_import_values(number, task, reminders) for number, task in enumerate(tasks, 1))
+    imported = 0
+    try:
+        while True:
+            chunk = list(islice(values, chunk_size))
+            if not chunk:
+                break
+            with transaction() as cursor:
+                # Staged, then copied in one statement: FTS5 flushes its pending
+                # index data at every statement, so one INSERT per row through the
+                # tasks_fts trigger would write a tiny index segment per task
+                cursor.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS tasks_import "
+                    "(title, description, done, reminder_date, reminder_time, remind_at)"
+                )
+                cursor.executemany("INSERT INTO tasks_import VALUES (?, ?, ?, ?, ?, ?)", chunk)
+                cursor.execute(
+                    "INSERT INTO tasks (title, description, done, reminder_date, reminder_time, remind_at) "
+                    "SELECT * FROM tasks_import ORDER BY rowid"
+                )
+                cursor.execute("DELETE FROM tasks_import")
+            imported += len(chunk)
+            if progress is not None:
+                progress(imported)
+    finally:
+        if imported:
+            changes.notify(ROWS_RESET, None)
+    return imported
+
+def read_tasks(stream, fmt):
+    """
+    Yields task mappings from a CSV (with a header row) or JSON Lines text
+    stream. Raises ValueError, with the line number, for malformed input.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        try:
+            yield from reader
+        except csv.Error as e:
+            # line_num hasn't counted the line being parsed yet
+            raise ValueError(f"line {reader.line_num + 1}: {e}") from None
+    elif fmt == 'jsonl':
+        for number, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    task = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"line {number}: {e}") from None
+                yield task
+    else:
+        raise ValueError(f"unknown task format {fmt!r} (expected one of {', '.join(EXPORT_FORMATS)})")
+
+def export_tasks(stream, fmt, batch_size=EXPORT_BATCH_SIZE):
+    """
+    Writes every task, oldest first, to a text stream as CSV (with a header
+    row) or JSON Lines. Rows are read batch_size at a time with fetchmany(),
+    so memory stays flat however many tasks there are. Returns the number
+    of tasks written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown task format {fmt!r} (expected one of {', '.join(EXPORT_FORMATS)})")
+    cursor = get_connection().execute(f"SELECT {', '.join(EXPORT_COLUMNS)} FROM tasks ORDER BY id")
+    writer = None
+    if fmt == 'csv':
+        writer = csv.writer(stream)
+        writer.writerow(EXPORT_COLUMNS)
+    exported = 0
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            if writer is not None:
+                writer.writerows(rows)
+            else:
+                stream.writelines(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + '\n' for row in rows)
+            exported += len(rows)
+    finally:
+        cursor.close()
+    return exported
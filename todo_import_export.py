@@ -0,0 +1,89 @@
+# todo_import_export.py
+"""
+Imports tasks into, or exports them from, the To-Do list without starting
+the GUI.
+
+    python todo_import_export.py import backlog.csv          # format from the extension
+    python todo_import_export.py import - --format jsonl < tasks.jsonl
+    python todo_import_export.py export tasks.jsonl --db app_data.db
+
+CSV files have a header row; JSON Lines files hold one object per line.
+Both use the fields id, title, description, done, reminder_date
+(yyyy-MM-dd) and reminder_time (HH:mm); ids are ignored on import.
+Rows are streamed in fixed-size chunks, so memory stays flat for any file
+size. Prints the row count and rows per second.
+"""
+import argparse
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+import database_connection
+import database_init
+from todo_database_funcs import EXPORT_FORMATS, export_tasks, import_tasks, read_tasks
+
+
+def guess_format(path):
+    """Picks the format from a file extension ('.jsonl'/'.ndjson' or '.csv')."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    if extension == '.csv':
+        return 'csv'
+    return None
+
+
+def open_text(path, mode):
+    """Opens path for streaming text I/O; '-' is stdin/stdout."""
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    # newline='' lets the csv module handle line endings itself
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import or export To-Do tasks as CSV or JSON Lines.")
+    parser.add_argument('action', choices=('import', 'export'))
+    parser.add_argument('path', help="file to read or write ('-' for stdin/stdout)")
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default=None,
+                        help="file format (default: from the file extension)")
+    parser.add_argument('--db', default=database_connection.DB_NAME,
+                        help=f"database file (default: {database_connection.DB_NAME})")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or guess_format(args.path)
+    if fmt is None:
+        parser.error("can't tell the format from the file name; pass --format")
+
+    database_connection.DB_NAME = args.db
+    with redirect_stdout(sys.stderr): # Migration messages must not end up in an export to stdout
+        database_init.initialize_all_databases()
+
+    # Progress goes to stderr so an export to stdout stays clean
+    started = time.perf_counter()
+    stream = None
+    try:
+        stream = open_text(args.path, 'r' if args.action == 'import' else 'w')
+        if args.action == 'import':
+            count = import_tasks(read_tasks(stream, fmt),
+                                 progress=lambda done: print(f"  {done} rows...", file=sys.stderr))
+        else:
+            count = export_tasks(stream, fmt)
+    except (ValueError, OSError) as e:
+        print(f"{args.action.capitalize()} failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if stream not in (None, sys.stdin, sys.stdout):
+            stream.close()
+        database_connection.close_all()
+    elapsed = time.perf_counter() - started
+
+    rate = count / elapsed if elapsed > 0 else 0.0
+    verb = "Imported" if args.action == 'import' else "Exported"
+    print(f"{verb} {count} tasks in {elapsed:.2f} s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
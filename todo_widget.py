@@ -1,12 +1,297 @@
 # todo_widget.py
+from bisect import bisect_left
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QTextEdit, QPushButton, QListWidget, QListWidgetItem,
-    QCheckBox, QLabel, QMessageBox, QDateEdit, QComboBox  # --- IMPORT UPDATED ---
+    QLineEdit, QTextEdit, QPushButton, QTableView, QHeaderView, QAbstractItemView,
+    QStyledItemDelegate, QStyle, QStyleOptionButton, QStyleOptionViewItem, QApplication,
+    QLabel, QMessageBox, QDateEdit, QComboBox  # --- IMPORT UPDATED ---
 )
-from PyQt6.QtCore import Qt, QDate, QTimer, QDateTime  # --- IMPORT UPDATED ---
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import (
+    Qt, QDate, QEvent, QRect, QSize, QTimer,  # --- IMPORT UPDATED ---
+    QAbstractListModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QFontMetrics, QColor
 import todo_database_funcs 
+from todo_database_funcs import (
+    query_tasks, task_sort_key, TaskQuery, TASK_SORTS, TASK_STATUSES, TASKS_PAGE_SIZE
+)
+from database_connection import ROW_DELETED, ROWS_RESET
+
+# Wait this long after the last keystroke before searching
+SEARCH_DEBOUNCE_MS = 200
+
+# (label, value) choices in the filter bar; 'today' and 'overdue' are due-date filters
+SHOW_OPTIONS = (
+    ("All tasks", 'all'), ("Pending", 'pending'), ("Completed", 'done'),
+    ("Due today", 'today'), ("Overdue", 'overdue'),
+)
+SORT_OPTIONS = (("Newest first", 'newest'), ("Oldest first", 'oldest'), ("Due date", 'due'), ("Title", 'title'))
+
+# --- Task List Model/View ---
+
+ROW_PADDING = 5
+LINE_SPACING = 3
+CHECK_SPACING = 6
+DUE_MARGIN = 10
+DESC_INDENT = 28
+PREVIEW_CHARS = 80
+
+# Custom data roles exposed by TaskListModel
+TaskIdRole = Qt.ItemDataRole.UserRole + 1
+TaskTitleRole = Qt.ItemDataRole.UserRole + 2
+TaskDoneRole = Qt.ItemDataRole.UserRole + 3
+TaskDueRole = Qt.ItemDataRole.UserRole + 4
+TaskPreviewRole = Qt.ItemDataRole.UserRole + 5
+
+def description_preview(description):
+    """First line of a description, cut at PREVIEW_CHARS, with '...' if anything was left out."""
+    if not description:
+        return ""
+    first_line = description.split('\n', 1)[0]
+    if len(first_line) > PREVIEW_CHARS:
+        return first_line[:PREVIEW_CHARS] + '...'
+    if len(description) > len(first_line):
+        return first_line + '...'
+    return first_line
+
+class TaskListModel(QAbstractListModel):
+    """
+    Holds the (id, title, description, done, reminder_date, reminder_time)
+    rows matching a TaskQuery, in its sort order. Rows arrive one page at a
+    time: the view calls fetchMore() as it scrolls near the end of what is
+    loaded. Previews and due labels are only built for rows being painted.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+        self._by_id = {} # task_id -> row tuple, to find a row's sort key
+        self._query = TaskQuery()
+        self._has_more = False
+
+    @property
+    def query(self):
+        return self._query
+
+    def _order_key(self, task):
+        """Sort key that ascends down the list ('newest' is the one descending order)."""
+        if TASK_SORTS[self._query.sort][1]:
+            return (-task[0],)
+        return task_sort_key(task, self._query.sort)
+
+    def set_tasks(self, first_page, query=TaskQuery()):
+        """Replaces every row with the first page of results for query."""
+        self.beginResetModel()
+        self._tasks = list(first_page)
+        self._by_id = {task[0]: task for task in self._tasks}
+        self._query = query
+        self._has_more = len(self._tasks) >= TASKS_PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent):
+        if parent.isValid() or not self._has_more:
+            return
+        after = task_sort_key(self._tasks[-1], self._query.sort) if self._tasks else None
+        page = query_tasks(self._query, after=after)
+        self._has_more = len(page) >= TASKS_PAGE_SIZE
+        if page:
+            first = len(self._tasks)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._tasks.extend(page)
+            self._by_id.update((task[0], task) for task in page)
+            self.endInsertRows()
+
+    def find_task(self, task_id):
+        """Returns the row of task_id, or -1. Rows are in sort order, so this is a bisect."""
+        task = self._by_id.get(task_id)
+        if task is None:
+            return -1
+        return bisect_left(self._tasks, self._order_key(task), key=self._order_key)
+
+    def upsert_task(self, task):
+        """Updates the row for task in place, or (re)inserts it where it belongs."""
+        pos = self.find_task(task[0])
+        if pos != -1:
+            if self._order_key(task) == self._order_key(self._tasks[pos]):
+                self._tasks[pos] = task
+                self._by_id[task[0]] = task
+                index = self.index(pos)
+                self.dataChanged.emit(index, index)
+                return
+            self.remove_task(task[0]) # Its sort key changed, so it moves
+        pos = bisect_left(self._tasks, self._order_key(task), key=self._order_key)
+        if pos == len(self._tasks) and self._has_more:
+            return # Sorts after everything loaded; a later page will bring it
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._tasks.insert(pos, task)
+        self._by_id[task[0]] = task
+        self.endInsertRows()
+
+    def remove_task(self, task_id):
+        pos = self.find_task(task_id)
+        if pos == -1:
+            return
+        self.beginRemoveRows(QModelIndex(), pos, pos)
+        del self._tasks[pos]
+        del self._by_id[task_id]
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._tasks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        task_id, title, description, done, reminder_date, reminder_time = self._tasks[index.row()]
+        if role in (TaskTitleRole, Qt.ItemDataRole.DisplayRole):
+            return title
+        if role == TaskIdRole:
+            return task_id
+        if role == TaskDoneRole:
+            return bool(done)
+        if role == TaskDueRole:
+            return f"Due: {reminder_date} {reminder_time}" if reminder_date and reminder_time else ""
+        if role == TaskPreviewRole:
+            return description_preview(description)
+        return None
+
+class TaskListView(QTableView):
+    """
+    A one-column table with no headers or grid, used as a list. QListView
+    lays out every loaded row again whenever one row changes, is inserted
+    or is removed; a table with fixed-height rows only shifts its header
+    sections, so single-row updates stay cheap with 100k rows loaded.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.setTabKeyNavigation(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
+    def fit_rows_to_delegate(self):
+        """Sets the fixed row height from the item delegate's size hint."""
+        option = QStyleOptionViewItem()
+        self.initViewItemOption(option)
+        self.verticalHeader().setDefaultSectionSize(self.itemDelegate().sizeHint(option, QModelIndex()).height())
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """
+    Paints a task row (checkbox, title, due label and description preview)
+    directly, with no per-task widgets. Clicking the checkbox, or pressing
+    Space on the current row, emits status_toggled instead of selecting.
+    """
+    # task_id, new done state
+    status_toggled = pyqtSignal(int, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Index 0 is the normal font, index 1 the struck-out one for done tasks
+        self.title_fonts = self._font_pair(point_size=14, bold=True)
+        self.due_fonts = self._font_pair(point_size=10)
+        self.desc_fonts = self._font_pair(italic=True)
+        self.title_metrics = QFontMetrics(self.title_fonts[0])
+        self.due_metrics = QFontMetrics(self.due_fonts[0])
+        self.desc_metrics = QFontMetrics(self.desc_fonts[0])
+
+    @staticmethod
+    def _font_pair(point_size=None, bold=False, italic=False):
+        font = QFont()
+        if point_size is not None:
+            font.setPointSize(point_size)
+        font.setBold(bold)
+        font.setItalic(italic)
+        struck = QFont(font)
+        struck.setStrikeOut(True)
+        return font, struck
+
+    @staticmethod
+    def _style(option):
+        return option.widget.style() if option.widget is not None else QApplication.style()
+
+    def _title_height(self, option):
+        indicator = self._style(option).pixelMetric(QStyle.PixelMetric.PM_IndicatorHeight, option, option.widget)
+        return max(self.title_metrics.height(), indicator)
+
+    def check_rect(self, option):
+        """Where the checkbox is drawn (and clicked) within the row."""
+        style = self._style(option)
+        width = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorWidth, option, option.widget)
+        height = style.pixelMetric(QStyle.PixelMetric.PM_IndicatorHeight, option, option.widget)
+        top = option.rect.top() + ROW_PADDING + (self._title_height(option) - height) // 2
+        return QRect(option.rect.left() + ROW_PADDING, top, width, height)
+
+    def sizeHint(self, option, index):
+        # Every row reserves a preview line, so all rows have the same height
+        height = ROW_PADDING + self._title_height(option) + LINE_SPACING + self.desc_metrics.height() + ROW_PADDING
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, QColor("#cce5ff"))
+        done = index.data(TaskDoneRole)
+        struck = int(bool(done))
+
+        check = QStyleOptionButton()
+        check.rect = self.check_rect(option)
+        check.state = QStyle.StateFlag.State_Enabled | (QStyle.StateFlag.State_On if done else QStyle.StateFlag.State_Off)
+        self._style(option).drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorCheckBox, check, painter, option.widget)
+
+        content = option.rect.adjusted(ROW_PADDING, ROW_PADDING, -ROW_PADDING, -ROW_PADDING)
+        line = QRect(content.left(), content.top(), content.width(), self._title_height(option))
+        middle = Qt.AlignmentFlag.AlignVCenter.value
+        title_right = line.right()
+
+        due = index.data(TaskDueRole)
+        if due:
+            due_width = self.due_metrics.horizontalAdvance(due)
+            due_rect = QRect(line.right() - due_width + 1, line.top(), due_width, line.height())
+            painter.setFont(self.due_fonts[struck])
+            painter.setPen(QColor("#666666"))
+            painter.drawText(due_rect, middle | Qt.AlignmentFlag.AlignRight.value, due)
+            title_right = due_rect.left() - DUE_MARGIN
+
+        title_left = check.rect.right() + 1 + CHECK_SPACING
+        title_rect = QRect(title_left, line.top(), max(0, title_right - title_left), line.height())
+        title = self.title_metrics.elidedText(index.data(TaskTitleRole), Qt.TextElideMode.ElideRight, title_rect.width())
+        painter.setFont(self.title_fonts[struck])
+        painter.setPen(QColor("#000000"))
+        painter.drawText(title_rect, middle | Qt.AlignmentFlag.AlignLeft.value, title)
+
+        preview = index.data(TaskPreviewRole)
+        if preview:
+            desc_rect = QRect(content.left() + DESC_INDENT, line.bottom() + 1 + LINE_SPACING,
+                              content.width() - DESC_INDENT, self.desc_metrics.height())
+            preview = self.desc_metrics.elidedText(preview, Qt.TextElideMode.ElideRight, desc_rect.width())
+            painter.setFont(self.desc_fonts[struck])
+            painter.setPen(QColor("#555555"))
+            painter.drawText(desc_rect, middle | Qt.AlignmentFlag.AlignLeft.value, preview)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        kind = event.type()
+        if kind in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick, QEvent.Type.MouseButtonRelease):
+            if event.button() != Qt.MouseButton.LeftButton or not self.check_rect(option).contains(event.position().toPoint()):
+                return False
+            if kind == QEvent.Type.MouseButtonRelease:
+                self.status_toggled.emit(index.data(TaskIdRole), not index.data(TaskDoneRole))
+            return True # Clicks on the checkbox never select the row
+        if kind == QEvent.Type.KeyPress and event.key() in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+            self.status_toggled.emit(index.data(TaskIdRole), not index.data(TaskDoneRole))
+            return True
+        return False
 
 class ToDoWidget(QWidget): 
     def __init__(self):
@@ -42,17 +327,13 @@ class ToDoWidget(QWidget):
                 selection-background-color: #0078d7;
             }
             
-            ToDoWidget QListWidget {
+            /* Selected rows are highlighted by TaskItemDelegate */
+            ToDoWidget QTableView#TaskListView {
                 background-color: #ffffff;
                 border: 1px solid #cccccc;
                 border-radius: 5px;
             }
             
-            ToDoWidget QListWidget::item:selected {
-                background-color: #cce5ff;
-                color: #000000;
-            }
-            
             ToDoWidget QPushButton {
                 background-color: #0078d7;
                 color: white;
@@ -139,22 +420,53 @@ class ToDoWidget(QWidget):
         button_layout.addWidget(self.delete_button)
         self.layout.addLayout(button_layout)
         
-        self.task_list_widget = QListWidget()
-        self.layout.addWidget(self.task_list_widget)
+        # Filter bar: search text, which tasks to show, and their order
+        filter_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search tasks...")
+        filter_layout.addWidget(self.search_input, 1)
+        self.show_combo = QComboBox()
+        for label, value in SHOW_OPTIONS:
+            self.show_combo.addItem(label, value)
+        filter_layout.addWidget(self.show_combo)
+        self.sort_combo = QComboBox()
+        for label, value in SORT_OPTIONS:
+            self.sort_combo.addItem(label, value)
+        filter_layout.addWidget(self.sort_combo)
+        self.layout.addLayout(filter_layout)
+        
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.load_tasks)
+        self.search_input.textChanged.connect(self.search_timer.start) # Restarts the debounce window
+        self.show_combo.currentIndexChanged.connect(self.load_tasks)
+        self.sort_combo.currentIndexChanged.connect(self.load_tasks)
+        
+        # Virtualized list: only the visible rows are painted
+        self.task_model = TaskListModel(self)
+        self.task_delegate = TaskItemDelegate(self)
+        self.task_list_view = TaskListView()
+        self.task_list_view.setObjectName("TaskListView")
+        self.task_list_view.setModel(self.task_model)
+        self.task_list_view.setItemDelegate(self.task_delegate)
+        self.layout.addWidget(self.task_list_view)
+        self.task_list_view.fit_rows_to_delegate()
         
         self.add_button.clicked.connect(self.add_task)
         self.edit_button.clicked.connect(self.edit_task)
         self.delete_button.clicked.connect(self.delete_task)
-        self.task_list_widget.itemClicked.connect(self.populate_fields)
+        self.task_list_view.clicked.connect(self.populate_fields)
+        self.task_delegate.status_toggled.connect(self.toggle_task_status)
         
-        self.triggered_reminders_this_session = set()
-
-        self.reminder_timer = QTimer(self)
-        self.reminder_timer.timeout.connect(self.check_reminders)
-        self.reminder_timer.start(10000)
+        # Reminders are a background service owned by AppHubWindow (see ReminderScheduler)
 
         self.load_tasks()
 
+        # Patch single rows when tasks change instead of reloading the list
+        todo_database_funcs.changes.subscribe(self.on_task_changed)
+        self.destroyed.connect(partial(todo_database_funcs.changes.unsubscribe, self.on_task_changed))
+
     # --- NEW METHOD ADDED ---
     def generate_time_list(self):
         """Generates a list of times in 30-min intervals."""
@@ -164,91 +476,38 @@ class ToDoWidget(QWidget):
             times.append(f"{h:02d}:30")
         return times
 
-    def check_reminders(self):
-        tasks = todo_database_funcs.get_all_tasks() 
-        current_dt = QDateTime.currentDateTime()
-
-        for task in tasks:
-            task_id, title, _, done, reminder_date, reminder_time = task
-            
-            # This logic remains valid, as a "None" time will fail this check
-            if done or not reminder_date or not reminder_time:
-                continue
-            if task_id in self.triggered_reminders_this_session:
-                continue
-
-            reminder_dt_str = f"{reminder_date} {reminder_time}"
-            reminder_dt = QDateTime.fromString(reminder_dt_str, "yyyy-MM-dd HH:mm")
-
-            if current_dt >= reminder_dt:
-                QMessageBox.information(self, "🔔 Task Reminder", f"Your task is due!\n\nTask: {title}")
-                self.triggered_reminders_this_session.add(task_id)
+    def current_query(self):
+        """The TaskQuery for the filter bar's current settings."""
+        show = self.show_combo.currentData()
+        today = QDate.currentDate().toString("yyyy-MM-dd") if show == 'today' else None
+        return TaskQuery(
+            status=show if show in TASK_STATUSES else 'all',
+            due_from=today,
+            due_to=today,
+            overdue=(show == 'overdue'),
+            text=self.search_input.text(),
+            sort=self.sort_combo.currentData(),
+        )
 
     def load_tasks(self):
-        self.task_list_widget.clear()
-        tasks = todo_database_funcs.get_all_tasks()
-        
-        for task in tasks:
-            task_id, title, description, done, reminder_date, reminder_time = task
-            
-            item_widget = QWidget()
-            item_layout = QVBoxLayout(item_widget)
-            item_layout.setContentsMargins(5, 5, 5, 5)
-            item_layout.setSpacing(3) 
-
-            top_layout = QHBoxLayout()
-            checkbox = QCheckBox()
-            checkbox.setChecked(bool(done))
-            checkbox.stateChanged.connect(lambda state, t_id=task_id: self.toggle_task_status(state, t_id))
-
-            title_label = QLabel(title)
-            title_font = QFont()
-            title_font.setStrikeOut(bool(done))
-            title_font.setBold(True)
-            title_font.setPointSize(14)
-            title_label.setFont(title_font)
-
-            top_layout.addWidget(checkbox)
-            top_layout.addWidget(title_label)
-            top_layout.addStretch()
-            
-            if reminder_date and reminder_time:
-                reminder_str = f"Due: {reminder_date} {reminder_time}"
-                reminder_label = QLabel(reminder_str)
-                reminder_font = QFont()
-                reminder_font.setStrikeOut(bool(done))
-                reminder_font.setPointSize(10)
-                reminder_label.setFont(reminder_font)
-                reminder_label.setStyleSheet("color: #666666; margin-left: 10px;")
-                top_layout.addWidget(reminder_label)
-            
-            item_layout.addLayout(top_layout) 
-
-            if description:
-                first_line = description.split('\n')[0]
-                
-                if len(first_line) > 80:
-                    desc_preview = first_line[:80] + '...'
-                elif len(description) > len(first_line): 
-                    desc_preview = first_line + '...'
-                else: 
-                    desc_preview = first_line
-
-                desc_label = QLabel(desc_preview)
-                desc_font = QFont()
-                desc_font.setItalic(True)
-                desc_font.setStrikeOut(bool(done))
-                desc_label.setFont(desc_font)
-                desc_label.setStyleSheet("color: #555555; padding-left: 28px;") 
-                
-                item_layout.addWidget(desc_label)
+        """Shows the first page of matching tasks; later pages load as the user scrolls."""
+        self.search_timer.stop()
+        query = self.current_query()
+        self.task_model.set_tasks(query_tasks(query), query)
 
-            list_item = QListWidgetItem()
-            list_item.setData(Qt.ItemDataRole.UserRole, task_id)
-            list_item.setSizeHint(item_widget.sizeHint())
-            
-            self.task_list_widget.addItem(list_item)
-            self.task_list_widget.setItemWidget(list_item, item_widget)
+    def on_task_changed(self, event, task_id):
+        """Applies one add/update/toggle/delete from the data layer to the list."""
+        if event == ROWS_RESET:
+            self.load_tasks() # Bulk import
+            return
+        if event == ROW_DELETED:
+            self.task_model.remove_task(task_id)
+            return
+        task = todo_database_funcs.get_task(task_id)
+        if task is None or not todo_database_funcs.task_matches(task_id, self.task_model.query):
+            self.task_model.remove_task(task_id)
+        else:
+            self.task_model.upsert_task(task)
 
     # --- METHOD UPDATED ---
     def add_task(self):
@@ -265,18 +524,18 @@ class ToDoWidget(QWidget):
             QMessageBox.warning(self, "Input Error", "Task title cannot be empty.")
             return
 
+        # The list is updated through on_task_changed once the write commits
         todo_database_funcs.add_task(title, description, reminder_date, reminder_time) 
         self.clear_fields()
-        self.load_tasks()
 
     # --- METHOD UPDATED ---
     def edit_task(self):
-        selected_item = self.task_list_widget.currentItem()
-        if not selected_item:
+        selected_index = self.task_list_view.currentIndex()
+        if not selected_index.isValid():
             QMessageBox.warning(self, "Selection Error", "Please select a task to edit.")
             return
 
-        task_id = selected_item.data(Qt.ItemDataRole.UserRole)
+        task_id = selected_index.data(TaskIdRole)
         new_title = self.title_input.text().strip()
         new_description = self.desc_input.toPlainText().strip()
         new_date = self.date_input.date().toString("yyyy-MM-dd")
@@ -292,14 +551,11 @@ class ToDoWidget(QWidget):
         
         todo_database_funcs.update_task(task_id, new_title, new_description, new_date, new_time)
         
-        self.triggered_reminders_this_session.discard(task_id)
-        
         self.clear_fields()
-        self.load_tasks()
 
     def delete_task(self):
-        selected_item = self.task_list_widget.currentItem()
-        if not selected_item:
+        selected_index = self.task_list_view.currentIndex()
+        if not selected_index.isValid():
             QMessageBox.warning(self, "Selection Error", "Please select a task to delete.")
             return
             
@@ -307,17 +563,13 @@ class ToDoWidget(QWidget):
                                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         
         if confirm == QMessageBox.StandardButton.Yes:
-            task_id = selected_item.data(Qt.ItemDataRole.UserRole)
+            task_id = selected_index.data(TaskIdRole)
             todo_database_funcs.delete_task(task_id)
-            self.triggered_reminders_this_session.discard(task_id)
             self.clear_fields()
-            self.load_tasks()
 
     # --- METHOD UPDATED ---
-    def populate_fields(self, item):
-        task_id = item.data(Qt.ItemDataRole.UserRole)
-        tasks = todo_database_funcs.get_all_tasks() 
-        task_data = next((t for t in tasks if t[0] == task_id), None)
+    def populate_fields(self, index):
+        task_data = todo_database_funcs.get_task(index.data(TaskIdRole))
 
         if task_data:
             _, title, description, _, reminder_date, reminder_time = task_data
@@ -341,10 +593,8 @@ class ToDoWidget(QWidget):
             else:
                 self.time_input.setCurrentIndex(0) # Set to "--:--"
 
-    def toggle_task_status(self, state, task_id):
-        done = 1 if state == Qt.CheckState.Checked.value else 0
-        todo_database_funcs.update_task_status(task_id, done)
-        self.load_tasks()
+    def toggle_task_status(self, task_id, done):
+        todo_database_funcs.update_task_status(task_id, 1 if done else 0)
 
     # --- METHOD UPDATED ---
     def clear_fields(self):